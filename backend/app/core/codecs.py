@@ -0,0 +1,232 @@
+import datetime
+import decimal
+import enum
+import json
+import logging
+import uuid
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+try:
+    import msgpack
+except ImportError:  # optional: everything falls back to JSON
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+MSGPACK_MEDIA_TYPE = MSGPACK_MEDIA_TYPES[0]
+
+# WebSocket subprotocols, in order of preference
+MSGPACK_SUBPROTOCOL = "billo.msgpack.v1"
+JSON_SUBPROTOCOL = "billo.json.v1"
+
+# MessagePack extension type codes; datetimes use the standard Timestamp (-1)
+EXT_DECIMAL = 1
+
+# Set by MessagePackMiddleware for the request being handled
+_msgpack_requested: ContextVar[bool] = ContextVar("msgpack_requested", default=False)
+
+
+def msgpack_enabled() -> bool:
+    return msgpack is not None and settings.MSGPACK_ENABLED
+
+
+def _default(value: Any) -> Any:
+    """Typed encoding for values MessagePack has no native type for"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            # Naive datetimes in this API are UTC (datetime.utcnow())
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return msgpack.Timestamp.from_datetime(value)
+    if isinstance(value, decimal.Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(value).encode())
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DECIMAL:
+        return decimal.Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def pack(value: Any) -> bytes:
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_ext_hook, timestamp=3, raw=False)
+
+
+def encode_json(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def json_to_msgpack(text: str) -> bytes:
+    """Re-encode a JSON document, e.g. one that came over the backplane"""
+    return pack(json.loads(text))
+
+
+def _media_ranges(accept: str) -> List[Tuple[str, float]]:
+    ranges = []
+    for part in accept.split(","):
+        media_type, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type:
+            ranges.append((media_type.lower(), quality))
+    return ranges
+
+
+def prefers_msgpack(accept: Optional[str]) -> bool:
+    """True if the Accept header ranks MessagePack at least as high as JSON"""
+    if not accept or not msgpack_enabled():
+        return False
+    ranges = _media_ranges(accept)
+    msgpack_q = max((q for media_type, q in ranges if media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+    json_q = max((q for media_type, q in ranges if media_type in ("application/json", "application/*", "*/*")), default=0.0)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def select_subprotocol(offered: Iterable[str]) -> Optional[str]:
+    """Pick the WebSocket subprotocol to accept from the client's offer"""
+    offered = list(offered)
+    if MSGPACK_SUBPROTOCOL in offered and msgpack_enabled():
+        return MSGPACK_SUBPROTOCOL
+    if JSON_SUBPROTOCOL in offered:
+        return JSON_SUBPROTOCOL
+    return None
+
+
+def decode_frame(message: Dict[str, Any]) -> Any:
+    """Decode a received WebSocket message (text is JSON, binary is MessagePack)"""
+    if message.get("bytes") is not None:
+        if msgpack is None:
+            raise ValueError("Binary frames need MessagePack support")
+        return unpack(message["bytes"])
+    return json.loads(message.get("text") or "")
+
+
+def _with_vary_accept(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Add Accept to the response's Vary header, keeping what is already there"""
+    headers = list(headers)
+    for index, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            tokens = [token.strip().lower() for token in value.split(b",")]
+            if b"accept" not in tokens and b"*" not in tokens:
+                headers[index] = (name, value + b", Accept")
+            return headers
+    headers.append((b"vary", b"Accept"))
+    return headers
+
+
+class NegotiatedResponse(JSONResponse):
+    """
+    JSONResponse that renders MessagePack instead when the request asked
+    for it, so route results are packed once rather than dumped to JSON
+    and parsed again. Used as the app's default response class.
+
+    The content is what FastAPI hands every response class: the route's
+    return value after jsonable_encoder, so datetimes and Decimals are
+    already strings or floats here. The typed encoders only apply to
+    messages built on the worker, such as socket replays.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if _msgpack_requested.get():
+            try:
+                body = pack(content)
+                self.media_type = MSGPACK_MEDIA_TYPE
+                return body
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Could not encode response as MessagePack: {e}")
+        return super().render(content)
+
+
+class MessagePackMiddleware:
+    """
+    Negotiates MessagePack responses with the Accept header.
+
+    Routes using NegotiatedResponse pack their content directly. Any other
+    JSON response (error handlers, plain JSONResponse) is re-encoded here
+    for clients that prefer MessagePack. Every negotiable response gets
+    Accept added to its Vary header, whichever format was sent. Responses
+    that are already compressed or carry an ETag are left alone, so
+    snapshot bodies and their conditional requests keep working.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not msgpack_enabled():
+            await self.app(scope, receive, send)
+            return
+        accept = next((value.decode("latin-1") for name, value in scope["headers"] if name == b"accept"), None)
+        wants_msgpack = prefers_msgpack(accept)
+
+        start: Optional[Dict[str, Any]] = None
+        chunks: List[bytes] = []
+
+        async def negotiating_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = {name.lower(): value for name, value in message.get("headers", [])}
+                content_type = headers.get(b"content-type", b"")
+                if b"content-encoding" in headers or b"etag" in headers:
+                    await send(message)
+                    return
+                if content_type.startswith(b"application/json") and wants_msgpack:
+                    start = message
+                    return
+                if content_type.startswith((b"application/json", MSGPACK_MEDIA_TYPE.encode())):
+                    message = {**message, "headers": _with_vary_accept(message.get("headers", []))}
+                await send(message)
+            elif message["type"] == "http.response.body" and start is not None:
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                await self._send_transcoded(send, start, b"".join(chunks))
+            else:
+                await send(message)
+
+        token = _msgpack_requested.set(wants_msgpack)
+        try:
+            await self.app(scope, receive, negotiating_send)
+        finally:
+            _msgpack_requested.reset(token)
+
+    @staticmethod
+    async def _send_transcoded(send, start: Dict[str, Any], body: bytes):
+        headers = [
+            (name, value) for name, value in start.get("headers", [])
+            if name.lower() not in (b"content-type", b"content-length")
+        ]
+        if body:
+            try:
+                body = json_to_msgpack(body.decode())
+                headers.append((b"content-type", MSGPACK_MEDIA_TYPE.encode()))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Could not re-encode response as MessagePack: {e}")
+                headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({**start, "headers": _with_vary_accept(headers)})
+        await send({"type": "http.response.body", "body": body, "more_body": False})
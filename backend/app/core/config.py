@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl
 
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    JWT_AUDIENCE: Optional[str] = os.getenv("JWT_AUDIENCE")  # Supabase tokens use "authenticated"
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "")
@@ -33,14 +34,45 @@ class Settings(BaseSettings):
     # API Settings
     API_V1_STR: str = "/api/v1"
     
+    # Database
+    DB_THREAD_POOL_SIZE: int = int(os.getenv("DB_THREAD_POOL_SIZE", "16"))
+    
+    # Real-time broadcast between workers ("memory" or "redis")
+    BROADCAST_BACKEND: str = os.getenv("BROADCAST_BACKEND", "memory")
+    BROADCAST_URL: str = os.getenv("BROADCAST_URL", "redis://localhost:6379/0")
+    BROADCAST_CHANNEL_PREFIX: str = os.getenv("BROADCAST_CHANNEL_PREFIX", "billo:")
+    BROADCAST_PUBLISH_TIMEOUT_SECONDS: float = float(os.getenv("BROADCAST_PUBLISH_TIMEOUT_SECONDS", "5"))
+    WS_SEND_QUEUE_SIZE: int = int(os.getenv("WS_SEND_QUEUE_SIZE", "100"))
+    WS_SEND_TIMEOUT_SECONDS: float = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "10"))
+    WS_PING_INTERVAL_SECONDS: float = float(os.getenv("WS_PING_INTERVAL_SECONDS", "20"))
+    WS_PONG_TIMEOUT_SECONDS: float = float(os.getenv("WS_PONG_TIMEOUT_SECONDS", "60"))
+    WS_AUTH_TIMEOUT_SECONDS: float = float(os.getenv("WS_AUTH_TIMEOUT_SECONDS", "10"))
+    
+    # Caching
+    RESTAURANT_CACHE_TTL_SECONDS: int = int(os.getenv("RESTAURANT_CACHE_TTL_SECONDS", "300"))
+    RESTAURANT_CACHE_MAX_SIZE: int = int(os.getenv("RESTAURANT_CACHE_MAX_SIZE", "1000"))
+    BUSINESS_HOURS_CACHE_TTL_SECONDS: int = int(os.getenv("BUSINESS_HOURS_CACHE_TTL_SECONDS", "3600"))
+    MENU_SNAPSHOT_TTL_SECONDS: int = int(os.getenv("MENU_SNAPSHOT_TTL_SECONDS", "60"))
+    TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+    PROFILE_CACHE_TTL_SECONDS: int = int(os.getenv("PROFILE_CACHE_TTL_SECONDS", "60"))
+    
+    # MessagePack responses and WebSocket frames for clients that ask for them
+    MSGPACK_ENABLED: bool = os.getenv("MSGPACK_ENABLED", "true").lower() == "true"
+    
+    # Batch endpoint
+    BATCH_MAX_REQUESTS: int = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    
     # Token Types
-    TOKEN_TYPE_ACCESS = "access"
-    TOKEN_TYPE_REFRESH = "refresh"
+    TOKEN_TYPE_ACCESS: ClassVar[str] = "access"
+    TOKEN_TYPE_REFRESH: ClassVar[str] = "refresh"
     
     class Config:
         env_file = ".env"
         env_file_encoding = 'utf-8'
         case_sensitive = True
+        # .env also holds values read with os.getenv above (e.g. SUPABASE_JWT_SECRET)
+        extra = "ignore"
 
 # Create settings instance
 settings = Settings()
\ No newline at end of file
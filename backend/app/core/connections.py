@@ -0,0 +1,303 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Union
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.core.codecs import MSGPACK_SUBPROTOCOL, decode_frame, encode_json, json_to_msgpack, pack, select_subprotocol
+from app.core.config import settings
+from app.core.pubsub import Backplane, create_backplane
+
+logger = logging.getLogger(__name__)
+
+# Channel kinds a socket may subscribe to
+CHANNEL_KINDS = ("waiter", "restaurant", "tab", "role", "menu")
+
+
+def waiter_channel(waiter_id: str) -> str:
+    return f"waiter:{waiter_id}"
+
+def restaurant_channel(restaurant_id: str) -> str:
+    return f"restaurant:{restaurant_id}"
+
+def tab_channel(tab_id: str) -> str:
+    return f"tab:{tab_id}"
+
+def role_channel(restaurant_id: str, role: str) -> str:
+    return f"role:{restaurant_id}:{role}"
+
+def menu_channel(restaurant_id: str) -> str:
+    return f"menu:{restaurant_id}"
+
+
+class ClientConnection:
+    """
+    A single WebSocket with its own bounded send queue.
+
+    Messages are queued without waiting and written by a per-socket sender
+    task, so a slow client only delays itself. When the queue is full the
+    oldest pending message is dropped, and a send that does not complete
+    within `send_timeout` marks the connection closed.
+
+    Sockets that negotiated the MessagePack subprotocol are `binary` and are
+    sent bytes frames; the others get JSON text.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int,
+        send_timeout: Optional[float] = None,
+        subprotocol: Optional[str] = None
+    ):
+        self.websocket = websocket
+        self.subprotocol = subprotocol
+        self.binary = subprotocol == MSGPACK_SUBPROTOCOL
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.send_timeout = send_timeout
+        self.channels: Set[str] = set()
+        self.dropped = 0
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self._sender: Optional[asyncio.Task] = None
+
+    def touch(self):
+        """Record that the client was heard from (any message, including pong)"""
+        self.last_seen = time.monotonic()
+
+    async def receive(self) -> Any:
+        """
+        Wait for the next message from the client and decode it
+
+        Text frames are JSON and binary frames MessagePack, whatever was
+        negotiated. Raises ValueError for an undecodable message and
+        WebSocketDisconnect when the client goes away.
+        """
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        self.touch()
+        return decode_frame(message)
+
+    def start(self):
+        self._sender = asyncio.create_task(self._send_loop())
+
+    def encode(self, data: Any) -> Union[str, bytes]:
+        """Encode a message in this socket's format"""
+        return pack(data) if self.binary else encode_json(data)
+
+    def send_data(self, data: Any) -> bool:
+        """Encode and queue a message built on this worker"""
+        return self.enqueue(self.encode(data))
+
+    def enqueue(self, message: Union[str, bytes]) -> bool:
+        """Queue an encoded message, returning False if one had to be dropped"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.queue.get_nowait()
+            self.queue.put_nowait(message)
+            self.dropped += 1
+            return False
+
+    async def _send_loop(self):
+        try:
+            while True:
+                message = await self.queue.get()
+                if isinstance(message, bytes):
+                    send = self.websocket.send_bytes(message)
+                else:
+                    send = self.websocket.send_text(message)
+                await asyncio.wait_for(send, timeout=self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.info("WebSocket send timed out, closing connection")
+            self.closed = True
+        except Exception as e:
+            logger.info(f"WebSocket send failed, closing connection: {e}")
+            self.closed = True
+
+    async def close(self):
+        self.closed = True
+        if self._sender is not None:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._sender = None
+        try:
+            await asyncio.wait_for(self.websocket.close(), timeout=self.send_timeout)
+        except Exception:
+            # Already closed by the client or the network is gone
+            pass
+
+
+class ConnectionManager:
+    """
+    Tracks the sockets held by this worker and the channels they subscribe to.
+
+    A waiter may have several sockets open (phone and tablet), and sockets can
+    subscribe to restaurant, tab and role channels as well as their own waiter
+    channel. Messages go through the backplane, so a message published on any
+    worker reaches every subscribed socket wherever it is connected.
+
+    A heartbeat task pings every socket and reaps the ones that stopped
+    answering or whose sends failed, so dropped phones do not pile up over a
+    long shift.
+    """
+
+    def __init__(
+        self,
+        backplane: Backplane,
+        queue_size: int = 100,
+        send_timeout: float = 10.0,
+        ping_interval: float = 20.0,
+        pong_timeout: float = 60.0
+    ):
+        self.backplane = backplane
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.ping_interval = ping_interval
+        self.pong_timeout = pong_timeout
+        self.connections: Set[ClientConnection] = set()
+        self.channels: Dict[str, Set[ClientConnection]] = {}
+        self.dropped_messages = 0
+        self.reaped_connections = 0
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.backplane.start(self._deliver)
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        await self.backplane.close()
+        for connection in list(self.connections):
+            await self.disconnect(connection)
+
+    async def connect(self, websocket: WebSocket, channels: Iterable[str] = ()) -> ClientConnection:
+        """
+        Accept a socket and subscribe it to the given channels
+
+        The subprotocol (MessagePack or JSON) is picked from the ones the
+        client offered; clients offering none get JSON.
+        """
+        subprotocol = select_subprotocol(websocket.scope.get("subprotocols", ()))
+        await websocket.accept(subprotocol=subprotocol)
+        connection = ClientConnection(websocket, self.queue_size, self.send_timeout, subprotocol)
+        connection.start()
+        self.connections.add(connection)
+        for channel in channels:
+            self.subscribe(connection, channel)
+        return connection
+
+    async def disconnect(self, connection: ClientConnection):
+        """Unsubscribe a socket from all its channels and stop its sender"""
+        if connection not in self.connections:
+            return
+        self.connections.discard(connection)
+        for channel in list(connection.channels):
+            self.unsubscribe(connection, channel)
+        await connection.close()
+
+    def subscribe(self, connection: ClientConnection, channel: str):
+        if channel.partition(":")[0] not in CHANNEL_KINDS:
+            raise ValueError(f"Unknown channel: {channel}")
+        self.channels.setdefault(channel, set()).add(connection)
+        connection.channels.add(channel)
+
+    def unsubscribe(self, connection: ClientConnection, channel: str):
+        subscribers = self.channels.get(channel)
+        if subscribers is not None:
+            subscribers.discard(connection)
+            if not subscribers:
+                del self.channels[channel]
+        connection.channels.discard(channel)
+
+    async def publish(self, channel: str, message: str):
+        """Send a message to every socket subscribed to a channel, on any worker"""
+        await self.backplane.publish(channel, message)
+
+    async def send_personal_message(self, message: str, waiter_id: str):
+        await self.publish(waiter_channel(waiter_id), message)
+
+    async def broadcast_to_restaurant(self, message: str, restaurant_id: str):
+        await self.publish(restaurant_channel(restaurant_id), message)
+
+    async def broadcast_to_tab(self, message: str, tab_id: str):
+        await self.publish(tab_channel(tab_id), message)
+
+    async def broadcast_to_role(self, message: str, restaurant_id: str, role: str):
+        await self.publish(role_channel(restaurant_id, role), message)
+
+    async def _deliver(self, channel: str, message: str):
+        """Queue a backplane message on every local socket subscribed to the channel"""
+        self._fan_out(list(self.channels.get(channel, ())), message)
+
+    def _fan_out(self, connections: Iterable[ClientConnection], message: str):
+        # Backplane messages are JSON; re-encode once for all binary sockets
+        packed: Optional[bytes] = None
+        for connection in connections:
+            if connection.binary:
+                if packed is None:
+                    packed = json_to_msgpack(message)
+                payload = packed
+            else:
+                payload = message
+            if not connection.enqueue(payload):
+                self.dropped_messages += 1
+
+    async def reap(self) -> int:
+        """Disconnect sockets that failed a send or missed the pong timeout"""
+        cutoff = time.monotonic() - self.pong_timeout
+        stale = [c for c in self.connections if c.closed or c.last_seen < cutoff]
+        for connection in stale:
+            await self.disconnect(connection)
+        self.reaped_connections += len(stale)
+        return len(stale)
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                await self.reap()
+                ping = json.dumps({"type": "ping", "ts": time.time()})
+                self._fan_out(list(self.connections), ping)
+            except Exception as e:
+                logger.error(f"WebSocket heartbeat error: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Gauges for connection count, queue depth and dropped messages"""
+        depths = [c.queue.qsize() for c in self.connections]
+        return {
+            "connections": len(self.connections),
+            "binary_connections": sum(1 for c in self.connections if c.binary),
+            "channels": len(self.channels),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "dropped_messages": self.dropped_messages,
+            "reaped_connections": self.reaped_connections
+        }
+
+
+manager = ConnectionManager(
+    create_backplane(),
+    queue_size=settings.WS_SEND_QUEUE_SIZE,
+    send_timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+    ping_interval=settings.WS_PING_INTERVAL_SECONDS,
+    pong_timeout=settings.WS_PONG_TIMEOUT_SECONDS
+)
@@ -0,0 +1,101 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from supabase import create_client, Client as SupabaseClient
+
+from app.core.config import settings
+
+# Shared Supabase client for data access (service role, bypasses RLS)
+supabase: SupabaseClient = create_client(
+    settings.SUPABASE_URL,
+    settings.SUPABASE_SERVICE_ROLE_KEY or settings.SUPABASE_KEY
+)
+
+# supabase-py is synchronous, so calls run here instead of on the event loop
+_executor = ThreadPoolExecutor(
+    max_workers=settings.DB_THREAD_POOL_SIZE,
+    thread_name_prefix="supabase"
+)
+
+
+class QueryMetrics:
+    """
+    Per-call latency counters for database calls, grouped by call name
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Dict[str, float]] = {}
+        self.in_flight = 0
+
+    def record(self, name: str, elapsed_ms: float, failed: bool = False):
+        with self._lock:
+            stats = self._calls.setdefault(name, {
+                "count": 0,
+                "errors": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_ms": 0.0
+            })
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["last_ms"] = elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            if failed:
+                stats["errors"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the counters with average latency per call name"""
+        with self._lock:
+            calls = {
+                name: {
+                    **stats,
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2) if stats["count"] else 0.0
+                }
+                for name, stats in self._calls.items()
+            }
+        return {
+            "pool_size": settings.DB_THREAD_POOL_SIZE,
+            "in_flight": self.in_flight,
+            "calls": calls
+        }
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+
+
+db_metrics = QueryMetrics()
+
+
+async def run_db(func: Callable[..., Any], *args, name: Optional[str] = None, **kwargs) -> Any:
+    """
+    Run a blocking database call on the bounded thread pool and record its latency
+    """
+    name = name or getattr(func, "__qualname__", "query")
+    loop = asyncio.get_running_loop()
+    db_metrics.in_flight += 1
+    start = time.perf_counter()
+    failed = False
+    try:
+        return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+    except Exception:
+        failed = True
+        raise
+    finally:
+        db_metrics.in_flight -= 1
+        db_metrics.record(name, (time.perf_counter() - start) * 1000, failed)
+
+
+async def execute(query: Any, name: Optional[str] = None) -> Any:
+    """
+    Execute a supabase-py query builder without blocking the event loop
+
+    Usage:
+        result = await execute(supabase.table("tabs").select("*").eq("id", tab_id), "tabs.get")
+    """
+    return await run_db(query.execute, name=name)
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Union
-import jwt
+import hashlib
+import time
+from jose import jwt, JWTError, ExpiredSignatureError
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import ValidationError
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 # OAuth2 scheme for token authentication
@@ -13,6 +16,12 @@ oauth2_scheme = OAuth2PasswordBearer(
     auto_error=False
 )
 
+# Decoded claims of already-verified tokens, keyed by token hash until they expire
+claims_cache = TTLCache(
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    max_size=settings.TOKEN_CACHE_MAX_SIZE
+)
+
 class TokenPayload:
     """Token payload model"""
     sub: str  # user ID
@@ -77,31 +86,72 @@ def create_refresh_token(
         algorithm=settings.JWT_ALGORITHM
     )
 
+def _token_key(token: str) -> str:
+    """Cache key for a token, so raw tokens are never held as dict keys"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _expired() -> HTTPException:
+    """Error raised for tokens past their exp claim"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has expired",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify and decode a JWT token
+    
+    Signatures are checked locally against the shared secret. Claims of a
+    valid token are cached until the token's own expiry, so repeat requests
+    with the same token skip decoding entirely.
     """
+    key = _token_key(token)
+    payload = claims_cache.get(key)
+    if payload is not None:
+        if payload.get("exp") and payload["exp"] <= time.time():
+            claims_cache.invalidate(key)
+            raise _expired()
+        return payload
+    
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+            algorithms=[settings.JWT_ALGORITHM],
+            audience=settings.JWT_AUDIENCE,
+            options={"verify_aud": bool(settings.JWT_AUDIENCE)}
         )
+        
+        if payload.get("exp"):
+            remaining = payload["exp"] - time.time()
+            if remaining > 0:
+                claims_cache.set(key, payload, ttl_seconds=remaining)
+        else:
+            claims_cache.set(key, payload)
         return payload
         
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except (jwt.JWTError, ValidationError) as e:
+    except ExpiredSignatureError:
+        raise _expired()
+    except (JWTError, ValidationError) as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+def user_from_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a token and return the user described by its claims
+    """
+    payload = verify_token(token)
+    return {
+        "id": payload.get("sub"),
+        "email": payload.get("email"),
+        "role": payload.get("role"),
+        "restaurant_id": payload.get("restaurant_id")
+    }
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
     """
     Get the current user from the token
@@ -114,13 +164,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any
         )
     
     try:
-        payload = verify_token(token)
-        return {
-            "id": payload.get("sub"),
-            "email": payload.get("email"),
-            "role": payload.get("role"),
-            "restaurant_id": payload.get("restaurant_id")
-        }
+        return user_from_token(token)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,216 @@
+import abc
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Called with (channel, message) for every message published on the backplane
+MessageHandler = Callable[[str, str], Awaitable[None]]
+
+
+class Backplane(abc.ABC):
+    """
+    Broadcast bus shared by every worker process.
+
+    Messages published by any worker are delivered to the handler of every
+    worker that has started the backplane, so each one can forward them to
+    the sockets it holds locally.
+    """
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._handlers: List[MessageHandler] = []
+
+    async def start(self, handler: MessageHandler):
+        """Begin delivering published messages to the handler"""
+        self._handlers.append(handler)
+
+    @abc.abstractmethod
+    async def publish(self, channel: str, message: str):
+        """Publish a message to every worker"""
+
+    async def close(self):
+        """Stop delivering messages and release connections"""
+        self._handlers.clear()
+
+    async def _dispatch(self, channel: str, message: str):
+        for handler in list(self._handlers):
+            try:
+                await handler(channel, message)
+            except Exception as e:
+                logger.error(f"Backplane handler error on {channel}: {e}")
+
+
+class InMemoryBackplane(Backplane):
+    """
+    Single-process backplane. Only suitable when running one worker.
+    """
+
+    async def publish(self, channel: str, message: str):
+        await self._dispatch(channel, message)
+
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+async def _read_reply(reader: asyncio.StreamReader):
+    """Read a single RESP reply"""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server")
+
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise RespError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(count)]
+    raise RespError(f"Unexpected reply type: {line!r}")
+
+
+def _encode_command(*parts) -> bytes:
+    """Encode a command as a RESP array of bulk strings"""
+    out = [b"*%d\r\n" % len(parts)]
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(part), part))
+    return b"".join(out)
+
+
+class RedisBackplane(Backplane):
+    """
+    Backplane over Redis pub/sub, speaking RESP directly on an asyncio socket.
+
+    Works against Redis or any server implementing PUBLISH/PSUBSCRIBE, e.g. a
+    local stand-in during tests. One connection publishes, a second one holds a
+    pattern subscription on `<prefix>*` and reconnects with backoff if dropped.
+    A publish that gets no reply within `publish_timeout` seconds drops the
+    publishing connection and is retried once on a new one.
+    """
+
+    def __init__(self, url: str, prefix: str = "", reconnect_delay: float = 1.0, publish_timeout: float = 5.0):
+        super().__init__(prefix)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.reconnect_delay = reconnect_delay
+        self.publish_timeout = publish_timeout
+        self._publisher: Optional[tuple] = None
+        self._publish_lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            writer.write(_encode_command("AUTH", self.password))
+            await _read_reply(reader)
+        if self.db:
+            writer.write(_encode_command("SELECT", str(self.db)))
+            await _read_reply(reader)
+        return reader, writer
+
+    async def start(self, handler: MessageHandler):
+        await super().start(handler)
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+            try:
+                await asyncio.wait_for(self._subscribed.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                logger.warning("Backplane not subscribed yet, retrying in the background")
+
+    async def publish(self, channel: str, message: str):
+        async with self._publish_lock:
+            for attempt in range(2):
+                try:
+                    await asyncio.wait_for(self._publish_once(channel, message), timeout=self.publish_timeout)
+                    return
+                except (ConnectionError, OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Backplane publish on {channel} failed: {e!r}")
+                    self._drop_publisher()
+                    if attempt:
+                        raise
+
+    async def _publish_once(self, channel: str, message: str):
+        if self._publisher is None:
+            self._publisher = await self._connect()
+        reader, writer = self._publisher
+        writer.write(_encode_command("PUBLISH", self.prefix + channel, message))
+        await writer.drain()
+        await _read_reply(reader)
+
+    def _drop_publisher(self):
+        """Close the publishing connection; the next publish opens a new one"""
+        if self._publisher is not None:
+            self._publisher[1].close()
+            self._publisher = None
+
+    async def _listen(self):
+        while True:
+            writer = None
+            try:
+                reader, writer = await self._connect()
+                writer.write(_encode_command("PSUBSCRIBE", self.prefix + "*"))
+                await writer.drain()
+                await _read_reply(reader)  # subscription confirmation
+                self._subscribed.set()
+
+                while True:
+                    reply = await _read_reply(reader)
+                    if isinstance(reply, list) and len(reply) == 4 and reply[0] == b"pmessage":
+                        channel = reply[2].decode()[len(self.prefix):]
+                        await self._dispatch(channel, reply[3].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Backplane subscription lost: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    async def close(self):
+        await super().close()
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._drop_publisher()
+        self._subscribed.clear()
+
+
+def create_backplane() -> Backplane:
+    """
+    Build the backplane selected by BROADCAST_BACKEND ("memory" or "redis")
+    """
+    prefix = settings.BROADCAST_CHANNEL_PREFIX
+    if settings.BROADCAST_BACKEND == "redis":
+        return RedisBackplane(
+            settings.BROADCAST_URL,
+            prefix=prefix,
+            publish_timeout=settings.BROADCAST_PUBLISH_TIMEOUT_SECONDS
+        )
+    return InMemoryBackplane(prefix=prefix)
@@ -85,7 +85,7 @@ async def register(user_data: UserCreate):
     Register a new user
     """
     try:
-        user = auth_service.create_user(
+        user = await auth_service.create_user(
             email=user_data.email,
             password=user_data.password,
             user_data={
@@ -129,7 +129,7 @@ async def get_current_user(request: Request):
             detail="Not authenticated"
         )
     
-    user = auth_service.get_user_by_session(session_token)
+    user = await auth_service.get_user_by_session(session_token)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
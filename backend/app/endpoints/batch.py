@@ -0,0 +1,151 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import urlencode
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, Field
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+BATCH_PATH = "/batch"
+
+# Parent headers that only describe the batch request itself; sub-responses
+# are always JSON, the batch response as a whole is negotiated
+NOT_FORWARDED_HEADERS = frozenset({b"content-length", b"content-type", b"transfer-encoding", b"accept", b"accept-encoding", b"expect"})
+
+class BatchRequestItem(BaseModel):
+    id: str = Field(..., description="Echoed back on the matching response")
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., description="Absolute path from the app root, may include a query string")
+    params: Dict[str, Any] = {}
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1)
+
+class BatchResponseItem(BaseModel):
+    id: str
+    status: int
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]
+
+@router.post(BATCH_PATH, response_model=BatchResponse)
+async def batch(payload: BatchRequest, request: Request):
+    """
+    Run several API requests in one round trip
+    - Served under the API prefix (e.g. /api/v1/batch), next to the clients'
+      base URL; each sub-request `path` is the full path a direct request
+      would use, e.g. /api/v1/waiter/waiter/orders
+    - Sub-requests go through the full app in-process, with the caller's
+      Authorization and other headers, so auth and validation are unchanged
+    - They run concurrently and in no particular order; do not batch a
+      request that depends on the result of another one
+    - A failing sub-request only fails its own entry; responses come back in
+      request order with their status and JSON body
+    """
+    items = payload.requests
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BATCH_MAX_REQUESTS} requests per batch"
+        )
+    if len({item.id for item in items}) != len(items):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Request ids must be unique")
+    for item in items:
+        path = item.path.partition("?")[0]
+        if not path.startswith("/") or path.startswith("//"):
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid path: {item.path}")
+        if path.rstrip("/").endswith(BATCH_PATH):
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Batches cannot be nested")
+
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def run(item: BatchRequestItem) -> BatchResponseItem:
+        async with semaphore:
+            return await _dispatch(request, item)
+
+    return BatchResponse(responses=await asyncio.gather(*(run(item) for item in items)))
+
+async def _dispatch(parent: Request, item: BatchRequestItem) -> BatchResponseItem:
+    """Send one sub-request through the ASGI app and collect its response"""
+    path, _, query = item.path.partition("?")
+    query_string = "&".join(filter(None, [query, urlencode(item.params, doseq=True)]))
+    body = b"" if item.body is None else json.dumps(item.body).encode()
+
+    headers = [(name, value) for name, value in parent.headers.raw if name not in NOT_FORWARDED_HEADERS]
+    overrides = {name.lower().encode("latin-1"): value.encode("latin-1") for name, value in item.headers.items()}
+    headers = [(name, value) for name, value in headers if name not in overrides] + list(overrides.items())
+    if item.body is not None:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+
+    scope = {
+        "type": "http",
+        "asgi": parent.scope.get("asgi", {"version": "3.0"}),
+        "http_version": parent.scope.get("http_version", "1.1"),
+        "method": item.method,
+        "scheme": parent.url.scheme,
+        "server": parent.scope.get("server"),
+        "client": parent.scope.get("client"),
+        "root_path": parent.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "headers": headers,
+        "state": dict(parent.scope.get("state", {})),
+    }
+
+    finished = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Only asked again by handlers watching for the client to go away
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    response_headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status_code, response_headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            response_headers = {
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in message.get("headers", [])
+                if name.lower() != b"content-length"
+            }
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    try:
+        await parent.app(scope, receive, send)
+    except Exception as e:
+        logger.exception(f"Batch sub-request {item.method} {item.path} failed: {e}")
+        return BatchResponseItem(id=item.id, status=status.HTTP_500_INTERNAL_SERVER_ERROR, body={"detail": "Internal Server Error"})
+    finally:
+        finished.set()
+
+    raw = b"".join(chunks)
+    content_type = response_headers.get("content-type", "")
+    if not raw:
+        response_body = None
+    elif "json" in content_type:
+        response_body = json.loads(raw)
+    else:
+        response_body = raw.decode("utf-8", errors="replace")
+    return BatchResponseItem(id=item.id, status=status_code, headers=response_headers, body=response_body)
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.core.jwt import get_current_user
+from app.models.schemas import Order, OrderCreate
+from app.services.order_service import order_service
+
+router = APIRouter()
+
+@router.post("/", response_model=Order, status_code=status.HTTP_201_CREATED)
+async def place_order(
+    order: OrderCreate,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Place an order on a tab (Waiters and restaurant admins)
+    - The tab must belong to the user's restaurant
+    - A waiter's orders are assigned to them
+    - Prices and names are taken from the restaurant's menu
+    - The total is computed server-side in cents
+    - The order and all its items are written in one transaction
+    """
+    if current_user["role"] not in ["waiter", "restaurant_admin"] or not current_user.get("restaurant_id"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only restaurant staff can place orders"
+        )
+    
+    waiter_id = current_user["id"] if current_user["role"] == "waiter" else None
+    try:
+        return await order_service.place_order(order, current_user["restaurant_id"], waiter_id)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -1,24 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from pydantic import BaseModel
-from datetime import datetime
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime, time
 from app.core.jwt import get_current_user
+from app.models.schemas import MenuItemCreate, MenuItem, MenuItemAvailability, MenuImportResult
+from app.services.menu_service import menu_service
+from app.services.menu_snapshot import menu_snapshot_service
+from app.services.business_hours_service import business_hours_service
+from app.services.restaurant_service import restaurant_service
 
 router = APIRouter(prefix="/restaurant", tags=["restaurant"])
 
-class MenuItemCreate(BaseModel):
-    name: str
-    description: str
-    price: int  # in cents
-    category: str
-    is_available: bool = True
-    image_url: Optional[str] = None
+class RestaurantUpdate(BaseModel):
+    name: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    is_active: Optional[bool] = None
 
-class MenuItem(MenuItemCreate):
-    id: str
-    restaurant_id: str
-    created_at: datetime
-    updated_at: datetime
+class BusinessHoursEntry(BaseModel):
+    day_of_week: int = Field(..., ge=0, le=6)  # 0 = Sunday
+    open_time: Optional[time] = None
+    close_time: Optional[time] = None
+    is_closed: bool = False
 
 class WaiterCreate(BaseModel):
     email: str
@@ -33,6 +36,79 @@ class Waiter(WaiterCreate):
     created_at: datetime
     updated_at: datetime
 
+@router.patch("/", response_model=dict)
+async def update_restaurant(
+    changes: RestaurantUpdate,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Update the current admin's restaurant details (Restaurant admin only)
+    """
+    if current_user["role"] != "restaurant_admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only restaurant admins can update restaurant details"
+        )
+    
+    update_data = changes.dict(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No changes provided"
+        )
+    
+    restaurant = await restaurant_service.update_restaurant(current_user["restaurant_id"], update_data)
+    if not restaurant:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Restaurant not found"
+        )
+    return restaurant
+
+@router.put("/business-hours", response_model=dict)
+async def update_business_hours(
+    hours: List[BusinessHoursEntry],
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Replace the restaurant's weekly business hours (Restaurant admin only)
+    """
+    if current_user["role"] != "restaurant_admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only restaurant admins can update business hours"
+        )
+    
+    days = [entry.day_of_week for entry in hours]
+    if len(days) != len(set(days)):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Each day_of_week may appear only once"
+        )
+    for entry in hours:
+        if not entry.is_closed and (entry.open_time is None or entry.close_time is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Open and close times are required for day {entry.day_of_week}"
+            )
+        if not entry.is_closed and entry.open_time == entry.close_time:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Open and close times must differ for day {entry.day_of_week}"
+            )
+    
+    rows = [
+        {
+            "day_of_week": entry.day_of_week,
+            "open_time": entry.open_time.isoformat() if entry.open_time else None,
+            "close_time": entry.close_time.isoformat() if entry.close_time else None,
+            "is_closed": entry.is_closed
+        }
+        for entry in hours
+    ]
+    await business_hours_service.save_hours(current_user["restaurant_id"], rows)
+    return {"status": "success", "message": "Business hours updated successfully"}
+
 @router.post("/menu/items", response_model=MenuItem)
 async def create_menu_item(
     item: MenuItemCreate,
@@ -47,28 +123,115 @@ async def create_menu_item(
             detail="Only restaurant admins can add menu items"
         )
     
-    # TODO: Implement menu item creation with Supabase
-    # This is a placeholder implementation
-    new_item = {
-        **item.dict(),
-        "id": "item_123",  # Generate UUID in actual implementation
-        "restaurant_id": current_user["restaurant_id"],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    return new_item
+    return await menu_service.create_item(current_user["restaurant_id"], item)
+
+@router.post("/menu/items/bulk", response_model=MenuImportResult)
+async def bulk_create_menu_items(
+    items: List[Any],
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Add many menu items from a JSON array (Restaurant admin only)
+    
+    Valid rows are inserted in batches; invalid rows, including entries that
+    are not objects, are reported by their 1-based position in the array
+    without failing the whole request.
+    """
+    if current_user["role"] != "restaurant_admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only restaurant admins can add menu items"
+        )
+    
+    return await menu_service.bulk_create(
+        current_user["restaurant_id"],
+        enumerate(items, start=1)
+    )
+
+@router.post("/menu/items/import", response_model=MenuImportResult)
+async def import_menu_items(
+    file: UploadFile = File(...),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Import menu items from a CSV (with header row) or NDJSON upload (Restaurant admin only)
+    
+    The upload is read row by row, so large menus are never held in memory
+    as a whole.
+    """
+    if current_user["role"] != "restaurant_admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only restaurant admins can import menu items"
+        )
+    
+    filename = (file.filename or "").lower()
+    content_type = file.content_type or ""
+    if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type:
+        rows = menu_service.parse_ndjson(file.file)
+    elif filename.endswith(".csv") or "csv" in content_type:
+        rows = menu_service.parse_csv(file.file)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload must be a .csv or .ndjson file"
+        )
+    try:
+        menu_service.check_encoding(file.file)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return await menu_service.bulk_create(current_user["restaurant_id"], rows)
 
 @router.get("/menu/items", response_model=List[MenuItem])
 async def get_menu_items(
     category: str = None,
+    available: Optional[bool] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
     current_user: dict = Depends(get_current_user)
 ):
     """
-    Get all menu items for the restaurant
+    Get menu items for the restaurant, optionally filtered by category,
+    availability and price range (in cents)
     """
-    # TODO: Implement menu item retrieval from Supabase
-    # Filter by category if provided
-    return []
+    snapshot = await menu_snapshot_service.get_snapshot(current_user["restaurant_id"])
+    return snapshot.query(
+        category=category,
+        available=available,
+        min_price=min_price,
+        max_price=max_price
+    )
+
+@router.patch("/menu/items/{item_id}/availability", response_model=MenuItem)
+async def set_menu_item_availability(
+    item_id: str,
+    availability: MenuItemAvailability,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Mark a menu item available or sold out ("86" it)
+    
+    The change is pushed to every waiter and customer view subscribed to
+    the restaurant's menu channel.
+    """
+    if current_user["role"] not in ["waiter", "restaurant_admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only waiters and admins can change item availability"
+        )
+    
+    item = await menu_service.set_availability(
+        current_user["restaurant_id"],
+        item_id,
+        availability.is_available
+    )
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Menu item not found"
+        )
+    return item
 
 @router.post("/waiters", response_model=Waiter)
 async def create_waiter(
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Header, Query, Response, status, WebSocket, WebSocketDisconnect
+from typing import Optional
+
+from app.core.connections import manager, menu_channel
+from app.services.menu_snapshot import menu_snapshot_service
+
+router = APIRouter()
+
+@router.get("/{restaurant_id}/menu")
+async def get_menu(
+    restaurant_id: str,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None)
+):
+    """
+    Get a restaurant's full menu for customers and waiters
+
+    The menu is served from a prebuilt snapshot. Clients should send the
+    ETag they last received in If-None-Match; an unchanged menu returns
+    304 with no body.
+    """
+    snapshot = await menu_snapshot_service.get_snapshot(restaurant_id)
+    headers = {
+        "ETag": snapshot.etag,
+        "X-Menu-Version": str(snapshot.version),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=snapshot.gzipped, media_type="application/json", headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+@router.get("/{restaurant_id}/menu/changes")
+async def get_menu_changes(
+    restaurant_id: str,
+    since: int = Query(..., ge=0, description="Menu version the client already has")
+):
+    """
+    Get menu items changed since a version
+
+    Returns the items updated after `since` along with the IDs of every
+    item currently on the menu, so clients can apply the delta and drop
+    removed items without downloading the whole menu.
+    """
+    snapshot = await menu_snapshot_service.get_snapshot(restaurant_id)
+    return snapshot.changes_since(since)
+
+@router.websocket("/{restaurant_id}/menu/ws")
+async def menu_updates(websocket: WebSocket, restaurant_id: str):
+    """
+    Live menu updates for customer devices.
+    
+    Sends {"type": "menu_item_updated", "item": {...}} when an item changes
+    (e.g. is 86'd) and {"type": "menu_reload"} when the menu should be
+    fetched again. Clients answer the server's pings with {"type": "pong"}.
+    """
+    connection = await manager.connect(websocket, [menu_channel(restaurant_id)])
+    try:
+        while True:
+            try:
+                await connection.receive()
+            except ValueError:
+                continue
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        await manager.disconnect(connection)
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional
-from datetime import datetime, date, time
-from app.models.schemas import Tab, TabCreate, TabStatus, OrderStatus
-from app.core.database import supabase
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Tuple, Union
+from datetime import datetime, date
+from app.models.schemas import Tab, TabCreate, TabStatus, OrderStatus, TabPage, TabDetailPage
+from app.core.database import supabase, execute
+from app.utils.helpers import encode_cursor, decode_cursor, parse_uuid
+from app.services.business_hours_service import business_hours_service
+from app.services.restaurant_service import restaurant_service
+from app.services.tab_numbers import tab_number_allocator
+from pydantic import BaseModel, TypeAdapter
+import json
 
 class QRCodeData(BaseModel):
     restaurant_id: str
@@ -15,16 +21,8 @@ router = APIRouter()
 async def create_tab(tab_create: TabCreate):
     """Create a new tab with sequential number for the day"""
     try:
-        # Get current date
-        today = date.today()
-        
-        # Get max tab number for today
-        result = supabase.table("tabs").select("tab_number").eq("restaurant_id", tab_create.restaurant_id).eq("created_at::date", today.isoformat()).order("tab_number", desc=True).limit(1).execute()
-        
-        # Calculate next tab number
-        next_tab_number = 1
-        if result.data:
-            next_tab_number = result.data[0]["tab_number"] + 1
+        # Reserve next tab number for today
+        next_tab_number = await tab_number_allocator.next_number(tab_create.restaurant_id)
         
         # Create tab
         tab_data = {
@@ -34,7 +32,7 @@ async def create_tab(tab_create: TabCreate):
             "updated_at": datetime.utcnow().isoformat()
         }
         
-        result = supabase.table("tabs").insert(tab_data).execute()
+        result = await execute(supabase.table("tabs").insert(tab_data), "tabs.insert")
         return result.data[0]
         
     except Exception as e:
@@ -53,36 +51,24 @@ async def scan_qr_code(qr_data: QRCodeData):
     """
     try:
         # 1. Check if restaurant exists and get business hours
-        restaurant = supabase.table("restaurants").select("*").eq("id", qr_data.restaurant_id).execute()
-        if not restaurant.data:
+        restaurant = await restaurant_service.get_restaurant(qr_data.restaurant_id)
+        if not restaurant:
             raise HTTPException(status_code=404, detail="Restaurant not found")
         
-        restaurant = restaurant.data[0]
-        
-        # 2. Check if restaurant is open (simplified check)
-        current_time = datetime.utcnow().time()
-        open_time = time(8, 0)  # Default 8 AM
-        close_time = time(22, 0)  # Default 10 PM
-        
-        if current_time < open_time or current_time > close_time:
+        # 2. Check if restaurant is open against its configured business hours
+        now = datetime.utcnow()
+        schedule = await business_hours_service.get_schedule(qr_data.restaurant_id)
+        if not schedule.is_open(now):
+            next_open = schedule.next_opening(now)
+            next_open_str = next_open.strftime('%A %H:%M') if next_open else "later"
             raise HTTPException(
                 status_code=400,
-                detail=f"Restaurant is currently closed. Open hours: {open_time.strftime('%H:%M')} - {close_time.strftime('%H:%M')}"
+                detail=f"Restaurant is currently closed. Opens next: {next_open_str}"
             )
         
         # 3. Generate next tab number
-        today = date.today()
-        result = supabase.table("tabs") \
-            .select("tab_number") \
-            .eq("restaurant_id", qr_data.restaurant_id) \
-            .eq("created_at::date", today.isoformat()) \
-            .order("tab_number", desc=True) \
-            .limit(1) \
-            .execute()
-        
-        next_tab_number = 1
-        if result.data:
-            next_tab_number = result.data[0]["tab_number"] + 1
+        today = datetime.utcnow().date()
+        next_tab_number = await tab_number_allocator.next_number(qr_data.restaurant_id, today)
         
         # 4. Create new tab
         tab_data = {
@@ -94,7 +80,7 @@ async def scan_qr_code(qr_data: QRCodeData):
             "reference": f"TAB-{today.strftime('%Y%m%d')}-{next_tab_number:03d}"
         }
         
-        result = supabase.table("tabs").insert(tab_data).execute()
+        result = await execute(supabase.table("tabs").insert(tab_data), "tabs.insert")
         return result.data[0]
         
     except HTTPException:
@@ -106,21 +92,133 @@ async def scan_qr_code(qr_data: QRCodeData):
 async def get_tab(tab_id: str):
     """Get a specific tab by ID"""
     try:
-        result = supabase.table("tabs").select("*").eq("id", tab_id).execute()
+        result = await execute(supabase.table("tabs").select("*").eq("id", tab_id), "tabs.get")
         if not result.data:
             raise HTTPException(status_code=404, detail="Tab not found")
         return result.data[0]
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/restaurant/{restaurant_id}", response_model=List[Tab])
-async def get_restaurant_tabs(restaurant_id: str, status: Optional[TabStatus] = None):
-    """Get all tabs for a restaurant, optionally filtered by status"""
+# Columns returned for list views; detail views select everything
+TAB_LIST_COLUMNS = "id, tab_number, status, customer_id, created_at"
+EXPORT_PAGE_SIZE = 500
+# Parses PostgREST timestamps, e.g. with 1-6 fractional digits, on any Python
+_CURSOR_DATETIME = TypeAdapter(datetime)
+
+def _parse_tab_cursor(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Decode a tab list cursor into a normalized (created_at, id) pair
+    
+    Both values end up in a PostgREST filter string, so anything other than
+    an ISO datetime and a UUID raises ValueError.
+    """
+    values = decode_cursor(cursor)
+    if values is None:
+        return None
+    if len(values) != 2 or not isinstance(values[0], str):
+        raise ValueError("Invalid cursor")
+    created_at, tab_id = values
+    try:
+        created_at = _CURSOR_DATETIME.validate_python(created_at).isoformat()
+        tab_id = parse_uuid(tab_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    return created_at, tab_id
+
+def _restaurant_tabs_query(
+    restaurant_id: str,
+    columns: str,
+    status: Optional[TabStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    after: Optional[tuple] = None,
+    limit: int = 50
+):
+    """
+    Build a keyset-paginated query over a restaurant's tabs, newest first.
+    
+    `after` is the (created_at, id) of the last row already returned; rows
+    strictly after it in (created_at DESC, id DESC) order come next.
+    """
+    query = supabase.table("tabs").select(columns).eq("restaurant_id", restaurant_id)
+    if status:
+        query = query.eq("status", status.value)
+    if created_from:
+        query = query.gte("created_at", created_from.isoformat())
+    if created_to:
+        query = query.lt("created_at", created_to.isoformat())
+    if after:
+        created_at, tab_id = after
+        query = query.or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{tab_id})'
+        )
+    return query.order("created_at", desc=True).order("id", desc=True).limit(limit)
+
+@router.get("/restaurant/{restaurant_id}", response_model=Union[TabPage, TabDetailPage])
+async def get_restaurant_tabs(
+    restaurant_id: str,
+    status: Optional[TabStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    view: str = Query("list", pattern="^(list|detail)$")
+):
+    """
+    Get a page of tabs for a restaurant, newest first
+    
+    Filters by status and created_at range. Pass `next_cursor` from the
+    previous page as `cursor` to continue. `view=list` returns a lightweight
+    projection; `view=detail` returns full tab rows.
+    """
     try:
-        query = supabase.table("tabs").select("*").eq("restaurant_id", restaurant_id)
-        if status:
-            query = query.eq("status", status.value)
-        result = query.order("created_at", desc=True).execute()
-        return result.data
+        after = _parse_tab_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        columns = TAB_LIST_COLUMNS if view == "list" else "*"
+        query = _restaurant_tabs_query(
+            restaurant_id, columns, status, created_from, created_to, after, limit + 1
+        )
+        result = await execute(query, "tabs.list")
+        rows = result.data
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        
+        page = TabPage if view == "list" else TabDetailPage
+        return page(items=rows, next_cursor=next_cursor)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/restaurant/{restaurant_id}/export")
+async def export_restaurant_tabs(
+    restaurant_id: str,
+    status: Optional[TabStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+):
+    """
+    Stream every matching tab as a JSON array, fetched page by page
+    """
+    async def generate():
+        after = None
+        first = True
+        yield "["
+        while True:
+            query = _restaurant_tabs_query(
+                restaurant_id, "*", status, created_from, created_to, after, EXPORT_PAGE_SIZE
+            )
+            result = await execute(query, "tabs.export")
+            for row in result.data:
+                yield ("" if first else ",") + json.dumps(row, default=str)
+                first = False
+            if len(result.data) < EXPORT_PAGE_SIZE:
+                break
+            after = (result.data[-1]["created_at"], result.data[-1]["id"])
+        yield "]"
+    
+    return StreamingResponse(generate(), media_type="application/json")
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
-from typing import List, Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, WebSocket, WebSocketDisconnect
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 from pydantic import BaseModel
-from app.core.jwt import get_current_user
+from app.core.config import settings
+from app.core.jwt import get_current_user, user_from_token
+from app.core.connections import manager, waiter_channel, restaurant_channel, role_channel, menu_channel, tab_channel
+from app.core.database import supabase, execute
+from app.services.notification_service import notification_service
+from app.utils.helpers import parse_uuid
+import asyncio
 import json
 
 router = APIRouter(prefix="/waiter", tags=["waiter"])
@@ -13,6 +19,7 @@ class OrderStatusUpdate(BaseModel):
 
 class WaiterNotification(BaseModel):
     id: str
+    seq: int  # Monotonic cursor for replay
     type: str  # 'new_order', 'order_ready', 'payment_request', 'assistance'
     message: str
     order_id: Optional[str] = None
@@ -20,34 +27,134 @@ class WaiterNotification(BaseModel):
     created_at: datetime
     is_read: bool = False
 
-# WebSocket connection manager
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+class NotificationsRead(BaseModel):
+    ids: Optional[List[str]] = None
+    up_to_seq: Optional[int] = None
 
-    async def connect(self, waiter_id: str, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections[waiter_id] = websocket
+async def _receive_token(connection, timeout: float) -> Optional[str]:
+    """Wait for an {"action": "auth", "token": "..."} first frame"""
+    try:
+        data = await asyncio.wait_for(connection.receive(), timeout=timeout)
+    except (asyncio.TimeoutError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("action") == "auth" and isinstance(data.get("token"), str):
+        return data["token"]
+    return None
 
-    def disconnect(self, waiter_id: str):
-        if waiter_id in self.active_connections:
-            del self.active_connections[waiter_id]
+def _authenticate(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not token:
+        return None
+    try:
+        return user_from_token(token)
+    except HTTPException:
+        return None
 
-    async def send_personal_message(self, message: str, waiter_id: str):
-        if waiter_id in self.active_connections:
-            await self.active_connections[waiter_id].send_text(message)
+async def _client_tab_channel(channel: Any, restaurant_id: Optional[str]) -> str:
+    """
+    Check a channel a client asked to join and return it in canonical form
 
-manager = ConnectionManager()
+    Only "tab:<id>" channels are accepted, for tabs of the caller's own
+    restaurant; raises ValueError otherwise.
+    """
+    kind, _, tab_id = str(channel).partition(":")
+    if kind != "tab":
+        raise ValueError(f"Cannot subscribe to {channel}")
+    tab_id = parse_uuid(tab_id)
+    result = await execute(
+        supabase.table("tabs").select("restaurant_id").eq("id", tab_id),
+        "tabs.get_restaurant"
+    )
+    if not restaurant_id or not result.data or str(result.data[0]["restaurant_id"]) != str(restaurant_id):
+        raise ValueError(f"Cannot subscribe to {channel}")
+    return tab_channel(tab_id)
 
 @router.websocket("/ws/{waiter_id}")
-async def websocket_endpoint(websocket: WebSocket, waiter_id: str):
-    await manager.connect(waiter_id, websocket)
+async def websocket_endpoint(
+    websocket: WebSocket,
+    waiter_id: str,
+    token: Optional[str] = None,
+    cursor: Optional[int] = None
+):
+    """
+    Real-time channel for a waiter device.
+    
+    The socket must authenticate, either with `token` in the query string
+    or with {"action": "auth", "token": "..."} as its first message within
+    the auth timeout; otherwise it is closed with code 1008. The waiter,
+    restaurant and role all come from the token's claims, and `waiter_id`
+    in the path must match the token's subject.
+    
+    The socket is subscribed to the waiter's own channel and, for a token
+    with a restaurant, to the restaurant, role and menu channels. Clients can
+    send {"action": "subscribe"|"unsubscribe", "channel": "tab:<id>"} to
+    follow individual tabs of their own restaurant; no other channel can be
+    joined by request. The server sends {"type": "ping"} periodically;
+    a client that sends nothing (not even {"type": "pong"}) within the pong
+    timeout is disconnected.
+    
+    A reconnecting client passes the last notification seq it saw as
+    `cursor` (or sends {"action": "resume", "cursor": <seq>}) and is sent
+    only the notifications it missed. Replayed and live messages may
+    overlap briefly, so clients should ignore seqs they have already seen.
+    
+    Clients offering the "billo.msgpack.v1" subprotocol are sent MessagePack
+    binary frames (datetimes as Timestamps); otherwise messages are JSON.
+    """
+    user = _authenticate(token)
+    if token and user is None:
+        # Rejected during the handshake, before the socket is accepted
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    connection = await manager.connect(websocket)
     try:
+        if user is None:
+            user = _authenticate(await _receive_token(connection, settings.WS_AUTH_TIMEOUT_SECONDS))
+        if user is None or user["id"] != waiter_id:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+        
+        restaurant_id = user.get("restaurant_id")
+        role = user.get("role") or "waiter"
+        manager.subscribe(connection, waiter_channel(waiter_id))
+        if restaurant_id:
+            manager.subscribe(connection, restaurant_channel(restaurant_id))
+            manager.subscribe(connection, role_channel(restaurant_id, role))
+            manager.subscribe(connection, menu_channel(restaurant_id))
+        
+        async def replay(since: int):
+            if not restaurant_id:
+                return
+            missed = await notification_service.list_since(restaurant_id, waiter_id, since, limit=500)
+            for notification in missed:
+                connection.send_data(notification)
+        
+        if cursor is not None:
+            await replay(cursor)
         while True:
-            # Keep the connection alive
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        manager.disconnect(waiter_id)
+            try:
+                data = await connection.receive()
+            except ValueError:
+                continue
+            if not isinstance(data, dict) or data.get("type") == "pong":
+                continue
+            
+            action = data.get("action")
+            channel = data.get("channel", "")
+            try:
+                if action == "subscribe":
+                    manager.subscribe(connection, await _client_tab_channel(channel, restaurant_id))
+                elif action == "unsubscribe" and str(channel).startswith("tab:"):
+                    manager.unsubscribe(connection, channel)
+                elif action == "resume":
+                    await replay(int(data.get("cursor") or 0))
+            except ValueError as e:
+                connection.send_data({"type": "error", "message": str(e)})
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: socket already closed by the heartbeat reaper
+        pass
+    finally:
+        await manager.disconnect(connection)
 
 @router.get("/orders", response_model=List[dict])
 async def get_waiter_orders(
@@ -84,17 +191,53 @@ async def update_order_status(
         "updated_at": datetime.utcnow()
     }
 
+def _restaurant_of(current_user: dict) -> str:
+    if not current_user.get("restaurant_id"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not assigned to a restaurant"
+        )
+    return current_user["restaurant_id"]
+
 @router.get("/notifications", response_model=List[WaiterNotification])
 async def get_waiter_notifications(
     unread_only: bool = True,
+    since: int = 0,
+    limit: int = Query(100, ge=1, le=500),
     current_user: dict = Depends(get_current_user)
 ):
     """
-    Get notifications for the current waiter
+    Get notifications for the current waiter with seq greater than `since`,
+    oldest first
     """
-    # TODO: Implement notification retrieval from Supabase
-    # Filter by unread if unread_only is True
-    return []
+    return await notification_service.list_since(
+        _restaurant_of(current_user),
+        current_user["id"],
+        cursor=since,
+        limit=limit,
+        unread_only=unread_only
+    )
+
+@router.post("/notifications/read")
+async def mark_notifications_read(
+    read: NotificationsRead,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Mark several notifications as read at once, by ID or up to a seq
+    
+    Restaurant-wide notifications are marked read for the current waiter only.
+    """
+    try:
+        updated = await notification_service.mark_read(
+            _restaurant_of(current_user),
+            current_user["id"],
+            ids=read.ids,
+            up_to_seq=read.up_to_seq
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return {"status": "success", "updated": updated}
 
 @router.post("/notifications/{notification_id}/read")
 async def mark_notification_read(
@@ -104,15 +247,42 @@ async def mark_notification_read(
     """
     Mark a notification as read
     """
-    # TODO: Implement notification update in Supabase
+    try:
+        await notification_service.mark_read(
+            _restaurant_of(current_user),
+            current_user["id"],
+            ids=[notification_id]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     return {"status": "success"}
 
 # Helper function to send real-time notifications
-async def send_waiter_notification(waiter_id: str, notification: dict):
+async def send_waiter_notification(waiter_id: str, notification: dict, restaurant_id: Optional[str] = None):
     """
     Send a real-time notification to a specific waiter
+    
+    With a restaurant ID the notification is stored first, so the waiter
+    can replay it after reconnecting.
     """
+    restaurant_id = restaurant_id or notification.get("restaurant_id")
+    if restaurant_id:
+        await notification_service.create(restaurant_id, notification, waiter_id=waiter_id)
+        return
     await manager.send_personal_message(
         json.dumps(notification, default=str),
         waiter_id
     )
+
+async def send_restaurant_notification(restaurant_id: str, notification: dict, role: Optional[str] = None):
+    """
+    Send a real-time notification to every connected device of a restaurant,
+    or only to devices of the given role
+    
+    Restaurant-wide notifications are stored for replay; role broadcasts are
+    live only.
+    """
+    if role:
+        await manager.broadcast_to_role(json.dumps(notification, default=str), restaurant_id, role)
+    else:
+        await notification_service.create(restaurant_id, notification)
@@ -1,14 +1,21 @@
+from datetime import datetime
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.endpoints import auth, tabs, orders, payments, restaurants
+from app.endpoints import auth, batch, tabs, orders, payments, restaurants
 from app.endpoints.restaurant import router as restaurant_router
 from app.endpoints.waiter import router as waiter_router
+from app.core.codecs import MessagePackMiddleware, NegotiatedResponse
+from app.core.connections import manager as ws_manager
+from app.core.database import db_metrics
+from app.services.menu_snapshot import menu_snapshot_service
+from app.services.restaurant_service import restaurant_service
 
 app = FastAPI(
     title="Billo API",
     version=settings.APP_VERSION,
-    description="Backend API for Billo Restaurant Tab System"
+    description="Backend API for Billo Restaurant Tab System",
+    default_response_class=NegotiatedResponse
 )
 
 # CORS middleware
@@ -20,6 +27,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# MessagePack for clients that send Accept: application/msgpack
+app.add_middleware(MessagePackMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(tabs.router, prefix="/tabs", tags=["tabs"])
@@ -28,6 +38,16 @@ app.include_router(payments.router, prefix="/payments", tags=["payments"])
 app.include_router(restaurants.router, prefix="/restaurants", tags=["restaurants"])
 app.include_router(restaurant_router, prefix="/api/v1/restaurant", tags=["restaurant"])
 app.include_router(waiter_router, prefix="/api/v1/waiter", tags=["waiter"])
+app.include_router(batch.router, prefix=settings.API_V1_STR, tags=["batch"])
+
+@app.on_event("startup")
+async def start_realtime():
+    await ws_manager.start()
+    await menu_snapshot_service.start(ws_manager.backplane)
+
+@app.on_event("shutdown")
+async def stop_realtime():
+    await ws_manager.stop()
 
 @app.get("/")
 async def root():
@@ -35,4 +55,13 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
\ No newline at end of file
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow(),
+        "caches": {
+            "restaurants": restaurant_service.cache_stats(),
+            "menus": menu_snapshot_service.cache_stats()
+        },
+        "database": db_metrics.snapshot(),
+        "websockets": ws_manager.stats()
+    }
\ No newline at end of file
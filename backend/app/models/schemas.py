@@ -44,21 +44,42 @@ class Tab(TabBase):
     class Config:
         from_attributes = True
 
-class OrderItem(BaseModel):
+class TabSummary(BaseModel):
+    """Lightweight tab projection for list views"""
+    id: str
+    tab_number: int
+    status: TabStatus
+    customer_id: Optional[str] = None
+    created_at: datetime
+
+class TabPage(BaseModel):
+    items: List[TabSummary]
+    next_cursor: Optional[str] = Field(None, description="Pass back as `cursor` to get the next page")
+
+class TabDetailPage(BaseModel):
+    items: List[Tab]
+    next_cursor: Optional[str] = Field(None, description="Pass back as `cursor` to get the next page")
+
+class OrderItemCreate(BaseModel):
     menu_item_id: str
+    quantity: int = Field(1, gt=0)
+    notes: Optional[str] = None
+
+class OrderItem(OrderItemCreate):
     name: str
-    price: int  # in cents
-    quantity: int
+    price: int  # unit price in cents, taken from the menu when ordered
 
 class OrderCreate(BaseModel):
     tab_id: str
-    waiter_id: str
-    items: List[OrderItem]
+    special_instructions: Optional[str] = None
+    items: List[OrderItemCreate] = Field(..., min_length=1)
 
 class Order(OrderCreate):
     id: str
+    waiter_id: Optional[str] = None  # set from the authenticated waiter
     status: OrderStatus = OrderStatus.PLACED
-    total: int
+    items: List[OrderItem]
+    total: int  # in cents
     created_at: datetime
     updated_at: datetime
 
@@ -71,4 +92,30 @@ class PaymentCreate(BaseModel):
 class Payment(PaymentCreate):
     id: str
     status: PaymentStatus = PaymentStatus.PENDING
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+class MenuItemCreate(BaseModel):
+    name: str
+    description: str
+    price: int  # in cents
+    category: str
+    is_available: bool = True
+    image_url: Optional[str] = None
+
+class MenuItem(MenuItemCreate):
+    id: str
+    restaurant_id: str
+    created_at: datetime
+    updated_at: datetime
+
+class MenuItemAvailability(BaseModel):
+    is_available: bool
+
+class MenuImportError(BaseModel):
+    row: int  # 1-based row number in the upload
+    errors: List[str]
+
+class MenuImportResult(BaseModel):
+    created: int
+    failed: int
+    errors: List[MenuImportError] = []
@@ -1,7 +1,12 @@
 from typing import Optional, Dict, Any
+import httpx
 from fastapi import HTTPException, status
 from supabase import create_client, Client as SupabaseClient
+from supabase_auth import SyncGoTrueClient
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.database import execute, run_db
+from app.core.jwt import verify_token
 
 class AuthService:
     def __init__(self):
@@ -9,6 +14,51 @@ class AuthService:
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_ROLE_KEY
         )
+        self.profile_cache = TTLCache(
+            ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS,
+            max_size=settings.TOKEN_CACHE_MAX_SIZE
+        )
+        # Connection pool shared by the per-call auth clients
+        self._auth_http = httpx.Client()
+    
+    def _auth_client(self) -> SyncGoTrueClient:
+        """
+        A fresh auth client for a single sign-in or sign-up
+        
+        Auth clients keep the signed-in session on the instance, and on the
+        shared client that session would also replace the service-role key
+        on its table queries. Calls run concurrently on the database thread
+        pool, so each one gets its own client.
+        """
+        key = settings.SUPABASE_SERVICE_ROLE_KEY
+        return SyncGoTrueClient(
+            url=f"{settings.SUPABASE_URL}/auth/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            auto_refresh_token=False,
+            persist_session=False,
+            http_client=self._auth_http
+        )
+    
+    async def get_profile(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get a user's profile row, cached for a short TTL
+        """
+        profile = self.profile_cache.get(user_id)
+        if profile is None:
+            query = self.supabase.table('profiles') \
+                .select('*') \
+                .eq('id', user_id) \
+                .single()
+            result = await execute(query, "profiles.get")
+            profile = result.data or {}
+            self.profile_cache.set(user_id, profile)
+        return profile
+    
+    def invalidate_profile(self, user_id: str):
+        """
+        Drop a cached profile after its role or restaurant changes
+        """
+        self.profile_cache.invalidate(user_id)
     
     async def authenticate_user(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """
@@ -16,26 +66,24 @@ class AuthService:
         Returns user data if successful, None otherwise
         """
         try:
-            response = self.supabase.auth.sign_in_with_password({
-                "email": email,
-                "password": password
-            })
+            response = await run_db(
+                self._auth_client().sign_in_with_password,
+                {"email": email, "password": password},
+                name="auth.sign_in"
+            )
             
             user = response.user
             session = response.session
             
             # Get user profile with role information
-            profile = self.supabase.table('profiles') \
-                .select('*') \
-                .eq('id', user.id) \
-                .single() \
-                .execute()
+            self.invalidate_profile(user.id)
+            profile = await self.get_profile(user.id)
             
             return {
                 "id": user.id,
                 "email": user.email,
-                "role": profile.data.get('role', 'customer'),
-                "restaurant_id": profile.data.get('restaurant_id'),
+                "role": profile.get('role', 'customer'),
+                "restaurant_id": profile.get('restaurant_id'),
                 "session": session
             }
             
@@ -43,49 +91,52 @@ class AuthService:
             print(f"Authentication error: {str(e)}")
             return None
     
-    def get_user_by_session(self, session_token: str) -> Optional[Dict[str, Any]]:
+    async def get_user_by_session(self, session_token: str) -> Optional[Dict[str, Any]]:
         """
         Get user by session token (for web)
+        
+        The token is verified locally and the profile comes from the
+        short-lived profile cache, so no Supabase auth call is made.
         """
         try:
             # Get user from session
-            response = self.supabase.auth.get_user(session_token)
-            user = response.user
+            claims = verify_token(session_token)
+            user_id = claims["sub"]
             
             # Get user profile with role information
-            profile = self.supabase.table('profiles') \
-                .select('*') \
-                .eq('id', user.id) \
-                .single() \
-                .execute()
+            profile = await self.get_profile(user_id)
             
             return {
-                "id": user.id,
-                "email": user.email,
-                "role": profile.data.get('role', 'customer'),
-                "restaurant_id": profile.data.get('restaurant_id')
+                "id": user_id,
+                "email": claims.get("email") or profile.get('email'),
+                "role": profile.get('role', 'customer'),
+                "restaurant_id": profile.get('restaurant_id')
             }
             
         except Exception as e:
             print(f"Session validation error: {str(e)}")
             return None
     
-    def create_user(self, email: str, password: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_user(self, email: str, password: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new user with the given email, password, and additional data
         """
         try:
             # Create auth user
-            auth_response = self.supabase.auth.sign_up({
-                "email": email,
-                "password": password,
-                "options": {
-                    "data": {
-                        "full_name": user_data.get('full_name', ''),
-                        "role": user_data.get('role', 'customer')
+            auth_response = await run_db(
+                self._auth_client().sign_up,
+                {
+                    "email": email,
+                    "password": password,
+                    "options": {
+                        "data": {
+                            "full_name": user_data.get('full_name', ''),
+                            "role": user_data.get('role', 'customer')
+                        }
                     }
-                }
-            })
+                },
+                name="auth.sign_up"
+            )
             
             # Create user profile
             profile_data = {
@@ -95,7 +146,7 @@ class AuthService:
                 "restaurant_id": user_data.get('restaurant_id')
             }
             
-            self.supabase.table('profiles').insert(profile_data).execute()
+            await execute(self.supabase.table('profiles').insert(profile_data), "profiles.insert")
             
             return {
                 "id": auth_response.user.id,
@@ -0,0 +1,107 @@
+from datetime import datetime, time
+from typing import Optional, Dict, Any, List
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import supabase, execute
+from app.utils.business_hours import WeeklySchedule
+
+# Used for restaurants that have not configured any business hours
+DEFAULT_OPEN_TIME = time(8, 0)
+DEFAULT_CLOSE_TIME = time(22, 0)
+
+
+class BusinessHoursService:
+    """
+    Open/closed checks against each restaurant's configured business hours.
+
+    A restaurant's weekly hours are compiled once into a WeeklySchedule and
+    cached until they are saved again, so the scan path only does a binary
+    search per request.
+    """
+
+    def __init__(self):
+        self.cache = TTLCache(
+            ttl_seconds=settings.BUSINESS_HOURS_CACHE_TTL_SECONDS,
+            max_size=settings.RESTAURANT_CACHE_MAX_SIZE
+        )
+
+    async def get_schedule(self, restaurant_id: str) -> WeeklySchedule:
+        """
+        Get the compiled weekly schedule for a restaurant
+        """
+        schedule = self.cache.get(restaurant_id)
+        if schedule is None:
+            query = supabase.table("business_hours") \
+                .select("day_of_week, open_time, close_time, is_closed") \
+                .eq("restaurant_id", restaurant_id)
+            result = await execute(query, "business_hours.get")
+            schedule = self.compile(result.data)
+            self.cache.set(restaurant_id, schedule)
+        return schedule
+
+    async def is_open(self, restaurant_id: str, moment: Optional[datetime] = None) -> bool:
+        """
+        Check whether a restaurant is open at the given moment (default: now, UTC)
+        """
+        schedule = await self.get_schedule(restaurant_id)
+        return schedule.is_open(moment or datetime.utcnow())
+
+    async def next_opening(self, restaurant_id: str, moment: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Get the next time a restaurant opens after the given moment (default: now, UTC)
+        """
+        schedule = await self.get_schedule(restaurant_id)
+        return schedule.next_opening(moment or datetime.utcnow())
+
+    async def save_hours(self, restaurant_id: str, rows: List[Dict[str, Any]]) -> WeeklySchedule:
+        """
+        Replace a restaurant's business hours and recompile its schedule
+
+        The old rows are deleted and the new ones inserted by the
+        `replace_business_hours` database function (supabase/migrations) in
+        one transaction, so a failed save leaves the previous hours intact.
+        """
+        self.invalidate(restaurant_id)
+        await execute(
+            supabase.rpc("replace_business_hours", {"p_restaurant_id": restaurant_id, "p_hours": rows}),
+            "business_hours.replace"
+        )
+
+        schedule = self.compile(rows)
+        self.cache.set(restaurant_id, schedule)
+        return schedule
+
+    def invalidate(self, restaurant_id: Optional[str] = None):
+        """
+        Drop a cached schedule, or every cached schedule if no ID is given
+        """
+        if restaurant_id is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(restaurant_id)
+
+    @staticmethod
+    def compile(rows: Optional[List[Dict[str, Any]]]) -> WeeklySchedule:
+        """
+        Compile business_hours rows into a schedule.
+
+        day_of_week follows Postgres EXTRACT(DOW): 0 is Sunday. Restaurants
+        without any rows fall back to the default daily hours.
+        """
+        if not rows:
+            return WeeklySchedule.from_day_hours(
+                {day: (DEFAULT_OPEN_TIME, DEFAULT_CLOSE_TIME) for day in range(7)}
+            )
+
+        hours = {}
+        for row in rows:
+            weekday = (int(row["day_of_week"]) + 6) % 7
+            if row.get("is_closed"):
+                hours[weekday] = None
+            else:
+                hours[weekday] = (row.get("open_time"), row.get("close_time"))
+        return WeeklySchedule.from_day_hours(hours)
+
+# Create a single instance of the business hours service
+business_hours_service = BusinessHoursService()
@@ -0,0 +1,195 @@
+import codecs
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.connections import manager, menu_channel
+from app.core.database import supabase, execute
+from app.models.schemas import MenuItemCreate
+from app.services.menu_snapshot import menu_snapshot_service
+
+# Rows per insert statement during bulk imports
+IMPORT_BATCH_SIZE = 100
+# Upper bound on rows accepted in one import
+IMPORT_MAX_ROWS = 5000
+# Bytes read per chunk when checking an upload's encoding
+IMPORT_CHUNK_SIZE = 64 * 1024
+IMPORT_ENCODING = "utf-8-sig"
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    ]
+
+
+class MenuService:
+    """
+    Writes to the menu_items table, including batched bulk imports.
+
+    Every write is announced on the restaurant's menu channel so cached
+    snapshots on all workers and connected waiter/customer views follow it.
+    """
+
+    async def _announce_item(self, restaurant_id: str, item: Dict[str, Any]):
+        menu_snapshot_service.apply_item(restaurant_id, item)
+        await manager.publish(
+            menu_channel(restaurant_id),
+            json.dumps({"type": "menu_item_updated", "item": item}, default=str)
+        )
+
+    async def _announce_reload(self, restaurant_id: str):
+        menu_snapshot_service.invalidate(restaurant_id)
+        await manager.publish(menu_channel(restaurant_id), json.dumps({"type": "menu_reload"}))
+
+    async def create_item(self, restaurant_id: str, item: MenuItemCreate) -> Dict[str, Any]:
+        """
+        Insert a single menu item
+        """
+        result = await execute(
+            supabase.table("menu_items").insert({**item.dict(), "restaurant_id": restaurant_id}),
+            "menu_items.insert"
+        )
+        item = result.data[0]
+        await self._announce_item(restaurant_id, item)
+        return item
+
+    async def set_availability(self, restaurant_id: str, item_id: str, is_available: bool) -> Optional[Dict[str, Any]]:
+        """
+        Mark an item available or sold out ("86" it), returning None if the
+        item does not belong to the restaurant
+        """
+        query = supabase.table("menu_items") \
+            .update({"is_available": is_available, "updated_at": datetime.utcnow().isoformat()}) \
+            .eq("id", item_id) \
+            .eq("restaurant_id", restaurant_id)
+        result = await execute(query, "menu_items.set_availability")
+        if not result.data:
+            return None
+
+        item = result.data[0]
+        await self._announce_item(restaurant_id, item)
+        return item
+
+    async def bulk_create(
+        self,
+        restaurant_id: str,
+        rows: Iterable[Tuple[int, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Validate and insert (row_number, raw_row) pairs in chunked batches.
+
+        Rows are validated in a single pass as they are read; valid rows are
+        inserted IMPORT_BATCH_SIZE at a time. Invalid rows, and every row of a
+        batch the database rejects, are reported with their row number.
+        """
+        created = 0
+        errors: List[Dict[str, Any]] = []
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+
+        async def flush():
+            nonlocal created
+            if not batch:
+                return
+            try:
+                await execute(
+                    supabase.table("menu_items").insert([data for _, data in batch]),
+                    "menu_items.bulk_insert"
+                )
+                created += len(batch)
+            except Exception as e:
+                errors.extend({"row": row, "errors": [f"insert failed: {e}"]} for row, _ in batch)
+            batch.clear()
+
+        for count, (row_number, raw) in enumerate(rows, start=1):
+            if count > IMPORT_MAX_ROWS:
+                errors.append({"row": row_number, "errors": [f"import limited to {IMPORT_MAX_ROWS} rows"]})
+                break
+
+            if isinstance(raw, Exception):
+                errors.append({"row": row_number, "errors": [str(raw)]})
+                continue
+            if not isinstance(raw, dict):
+                errors.append({"row": row_number, "errors": ["row must be an object"]})
+                continue
+            if None in raw:
+                # csv.DictReader files fields beyond the header under None
+                errors.append({"row": row_number, "errors": ["row has more fields than the header"]})
+                continue
+            try:
+                item = MenuItemCreate(**{k: v for k, v in raw.items() if v not in ("", None)})
+            except ValidationError as e:
+                errors.append({"row": row_number, "errors": _validation_messages(e)})
+                continue
+            except (TypeError, ValueError) as e:
+                errors.append({"row": row_number, "errors": [str(e)]})
+                continue
+
+            batch.append((row_number, {**item.dict(), "restaurant_id": restaurant_id}))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush()
+        await flush()
+        if created:
+            await self._announce_reload(restaurant_id)
+
+        return {"created": created, "failed": len(errors), "errors": errors}
+
+    @staticmethod
+    def check_encoding(stream: IO[bytes]):
+        """
+        Check that a seekable upload is valid UTF-8 before any row is imported,
+        raising ValueError if not. Reads in chunks and rewinds the stream.
+        """
+        decoder = codecs.getincrementaldecoder(IMPORT_ENCODING)()
+        offset = 0
+        try:
+            for chunk in iter(lambda: stream.read(IMPORT_CHUNK_SIZE), b""):
+                decoder.decode(chunk)
+                offset += len(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Upload is not valid UTF-8 (byte {offset + e.start})")
+        finally:
+            stream.seek(0)
+
+    @staticmethod
+    def parse_csv(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (row_number, row) pairs from a CSV upload with a header row
+        """
+        text = io.TextIOWrapper(stream, encoding=IMPORT_ENCODING, newline="")
+        reader = csv.DictReader(text)
+        row_number = 0
+        while True:
+            row_number += 1
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader cannot resume after a malformed record
+                yield row_number, ValueError(f"invalid CSV: {e}")
+                return
+            yield row_number, row
+
+    @staticmethod
+    def parse_ndjson(stream: IO[bytes]) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (row_number, row) pairs from newline-delimited JSON, skipping blank lines
+        """
+        text = io.TextIOWrapper(stream, encoding=IMPORT_ENCODING)
+        for row_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield row_number, json.loads(line)
+            except ValueError as e:
+                yield row_number, ValueError(f"invalid JSON: {e}")
+
+# Create a single instance of the menu service
+menu_service = MenuService()
@@ -0,0 +1,262 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import supabase, execute
+from app.core.pubsub import Backplane
+
+logger = logging.getLogger(__name__)
+
+# Columns included in the public menu
+MENU_COLUMNS = "id, restaurant_id, name, description, price, category, is_available, image_url, created_at, updated_at"
+# Width of the price buckets used by the menu index, in cents
+PRICE_BUCKET_CENTS = 500
+# Builds attempted before serving an uncached snapshot of a changing menu
+MAX_BUILD_ATTEMPTS = 3
+
+
+def _version_of(timestamp: Any) -> int:
+    """Convert an updated_at value to a millisecond version number"""
+    if not timestamp:
+        return 0
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return int(timestamp.timestamp() * 1000)
+
+
+class MenuSnapshot:
+    """
+    A restaurant's whole menu, serialized once.
+
+    `version` is the newest updated_at of any item (in ms), so it moves
+    whenever an item changes and can be used as the `since` value of a delta
+    request. `etag` is derived from the serialized bytes.
+
+    Items are also indexed by position under category, availability and
+    price bucket, so filtered menu queries never scan the whole menu.
+    Snapshots are immutable; `with_item` returns an updated copy.
+    """
+
+    __slots__ = (
+        "restaurant_id", "version", "etag", "items", "body", "gzipped", "_versions",
+        "_by_id", "_by_category", "_available", "_by_bucket"
+    )
+
+    def __init__(self, restaurant_id: str, items: List[Dict[str, Any]]):
+        self.restaurant_id = restaurant_id
+        self.items = items
+        self._versions = [_version_of(item.get("updated_at")) for item in items]
+        self.version = max(self._versions, default=0)
+        self.body = json.dumps(
+            {"restaurant_id": restaurant_id, "version": self.version, "items": items},
+            default=str,
+            separators=(",", ":")
+        ).encode()
+        self.gzipped = gzip.compress(self.body, compresslevel=6)
+        self.etag = f'W/"{hashlib.sha1(self.body).hexdigest()[:20]}"'
+
+        self._by_id: Dict[str, int] = {}
+        self._by_category: Dict[str, List[int]] = {}
+        self._available: Set[int] = set()
+        self._by_bucket: Dict[int, List[int]] = {}
+        for position, item in enumerate(items):
+            self._by_id[item["id"]] = position
+            self._by_category.setdefault(item.get("category"), []).append(position)
+            if item.get("is_available", True):
+                self._available.add(position)
+            self._by_bucket.setdefault(int(item.get("price") or 0) // PRICE_BUCKET_CENTS, []).append(position)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._by_category)
+
+    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        position = self._by_id.get(item_id)
+        return None if position is None else self.items[position]
+
+    def query(
+        self,
+        category: Optional[str] = None,
+        available: Optional[bool] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Items matching every given filter, in menu order. Prices are in cents
+        and the bounds are inclusive.
+        """
+        candidates: Optional[Set[int]] = None
+
+        def narrow(positions):
+            nonlocal candidates
+            positions = set(positions)
+            candidates = positions if candidates is None else candidates & positions
+
+        if category is not None:
+            narrow(self._by_category.get(category, ()))
+        if available is True:
+            narrow(self._available)
+        elif available is False:
+            narrow(set(range(len(self.items))) - self._available)
+        if min_price is not None or max_price is not None:
+            low = 0 if min_price is None else min_price // PRICE_BUCKET_CENTS
+            high = max(self._by_bucket, default=0) if max_price is None else max_price // PRICE_BUCKET_CENTS
+            in_buckets = []
+            for bucket in range(low, high + 1):
+                in_buckets.extend(self._by_bucket.get(bucket, ()))
+            narrow(
+                p for p in in_buckets
+                if (min_price is None or self.items[p]["price"] >= min_price)
+                and (max_price is None or self.items[p]["price"] <= max_price)
+            )
+
+        if candidates is None:
+            return list(self.items)
+        return [self.items[p] for p in sorted(candidates)]
+
+    def with_item(self, item: Dict[str, Any]) -> "MenuSnapshot":
+        """Return a copy of the snapshot with one item added or replaced"""
+        items = list(self.items)
+        position = self._by_id.get(item["id"])
+        if position is None:
+            items.append(item)
+        else:
+            items[position] = {**items[position], **item}
+        return MenuSnapshot(self.restaurant_id, items)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Check an If-None-Match header against this snapshot's ETag"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags or self.etag[2:] in tags
+
+    def changes_since(self, since: int) -> Dict[str, Any]:
+        """
+        Items updated after the given version, plus the IDs of every current
+        item so clients can drop anything that is no longer on the menu
+        """
+        return {
+            "restaurant_id": self.restaurant_id,
+            "version": self.version,
+            "since": since,
+            "items": [item for item, version in zip(self.items, self._versions) if version > since],
+            "item_ids": [item["id"] for item in self.items]
+        }
+
+
+class MenuSnapshotService:
+    """
+    Keeps one prebuilt MenuSnapshot per restaurant.
+
+    Menu writes through MenuService publish a message on the restaurant's
+    menu channel. Every worker listens on the backplane and patches (or
+    drops) its cached snapshot, and the same message reaches waiter and
+    customer sockets subscribed to the channel. MENU_SNAPSHOT_TTL_SECONDS
+    bounds staleness if a message is lost. Concurrent misses for the same
+    restaurant share a single rebuild.
+
+    Every update or invalidation bumps the restaurant's generation. A build
+    that was already reading the database when that happened may have missed
+    the change, so it is discarded and the menu read again.
+    """
+
+    def __init__(self):
+        self.cache = TTLCache(
+            ttl_seconds=settings.MENU_SNAPSHOT_TTL_SECONDS,
+            max_size=settings.RESTAURANT_CACHE_MAX_SIZE
+        )
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generations: Dict[str, int] = {}
+        # Bumped by invalidate() without an ID, which affects every restaurant
+        self._epoch = 0
+
+    def _generation(self, restaurant_id: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(restaurant_id, 0)
+
+    def _bump(self, restaurant_id: str):
+        self._generations[restaurant_id] = self._generations.get(restaurant_id, 0) + 1
+
+    async def get_snapshot(self, restaurant_id: str) -> MenuSnapshot:
+        """
+        Get the current menu snapshot for a restaurant, building it if needed
+        """
+        snapshot = self.cache.get(restaurant_id)
+        if snapshot is not None:
+            return snapshot
+
+        # Locks are kept, so every caller for a restaurant shares the same one
+        lock = self._locks.setdefault(restaurant_id, asyncio.Lock())
+        async with lock:
+            snapshot = self.cache.get(restaurant_id)
+            if snapshot is not None:
+                return snapshot
+            for _ in range(MAX_BUILD_ATTEMPTS):
+                generation = self._generation(restaurant_id)
+                snapshot = await self._build(restaurant_id)
+                if self._generation(restaurant_id) == generation:
+                    self.cache.set(restaurant_id, snapshot)
+                    break
+                logger.info(f"Menu of {restaurant_id} changed during a snapshot build; rebuilding")
+        # After repeated changes the last build is served but not cached
+        return snapshot
+
+    async def _build(self, restaurant_id: str) -> MenuSnapshot:
+        query = supabase.table("menu_items") \
+            .select(MENU_COLUMNS) \
+            .eq("restaurant_id", restaurant_id) \
+            .order("category") \
+            .order("name")
+        result = await execute(query, "menu_items.snapshot")
+        return MenuSnapshot(restaurant_id, result.data or [])
+
+    async def start(self, backplane: Backplane):
+        """Begin applying menu updates published by any worker"""
+        await backplane.start(self._on_message)
+
+    async def _on_message(self, channel: str, message: str):
+        kind, _, restaurant_id = channel.partition(":")
+        if kind != "menu":
+            return
+        try:
+            event = json.loads(message)
+        except ValueError:
+            logger.warning(f"Ignoring malformed menu update on {channel}")
+            return
+        if event.get("type") == "menu_item_updated" and event.get("item"):
+            self.apply_item(restaurant_id, event["item"])
+        else:
+            self.invalidate(restaurant_id)
+
+    def apply_item(self, restaurant_id: str, item: Dict[str, Any]):
+        """
+        Patch a single item into a cached snapshot without touching the database
+        """
+        self._bump(restaurant_id)
+        snapshot = self.cache.get(restaurant_id)
+        if snapshot is not None:
+            self.cache.set(restaurant_id, snapshot.with_item(item))
+
+    def invalidate(self, restaurant_id: Optional[str] = None):
+        """
+        Drop a restaurant's snapshot, or every snapshot if no ID is given
+        """
+        if restaurant_id is None:
+            self._epoch += 1
+            self.cache.clear()
+        else:
+            self._bump(restaurant_id)
+            self.cache.invalidate(restaurant_id)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the snapshot cache"""
+        return self.cache.stats()
+
+# Create a single instance of the menu snapshot service
+menu_snapshot_service = MenuSnapshotService()
@@ -0,0 +1,105 @@
+import json
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+from app.core.connections import manager, restaurant_channel, waiter_channel
+from app.core.database import supabase, execute
+from app.utils.helpers import parse_uuid
+
+# Columns stored for each notification, besides the generated id/seq
+NOTIFICATION_FIELDS = ("type", "message", "order_id", "table_number")
+
+
+class NotificationService:
+    """
+    Durable log of waiter notifications with replay by cursor.
+
+    Rows live in the `waiter_notifications` table and read state in
+    `waiter_notification_reads`, one receipt per waiter and notification
+    (supabase/migrations). A NULL waiter_id marks a restaurant-wide
+    notification, which every waiter of the restaurant reads separately.
+
+    `seq` increases monotonically per restaurant and is assigned under a
+    per-restaurant counter lock, so rows become visible in seq order and it
+    doubles as the replay cursor: a reconnecting client sends the last seq it
+    saw and receives only newer rows.
+    """
+
+    async def create(
+        self,
+        restaurant_id: str,
+        notification: Dict[str, Any],
+        waiter_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a notification and push it to connected sockets
+        """
+        row = {
+            "restaurant_id": restaurant_id,
+            "waiter_id": waiter_id,
+            "payload": {k: v for k, v in notification.items() if k not in NOTIFICATION_FIELDS},
+            "created_at": datetime.utcnow().isoformat(),
+            **{k: notification.get(k) for k in NOTIFICATION_FIELDS}
+        }
+        result = await execute(
+            supabase.table("waiter_notifications").insert(json.loads(json.dumps(row, default=str))),
+            "notifications.insert"
+        )
+        stored = {**result.data[0], "is_read": False}
+
+        channel = waiter_channel(waiter_id) if waiter_id else restaurant_channel(restaurant_id)
+        await manager.publish(channel, json.dumps(stored, default=str))
+        return stored
+
+    async def list_since(
+        self,
+        restaurant_id: str,
+        waiter_id: str,
+        cursor: int = 0,
+        limit: int = 100,
+        unread_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Notifications for a waiter (their own plus restaurant-wide) with seq > cursor,
+        oldest first, with that waiter's read state
+
+        Raises ValueError unless both IDs are UUIDs.
+        """
+        params = {
+            "p_restaurant_id": parse_uuid(restaurant_id),
+            "p_waiter_id": parse_uuid(waiter_id),
+            "p_cursor": cursor,
+            "p_limit": limit,
+            "p_unread_only": unread_only
+        }
+        result = await execute(supabase.rpc("list_waiter_notifications", params), "notifications.list")
+        return result.data or []
+
+    async def mark_read(
+        self,
+        restaurant_id: str,
+        waiter_id: str,
+        ids: Optional[List[str]] = None,
+        up_to_seq: Optional[int] = None
+    ) -> int:
+        """
+        Mark notifications the waiter can see (including restaurant-wide ones)
+        as read for that waiter, either by ID or everything up to and including
+        a seq. Returns the number of notifications newly marked read.
+
+        Raises ValueError unless the IDs are UUIDs.
+        """
+        if not ids and up_to_seq is None:
+            return 0
+
+        params = {
+            "p_restaurant_id": parse_uuid(restaurant_id),
+            "p_waiter_id": parse_uuid(waiter_id),
+            "p_ids": [parse_uuid(notification_id) for notification_id in ids] if ids else None,
+            "p_up_to_seq": up_to_seq
+        }
+        result = await execute(supabase.rpc("mark_waiter_notifications_read", params), "notifications.mark_read")
+        return result.data or 0
+
+# Create a single instance of the notification service
+notification_service = NotificationService()
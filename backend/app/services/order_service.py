@@ -0,0 +1,126 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.database import supabase, execute
+from app.models.schemas import OrderCreate, OrderStatus, TabStatus
+from app.services.menu_snapshot import menu_snapshot_service
+from app.services.notification_service import notification_service
+from app.utils.helpers import from_cents, to_cents
+
+logger = logging.getLogger(__name__)
+
+# Tabs that can no longer take orders
+CLOSED_TAB_STATUSES = (TabStatus.PAID.value, TabStatus.CANCELLED.value)
+# The orders and order_items tables' status for a newly placed order
+# (OrderStatus.PLACED in the API)
+PLACED_ROW_STATUS = "pending"
+
+
+class OrderService:
+    """
+    Places orders against a tab.
+
+    Unit prices and names come from the restaurant's menu snapshot and the
+    total is computed here in integer cents (menu prices are DECIMAL(10,2)
+    and are converted exactly); client-supplied prices are never trusted.
+    The order row and all its item rows are written by the `place_order`
+    database function (supabase/migrations), which runs as a single
+    transaction, so placing an order costs the same number of round trips
+    however many items it has.
+    """
+
+    async def place_order(
+        self,
+        order: OrderCreate,
+        restaurant_id: str,
+        waiter_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate and place an order on one of the restaurant's tabs, returning
+        it with its items and total.
+
+        Raises LookupError if the tab does not exist or belongs to another
+        restaurant and ValueError if it is closed or any item is unknown or
+        sold out.
+        """
+        result = await execute(
+            supabase.table("tabs")
+                .select("id, restaurant_id, status")
+                .eq("id", order.tab_id)
+                .eq("restaurant_id", restaurant_id),
+            "tabs.get_for_order"
+        )
+        if not result.data:
+            raise LookupError("Tab not found")
+        tab = result.data[0]
+        if tab["status"] in CLOSED_TAB_STATUSES:
+            raise ValueError(f"Tab is {tab['status']} and cannot take new orders")
+
+        menu = await menu_snapshot_service.get_snapshot(tab["restaurant_id"])
+        now = datetime.utcnow().isoformat()
+        order_id = str(uuid.uuid4())
+        items: List[Dict[str, Any]] = []
+        unavailable: List[str] = []
+        for line in order.items:
+            menu_item = menu.get_item(line.menu_item_id)
+            if menu_item is None or not menu_item.get("is_available", True):
+                unavailable.append(line.menu_item_id)
+                continue
+            items.append({
+                "id": str(uuid.uuid4()),
+                "order_id": order_id,
+                "menu_item_id": line.menu_item_id,
+                "name": menu_item["name"],
+                "price": to_cents(menu_item["price"]),
+                "quantity": line.quantity,
+                "notes": line.notes,
+                "created_at": now
+            })
+        if unavailable:
+            raise ValueError(f"Items not available: {', '.join(unavailable)}")
+
+        placed = {
+            "id": order_id,
+            "tab_id": order.tab_id,
+            "waiter_id": waiter_id,
+            "status": OrderStatus.PLACED.value,
+            "special_instructions": order.special_instructions,
+            "total": sum(item["price"] * item["quantity"] for item in items),
+            "created_at": now,
+            "updated_at": now
+        }
+        order_row = {
+            **{k: placed[k] for k in ("id", "tab_id", "waiter_id", "special_instructions", "created_at", "updated_at")},
+            "status": PLACED_ROW_STATUS,
+            "total_amount": from_cents(placed["total"])
+        }
+        item_rows = [
+            {
+                **{k: item[k] for k in ("id", "menu_item_id", "name", "quantity", "created_at")},
+                "unit_price": from_cents(item["price"]),
+                "special_requests": item["notes"],
+                "status": PLACED_ROW_STATUS
+            }
+            for item in items
+        ]
+        await execute(
+            supabase.rpc("place_order", {"p_order": order_row, "p_items": item_rows}),
+            "orders.place"
+        )
+
+        try:
+            await notification_service.create(
+                tab["restaurant_id"],
+                {"type": "new_order", "message": f"New order with {len(items)} item(s)", "order_id": order_id},
+                waiter_id=waiter_id
+            )
+        except Exception as e:
+            # The order is already committed, so do not fail the request over it
+            logger.error(f"Failed to notify waiters of order {order_id}: {e}")
+
+        return {**placed, "items": items}
+
+# Create a single instance of the order service
+order_service = OrderService()
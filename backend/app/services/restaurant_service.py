@@ -0,0 +1,72 @@
+from typing import Optional, Dict, Any
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import supabase, execute
+
+
+class RestaurantService:
+    """
+    Read access to restaurant rows, backed by an in-memory TTL cache.
+
+    Restaurant rows rarely change, so the customer scan path can usually
+    skip the database. Anything that writes to a restaurant must call
+    `invalidate` so the next read picks up the new row.
+    """
+
+    def __init__(self):
+        self.cache = TTLCache(
+            ttl_seconds=settings.RESTAURANT_CACHE_TTL_SECONDS,
+            max_size=settings.RESTAURANT_CACHE_MAX_SIZE
+        )
+
+    async def get_restaurant(self, restaurant_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a restaurant by ID, returning None if it does not exist
+        """
+        restaurant = self.cache.get(restaurant_id)
+        if restaurant is not None:
+            return restaurant
+
+        result = await execute(
+            supabase.table("restaurants").select("*").eq("id", restaurant_id),
+            "restaurants.get"
+        )
+        if not result.data:
+            return None
+
+        restaurant = result.data[0]
+        self.cache.set(restaurant_id, restaurant)
+        return restaurant
+
+    async def update_restaurant(self, restaurant_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update a restaurant and refresh its cache entry
+        """
+        self.invalidate(restaurant_id)
+        result = await execute(
+            supabase.table("restaurants").update(changes).eq("id", restaurant_id),
+            "restaurants.update"
+        )
+        if not result.data:
+            return None
+
+        restaurant = result.data[0]
+        self.cache.set(restaurant_id, restaurant)
+        return restaurant
+
+    def invalidate(self, restaurant_id: Optional[str] = None):
+        """
+        Drop a cached restaurant, or every cached restaurant if no ID is given
+        """
+        if restaurant_id is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(restaurant_id)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the restaurant cache"""
+        return self.cache.stats()
+
+# Create a single instance of the restaurant service
+restaurant_service = RestaurantService()
@@ -0,0 +1,27 @@
+from datetime import date, datetime
+from typing import Optional
+
+from app.core.database import supabase, execute
+
+
+class TabNumberAllocator:
+    """
+    Hands out sequential tab numbers per restaurant per day.
+
+    Numbers come from the `next_tab_number` RPC (supabase/migrations), which
+    increments a per-restaurant, per-day counter row in one statement. The
+    database serialises concurrent calls, so scans handled by different API
+    workers never share a number and a QR scan costs a single round trip.
+    """
+
+    async def next_number(self, restaurant_id: str, day: Optional[date] = None) -> int:
+        """
+        Reserve and return the next tab number for a restaurant on a given day
+        """
+        day = day or datetime.utcnow().date()
+        params = {"p_restaurant_id": restaurant_id, "p_day": day.isoformat()}
+        result = await execute(supabase.rpc("next_tab_number", params), "tabs.next_number")
+        return result.data
+
+# Create a single instance of the allocator
+tab_number_allocator = TabNumberAllocator()
@@ -0,0 +1,58 @@
+import base64
+import json
+import uuid
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional, Tuple
+
+
+def parse_uuid(value: Any) -> str:
+    """
+    Return `value` as a canonical UUID string, raising ValueError if it is not one
+    """
+    try:
+        return str(uuid.UUID(str(value)))
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError(f"Invalid UUID: {value!r}")
+
+
+def to_cents(amount: Any) -> int:
+    """
+    Convert a money amount (e.g. a DECIMAL(10,2) column read as 12.5) to
+    integer cents exactly, raising ValueError if it has fractions of a cent
+    """
+    try:
+        cents = Decimal(str(amount)) * 100
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    if not cents.is_finite() or cents != cents.to_integral_value():
+        raise ValueError(f"Invalid amount: {amount!r}")
+    return int(cents)
+
+
+def from_cents(cents: int) -> str:
+    """Format integer cents as an exact decimal string for a DECIMAL(10,2) column"""
+    return str(Decimal(cents).scaleb(-2).quantize(Decimal("0.01")))
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode keyset pagination values (e.g. created_at, id) as an opaque cursor
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Any, ...]]:
+    """
+    Decode a cursor produced by encode_cursor, raising ValueError if it is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return tuple(values)
@@ -0,0 +1,17 @@
+-- Insert an order and all of its items in a single transaction.
+--
+-- Called through PostgREST RPC by OrderService.place_order. IDs, prices and
+-- the total are computed by the API, so the function only has to write the
+-- rows: one INSERT for the order and one set-based INSERT for the items.
+create or replace function public.place_order(p_order jsonb, p_items jsonb)
+returns void
+language plpgsql
+as $$
+begin
+    insert into public.orders
+    select * from jsonb_populate_record(null::public.orders, p_order);
+
+    insert into public.order_items
+    select * from jsonb_populate_recordset(null::public.order_items, p_items);
+end;
+$$;
@@ -0,0 +1,172 @@
+-- Durable waiter notifications with per-waiter read receipts.
+--
+-- Used by NotificationService. A NULL waiter_id marks a restaurant-wide
+-- notification seen by every waiter of the restaurant, so read state cannot
+-- live on the notification row: each waiter that reads a notification gets
+-- its own row in waiter_notification_reads.
+--
+-- `seq` is the replay cursor, numbered per restaurant. An identity column
+-- would hand out numbers at insert time, and a transaction holding a lower
+-- number could commit after a reader has already moved its cursor past a
+-- higher one. Numbers come from a per-restaurant counter row instead, whose
+-- lock is held until the inserting transaction commits, so a restaurant's
+-- notifications become visible in seq order.
+create table if not exists public.waiter_notifications (
+    id uuid primary key default gen_random_uuid(),
+    seq bigint,
+    restaurant_id uuid not null,
+    waiter_id uuid,
+    type text not null,
+    message text not null default '',
+    order_id uuid,
+    table_number int,
+    payload jsonb not null default '{}'::jsonb,
+    created_at timestamptz not null default now()
+);
+
+-- Columns missing from a table created before this migration
+alter table public.waiter_notifications add column if not exists seq bigint;
+alter table public.waiter_notifications add column if not exists payload jsonb not null default '{}'::jsonb;
+
+-- Number existing rows per restaurant in creation order
+update public.waiter_notifications n
+set seq = numbered.seq
+from (
+    select id, row_number() over (partition by restaurant_id order by created_at, id) as seq
+    from public.waiter_notifications
+) numbered
+where n.id = numbered.id and n.seq is null;
+
+alter table public.waiter_notifications alter column seq set not null;
+
+create unique index if not exists waiter_notifications_restaurant_seq_key
+    on public.waiter_notifications (restaurant_id, seq);
+create index if not exists waiter_notifications_waiter_seq_idx
+    on public.waiter_notifications (waiter_id, seq);
+
+create table if not exists public.waiter_notification_counters (
+    restaurant_id uuid primary key,
+    last_seq bigint not null
+);
+
+create or replace function public.assign_waiter_notification_seq()
+returns trigger
+language plpgsql
+as $$
+begin
+    insert into public.waiter_notification_counters as c (restaurant_id, last_seq)
+    select new.restaurant_id, coalesce(max(n.seq), 0) + 1
+    from public.waiter_notifications n
+    where n.restaurant_id = new.restaurant_id
+    on conflict (restaurant_id)
+        do update set last_seq = c.last_seq + 1
+    returning last_seq into new.seq;
+    return new;
+end;
+$$;
+
+drop trigger if exists waiter_notifications_assign_seq on public.waiter_notifications;
+create trigger waiter_notifications_assign_seq
+    before insert on public.waiter_notifications
+    for each row execute function public.assign_waiter_notification_seq();
+
+create table if not exists public.waiter_notification_reads (
+    notification_id uuid not null references public.waiter_notifications (id) on delete cascade,
+    waiter_id uuid not null,
+    read_at timestamptz not null default now(),
+    primary key (waiter_id, notification_id)
+);
+
+-- Read state used to be a single is_read flag on the row. Carry it over as a
+-- receipt for the addressed waiter before dropping it; a restaurant-wide
+-- notification has no single reader, so its flag cannot be attributed and
+-- it starts unread for everyone.
+do $$
+begin
+    if exists (
+        select 1 from information_schema.columns
+        where table_schema = 'public'
+          and table_name = 'waiter_notifications'
+          and column_name = 'is_read'
+    ) then
+        insert into public.waiter_notification_reads (notification_id, waiter_id)
+        select id, waiter_id
+        from public.waiter_notifications
+        where is_read and waiter_id is not null
+        on conflict do nothing;
+
+        alter table public.waiter_notifications drop column is_read;
+    end if;
+end;
+$$;
+
+-- Notifications a waiter can see (their own plus restaurant-wide) with
+-- seq > p_cursor, oldest first, each with that waiter's read state.
+create or replace function public.list_waiter_notifications(
+    p_restaurant_id uuid,
+    p_waiter_id uuid,
+    p_cursor bigint default 0,
+    p_limit int default 100,
+    p_unread_only boolean default false
+)
+returns table (
+    id uuid,
+    seq bigint,
+    restaurant_id uuid,
+    waiter_id uuid,
+    type text,
+    message text,
+    order_id uuid,
+    table_number int,
+    payload jsonb,
+    created_at timestamptz,
+    is_read boolean
+)
+language sql
+stable
+as $$
+    select n.id, n.seq, n.restaurant_id, n.waiter_id, n.type, n.message,
+           n.order_id, n.table_number, n.payload, n.created_at,
+           r.notification_id is not null as is_read
+    from public.waiter_notifications n
+    left join public.waiter_notification_reads r
+        on r.notification_id = n.id and r.waiter_id = p_waiter_id
+    where n.restaurant_id = p_restaurant_id
+      and (n.waiter_id = p_waiter_id or n.waiter_id is null)
+      and n.seq > p_cursor
+      and (not p_unread_only or r.notification_id is null)
+    order by n.seq
+    limit p_limit;
+$$;
+
+-- Record read receipts for the notifications a waiter can see, by ID and/or
+-- up to a seq. Returns the number of notifications newly marked read.
+create or replace function public.mark_waiter_notifications_read(
+    p_restaurant_id uuid,
+    p_waiter_id uuid,
+    p_ids uuid[] default null,
+    p_up_to_seq bigint default null
+)
+returns int
+language plpgsql
+as $$
+declare
+    marked int;
+begin
+    if p_ids is null and p_up_to_seq is null then
+        return 0;
+    end if;
+
+    insert into public.waiter_notification_reads (notification_id, waiter_id)
+    select n.id, p_waiter_id
+    from public.waiter_notifications n
+    where n.restaurant_id = p_restaurant_id
+      and (n.waiter_id = p_waiter_id or n.waiter_id is null)
+      and (p_ids is null or n.id = any (p_ids))
+      and (p_up_to_seq is null or n.seq <= p_up_to_seq)
+    on conflict do nothing;
+
+    get diagnostics marked = row_count;
+    return marked;
+end;
+$$;
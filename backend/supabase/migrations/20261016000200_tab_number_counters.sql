@@ -0,0 +1,28 @@
+-- Per-restaurant, per-day tab number counters.
+--
+-- Called through PostgREST RPC by TabNumberAllocator. The increment is a
+-- single upsert, so concurrent scans on any number of API workers never
+-- receive the same number. A day's counter is seeded from the highest tab
+-- number already issued that day, so enabling it mid-day does not reuse
+-- numbers.
+create table if not exists public.tab_number_counters (
+    restaurant_id uuid not null,
+    day date not null,
+    last_number int not null,
+    primary key (restaurant_id, day)
+);
+
+create or replace function public.next_tab_number(p_restaurant_id uuid, p_day date)
+returns int
+language sql
+as $$
+    insert into public.tab_number_counters as c (restaurant_id, day, last_number)
+    select p_restaurant_id, p_day, coalesce(max(t.tab_number), 0) + 1
+    from public.tabs t
+    where t.restaurant_id = p_restaurant_id
+      and t.created_at >= p_day::timestamp
+      and t.created_at < p_day::timestamp + interval '1 day'
+    on conflict (restaurant_id, day)
+        do update set last_number = c.last_number + 1
+    returning last_number;
+$$;
@@ -0,0 +1,49 @@
+-- Write orders with explicit column lists.
+--
+-- The first place_order populated whole rows from JSON, which silently
+-- dropped keys that are not columns and wrote NULL over every column
+-- default. Orders now keep the waiter's instructions and each item the
+-- name and unit price it was ordered at; status, timestamps and totals use
+-- the table's own names and defaults.
+alter table public.orders
+    add column if not exists special_instructions text;
+
+alter table public.order_items
+    add column if not exists name text,
+    add column if not exists unit_price numeric(10,2);
+
+create or replace function public.place_order(p_order jsonb, p_items jsonb)
+returns void
+language plpgsql
+as $$
+begin
+    insert into public.orders (
+        id, tab_id, waiter_id, status, special_instructions, total_amount, created_at, updated_at
+    )
+    values (
+        (p_order->>'id')::uuid,
+        (p_order->>'tab_id')::uuid,
+        (p_order->>'waiter_id')::uuid,
+        p_order->>'status',
+        p_order->>'special_instructions',
+        (p_order->>'total_amount')::numeric(10,2),
+        coalesce((p_order->>'created_at')::timestamptz, now()),
+        coalesce((p_order->>'updated_at')::timestamptz, now())
+    );
+
+    insert into public.order_items (
+        id, order_id, menu_item_id, name, unit_price, quantity, special_requests, status, created_at
+    )
+    select
+        (item->>'id')::uuid,
+        (p_order->>'id')::uuid,
+        (item->>'menu_item_id')::uuid,
+        item->>'name',
+        (item->>'unit_price')::numeric(10,2),
+        (item->>'quantity')::int,
+        item->>'special_requests',
+        item->>'status',
+        coalesce((item->>'created_at')::timestamptz, now())
+    from jsonb_array_elements(p_items) as item;
+end;
+$$;
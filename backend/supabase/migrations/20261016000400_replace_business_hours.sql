@@ -0,0 +1,23 @@
+-- Replace a restaurant's weekly business hours in one transaction.
+--
+-- Called through PostgREST RPC by BusinessHoursService.save_hours. Deleting
+-- and inserting in separate requests could leave a restaurant with no hours
+-- (and so the default schedule) if the insert failed; here both happen or
+-- neither does.
+create or replace function public.replace_business_hours(p_restaurant_id uuid, p_hours jsonb)
+returns void
+language plpgsql
+as $$
+begin
+    delete from public.business_hours where restaurant_id = p_restaurant_id;
+
+    insert into public.business_hours (restaurant_id, day_of_week, open_time, close_time, is_closed)
+    select
+        p_restaurant_id,
+        (row->>'day_of_week')::smallint,
+        (row->>'open_time')::time,
+        (row->>'close_time')::time,
+        coalesce((row->>'is_closed')::boolean, false)
+    from jsonb_array_elements(coalesce(p_hours, '[]'::jsonb)) as row;
+end;
+$$;
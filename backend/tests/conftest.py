@@ -0,0 +1,14 @@
+import os
+import sys
+from pathlib import Path
+
+# Settings and the Supabase clients are created at import time; point them at
+# a local stand-in so importing the app never needs real credentials
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-anon-key")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-key")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "test-jwt-secret")
+os.environ.setdefault("BROADCAST_BACKEND", "memory")
+
+# The backend imports the repository's shared package
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
@@ -0,0 +1,74 @@
+"""
+Stand-ins for the Supabase client and app.core.database.execute.
+
+Tests replace a module's `supabase` and `execute` with these, then assert on
+the builder calls the module made and the names it executed them under,
+never on the real client's internal request state.
+"""
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class FakeQuery:
+    """Records every builder call made on it, e.g. ("eq", ("id", "t1"))"""
+
+    def __init__(self, table: Optional[str] = None, function: Optional[str] = None, params: Any = None):
+        self.table = table
+        self.function = function
+        self.params = params
+        self.calls: List[Tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakeQuery"]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args + tuple(kwargs.items())))
+            return self
+
+        return record
+
+    def args(self, method: str) -> List[tuple]:
+        """Arguments of every call to `method`, in call order"""
+        return [args for name, args in self.calls if name == method]
+
+    def filters(self) -> Dict[str, Any]:
+        """The .eq() filters applied, by column"""
+        return {column: value for column, value in self.args("eq")}
+
+
+class FakeSupabase:
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(table=name)
+
+    def rpc(self, function: str, params: Any = None) -> FakeQuery:
+        return FakeQuery(function=function, params=params)
+
+
+class FakeExecute:
+    """
+    Replacement for execute(query, name): records each call and answers with
+    the data registered for its name (a value, or a function of the query)
+    """
+
+    def __init__(self, responses: Optional[Dict[str, Any]] = None):
+        self.responses = responses or {}
+        self.calls: List[Tuple[str, FakeQuery]] = []
+
+    async def __call__(self, query: FakeQuery, name: Optional[str] = None):
+        self.calls.append((name, query))
+        data = self.responses.get(name)
+        if callable(data):
+            data = data(query)
+        return SimpleNamespace(data=data)
+
+    def queries(self, name: str) -> List[FakeQuery]:
+        return [query for call_name, query in self.calls if call_name == name]
+
+
+def install(monkeypatch, module, responses: Optional[Dict[str, Any]] = None) -> FakeExecute:
+    """Swap a module's supabase client and execute() for fakes"""
+    fake = FakeExecute(responses)
+    monkeypatch.setattr(module, "supabase", FakeSupabase())
+    monkeypatch.setattr(module, "execute", fake)
+    return fake
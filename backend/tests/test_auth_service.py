@@ -0,0 +1,58 @@
+"""
+Password sign-in through the auth service, with Supabase auth served by a
+mock transport.
+"""
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from app.services.auth_service import AuthService
+
+
+def session_for(email):
+    return {
+        "access_token": f"token-for-{email}",
+        "token_type": "bearer",
+        "expires_in": 3600,
+        "refresh_token": f"refresh-{email}",
+        "user": {
+            "id": str(uuid.uuid5(uuid.NAMESPACE_DNS, email)),
+            "email": email,
+            "aud": "authenticated",
+            "app_metadata": {},
+            "user_metadata": {},
+            "created_at": "2026-10-16T12:00:00Z"
+        }
+    }
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = AuthService()
+    service._auth_http = httpx.Client(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json=session_for(json.loads(request.content)["email"]))
+    ))
+
+    async def get_profile(user_id):
+        return {"role": "waiter"}
+
+    monkeypatch.setattr(service, "get_profile", get_profile)
+    return service
+
+
+def test_concurrent_sign_ins_keep_their_own_sessions(service):
+    emails = [f"waiter{i}@example.com" for i in range(8)]
+    data_headers = dict(service.supabase.options.headers)
+
+    async def sign_in_all():
+        return await asyncio.gather(*(service.authenticate_user(email, "secret") for email in emails))
+
+    users = asyncio.run(sign_in_all())
+
+    assert [user["email"] for user in users] == emails
+    assert [user["session"].access_token for user in users] == [f"token-for-{email}" for email in emails]
+    # The service-role client used for table queries is left untouched
+    assert service.supabase.options.headers == data_headers
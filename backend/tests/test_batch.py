@@ -0,0 +1,84 @@
+"""
+/batch, run through the real app in-process over httpx.ASGITransport.
+"""
+import asyncio
+import uuid
+
+import httpx
+
+from app.core.config import settings
+from app.core.jwt import create_access_token
+from app.main import app
+from shared.utils.api_client import APIClient, BatchCall
+
+BASE_URL = f"http://batch.test{settings.API_V1_STR}"
+
+WAITER_ORDERS = "waiter/waiter/orders"
+UNKNOWN = "no-such-endpoint"
+NOTIFICATIONS = "waiter/waiter/notifications"
+
+
+def waiter_token() -> str:
+    return create_access_token(str(uuid.uuid4()), role="waiter", restaurant_id=str(uuid.uuid4()))
+
+
+def asgi_client(**kwargs) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), **kwargs)
+
+
+def test_mixed_batch_keeps_request_order():
+    payload = {
+        "requests": [
+            {"id": "orders", "method": "GET", "path": f"{settings.API_V1_STR}/{WAITER_ORDERS}"},
+            {"id": "missing", "method": "GET", "path": f"{settings.API_V1_STR}/{UNKNOWN}"},
+            {
+                "id": "invalid",
+                "method": "GET",
+                "path": f"{settings.API_V1_STR}/{NOTIFICATIONS}",
+                "params": {"limit": 0}
+            }
+        ]
+    }
+
+    async def send():
+        headers = {"Authorization": f"Bearer {waiter_token()}"}
+        async with asgi_client(base_url=BASE_URL, headers=headers) as client:
+            return await client.post("batch", json=payload)
+
+    response = asyncio.run(send())
+
+    assert response.status_code == 200
+    results = response.json()["responses"]
+    assert [(r["id"], r["status"]) for r in results] == [("orders", 200), ("missing", 404), ("invalid", 422)]
+    assert results[0]["body"] == []
+    assert results[2]["body"]["detail"][0]["loc"] == ["query", "limit"]
+
+
+def test_api_client_batch_reaches_the_backend():
+    async def send():
+        api = APIClient(BASE_URL, token=waiter_token())
+        api.transport.client = asgi_client()
+        try:
+            return await api.batch([
+                BatchCall("GET", WAITER_ORDERS),
+                BatchCall("GET", UNKNOWN),
+                BatchCall("GET", NOTIFICATIONS, params={"limit": 0})
+            ])
+        finally:
+            await api.close()
+
+    orders, missing, invalid = asyncio.run(send())
+
+    assert orders.success and orders.data == []
+    assert not missing.success and missing.error["code"] == 404
+    assert not invalid.success and invalid.error["code"] == 422
+
+
+def test_nested_batch_is_rejected():
+    payload = {"requests": [{"id": "1", "method": "POST", "path": f"{settings.API_V1_STR}/batch"}]}
+
+    async def send():
+        async with asgi_client(base_url=BASE_URL) as client:
+            return await client.post("batch", json=payload)
+
+    assert asyncio.run(send()).status_code == 422
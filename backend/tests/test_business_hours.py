@@ -0,0 +1,60 @@
+"""
+Saving business hours: validation and the single replace_business_hours call.
+"""
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.jwt import create_access_token
+from app.main import app
+from app.services import business_hours_service as hours_module
+from tests.fakes import install
+
+RESTAURANT_ID = str(uuid.uuid4())
+BASE_URL = f"http://hours.test{settings.API_V1_STR}/restaurant/restaurant"
+
+
+@pytest.fixture
+def database(monkeypatch):
+    hours_module.business_hours_service.invalidate()
+    yield install(monkeypatch, hours_module)
+    hours_module.business_hours_service.invalidate()
+
+
+def save(hours):
+    token = create_access_token(str(uuid.uuid4()), role="restaurant_admin", restaurant_id=RESTAURANT_ID)
+
+    async def send():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL) as client:
+            return await client.put("business-hours", json=hours, headers={"Authorization": f"Bearer {token}"})
+
+    return asyncio.run(send())
+
+
+def test_hours_are_replaced_in_one_call(database):
+    response = save([
+        {"day_of_week": 1, "open_time": "09:00", "close_time": "17:00"},
+        {"day_of_week": 0, "is_closed": True},
+    ])
+
+    assert response.status_code == 200
+    assert [name for name, _ in database.calls] == ["business_hours.replace"]
+    [query] = database.queries("business_hours.replace")
+    assert query.function == "replace_business_hours"
+    assert query.params["p_restaurant_id"] == RESTAURANT_ID
+    assert [row["day_of_week"] for row in query.params["p_hours"]] == [1, 0]
+    assert query.params["p_hours"][0]["open_time"] == "09:00:00"
+
+
+@pytest.mark.parametrize("hours", [
+    [{"day_of_week": 1, "open_time": "9am", "close_time": "17:00"}],
+    [{"day_of_week": 1, "open_time": "09:00", "close_time": "09:00"}],
+    [{"day_of_week": 1, "is_closed": True}, {"day_of_week": 1, "open_time": "09:00", "close_time": "17:00"}],
+    [{"day_of_week": 7, "is_closed": True}],
+])
+def test_invalid_hours_are_rejected_before_saving(database, hours):
+    assert save(hours).status_code == 422
+    assert database.calls == []
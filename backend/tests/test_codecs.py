@@ -0,0 +1,157 @@
+"""
+MessagePack negotiation for HTTP responses and WebSocket frames.
+"""
+import asyncio
+import datetime
+import decimal
+import json
+
+import httpx
+import pytest
+
+pytest.importorskip("msgpack")
+
+from app.core import codecs
+from app.core.codecs import (
+    MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL, _with_vary_accept, pack, prefers_msgpack, select_subprotocol, unpack
+)
+from app.core.connections import ConnectionManager
+from app.core.pubsub import InMemoryBackplane
+from app.main import app
+from shared.utils import codecs as client_codecs
+
+
+def get(path, accept=None):
+    async def send():
+        headers = {"Accept": accept} if accept else {}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://codecs.test") as client:
+            return await client.get(path, headers=headers)
+
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, False),
+    ("application/json", False),
+    ("*/*", False),
+    ("application/msgpack", True),
+    ("application/msgpack, application/json;q=0.9", True),
+    ("application/json, application/msgpack;q=0.5", False),
+    ("application/msgpack;q=0", False),
+])
+def test_accept_negotiation(accept, expected):
+    assert prefers_msgpack(accept) is expected
+
+
+def test_msgpack_is_disabled_by_setting(monkeypatch):
+    monkeypatch.setattr(codecs.settings, "MSGPACK_ENABLED", False)
+
+    assert not prefers_msgpack("application/msgpack")
+    assert select_subprotocol([MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL]) == JSON_SUBPROTOCOL
+
+
+def vary(response):
+    return [token.strip().lower() for token in response.headers.get("vary", "").split(",")]
+
+
+def test_route_results_are_packed_without_a_json_round_trip(monkeypatch):
+    def reparse(text):
+        raise AssertionError("route result was re-parsed from JSON")
+
+    monkeypatch.setattr(codecs, "json_to_msgpack", reparse)
+    response = get("/", accept=client_codecs.MSGPACK_ACCEPT)
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "accept" in vary(response)
+    assert unpack(response.content) == get("/").json()
+
+
+def test_error_responses_are_transcoded_too():
+    response = get("/no-such-path", accept="application/msgpack")
+
+    assert response.status_code == 404
+    assert unpack(response.content) == {"detail": "Not Found"}
+
+
+def test_other_clients_get_json_that_varies_on_accept():
+    response = get("/")
+
+    assert response.headers["content-type"] == "application/json"
+    assert "accept" in vary(response)
+
+
+def test_msgpack_disabled_responses_do_not_vary(monkeypatch):
+    monkeypatch.setattr(codecs.settings, "MSGPACK_ENABLED", False)
+
+    response = get("/", accept="application/msgpack")
+
+    assert response.headers["content-type"] == "application/json"
+    assert "accept" not in vary(response)
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ([], [(b"vary", b"Accept")]),
+    ([(b"vary", b"Origin")], [(b"vary", b"Origin, Accept")]),
+    ([(b"Vary", b"Origin, accept")], [(b"Vary", b"Origin, accept")]),
+    ([(b"vary", b"*")], [(b"vary", b"*")]),
+])
+def test_accept_is_appended_to_an_existing_vary(headers, expected):
+    assert _with_vary_accept(headers) == expected
+
+
+def test_typed_values_round_trip_to_the_shared_client():
+    value = {
+        "total": decimal.Decimal("12.50"),
+        "at": datetime.datetime(2026, 10, 16, 12, 30, tzinfo=datetime.timezone.utc),
+        "naive": datetime.datetime(2026, 10, 16, 12, 30)
+    }
+
+    decoded = client_codecs.unpack(pack(value))
+
+    assert decoded["total"] == decimal.Decimal("12.50")
+    assert decoded["at"] == value["at"]
+    assert decoded["naive"] == value["at"]
+
+
+class FakeWebSocket:
+    def __init__(self, subprotocols):
+        self.scope = {"subprotocols": subprotocols}
+        self.accepted = None
+        self.sent = asyncio.Queue()
+
+    async def accept(self, subprotocol=None):
+        self.accepted = subprotocol
+
+    async def send_text(self, message):
+        await self.sent.put(message)
+
+    async def send_bytes(self, message):
+        await self.sent.put(message)
+
+    async def close(self):
+        pass
+
+
+def test_sockets_get_frames_in_their_negotiated_format():
+    async def scenario():
+        manager = ConnectionManager(InMemoryBackplane(), ping_interval=3600)
+        await manager.start()
+        binary, text, plain = (
+            FakeWebSocket([MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL]),
+            FakeWebSocket([JSON_SUBPROTOCOL]),
+            FakeWebSocket([])
+        )
+        try:
+            for websocket in (binary, text, plain):
+                await manager.connect(websocket, ["tab:t1"])
+            await manager.publish("tab:t1", json.dumps({"type": "tab_updated", "total": 1250}))
+            return [(ws.accepted, await asyncio.wait_for(ws.sent.get(), 2)) for ws in (binary, text, plain)]
+        finally:
+            await manager.stop()
+
+    (binary_protocol, binary_frame), (text_protocol, text_frame), (plain_protocol, plain_frame) = asyncio.run(scenario())
+
+    assert binary_protocol == MSGPACK_SUBPROTOCOL
+    assert unpack(binary_frame) == {"type": "tab_updated", "total": 1250}
+    assert text_protocol == JSON_SUBPROTOCOL and json.loads(text_frame)["total"] == 1250
+    assert plain_protocol is None and json.loads(plain_frame)["total"] == 1250
@@ -0,0 +1,99 @@
+"""
+Menu imports: per-row errors and upload checks, with execute() stubbed out.
+"""
+import asyncio
+import io
+import uuid
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.jwt import create_access_token
+from app.main import app
+from app.services import menu_service as menu_module
+from app.services.menu_service import menu_service
+from tests.fakes import install
+
+RESTAURANT_ID = str(uuid.uuid4())
+BASE_URL = f"http://menu.test{settings.API_V1_STR}/restaurant/restaurant"
+
+VALID = {"name": "Soup", "description": "Of the day", "price": 650, "category": "starters"}
+
+
+@pytest.fixture
+def database(monkeypatch):
+    return install(monkeypatch, menu_module)
+
+
+def inserted(database):
+    """Rows passed to every menu_items.bulk_insert, in order"""
+    return [
+        row for query in database.queries("menu_items.bulk_insert")
+        for (rows,) in query.args("insert") for row in rows
+    ]
+
+
+def admin_client() -> httpx.AsyncClient:
+    token = create_access_token(str(uuid.uuid4()), role="restaurant_admin", restaurant_id=RESTAURANT_ID)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url=BASE_URL,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+def test_bad_rows_are_reported_without_failing_the_import(database):
+    rows = [
+        VALID,
+        "not an object",
+        {**VALID, None: ["extra", "cells"]},
+        {**VALID, "price": "twelve"},
+        {**VALID, "name": "Bread"},
+    ]
+
+    result = asyncio.run(menu_service.bulk_create(RESTAURANT_ID, enumerate(rows, start=1)))
+
+    assert result["created"] == 2
+    assert [e["row"] for e in result["errors"]] == [2, 3, 4]
+    assert [row["name"] for row in inserted(database)] == ["Soup", "Bread"]
+
+
+def test_csv_rows_longer_than_the_header_are_row_errors(database):
+    upload = io.BytesIO(
+        b"name,description,price,category\n"
+        b"Soup,Of the day,650,starters\n"
+        b"Bread,Sourdough,300,starters,oops\n"
+    )
+
+    result = asyncio.run(menu_service.bulk_create(RESTAURANT_ID, menu_service.parse_csv(upload)))
+
+    assert result["created"] == 1
+    assert result["errors"] == [{"row": 2, "errors": ["row has more fields than the header"]}]
+
+
+def test_json_body_accepts_non_object_entries(database):
+    async def send():
+        async with admin_client() as client:
+            return await client.post("menu/items/bulk", json=[VALID, 42, ["a", "b"]])
+
+    response = asyncio.run(send())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 1
+    assert [e["row"] for e in body["errors"]] == [2, 3]
+
+
+def test_upload_with_invalid_encoding_is_rejected_before_importing(database):
+    upload = b"name,description,price,category\nSoup,Of the day,650,starters\nCr\xe8me,Br\xfbl\xe9e,700,desserts\n"
+
+    async def send():
+        async with admin_client() as client:
+            return await client.post("menu/items/import", files={"file": ("menu.csv", upload, "text/csv")})
+
+    response = asyncio.run(send())
+
+    assert response.status_code == 400
+    assert "UTF-8" in response.json()["detail"]
+    assert inserted(database) == []
@@ -0,0 +1,64 @@
+"""
+Menu updates that arrive while a snapshot is being built are not lost.
+"""
+import asyncio
+import uuid
+
+import pytest
+
+from app.services import menu_snapshot as snapshot_module
+from tests.fakes import install
+
+RESTAURANT_ID = str(uuid.uuid4())
+SOUP = {"id": str(uuid.uuid4()), "name": "Soup", "price": 650, "category": "starters", "is_available": True}
+
+
+@pytest.fixture
+def service():
+    return snapshot_module.MenuSnapshotService()
+
+
+def test_an_update_during_a_build_discards_that_build(monkeypatch, service):
+    menu = [dict(SOUP)]
+
+    def read_menu(query):
+        rows = [dict(item) for item in menu]
+        if len(database.calls) == 1:
+            # The soup is 86'd after this read, before the build finishes
+            menu[0]["is_available"] = False
+            service.apply_item(RESTAURANT_ID, {"id": SOUP["id"], "is_available": False})
+        return rows
+
+    database = install(monkeypatch, snapshot_module, {"menu_items.snapshot": read_menu})
+
+    snapshot = asyncio.run(service.get_snapshot(RESTAURANT_ID))
+
+    assert len(database.calls) == 2
+    assert snapshot.get_item(SOUP["id"])["is_available"] is False
+    assert service.cache.get(RESTAURANT_ID) is snapshot
+
+
+def test_a_menu_that_keeps_changing_is_served_but_not_cached(monkeypatch, service):
+    def read_menu(query):
+        service.invalidate(RESTAURANT_ID)
+        return [SOUP]
+
+    database = install(monkeypatch, snapshot_module, {"menu_items.snapshot": read_menu})
+
+    snapshot = asyncio.run(service.get_snapshot(RESTAURANT_ID))
+
+    assert len(database.calls) == snapshot_module.MAX_BUILD_ATTEMPTS
+    assert snapshot.get_item(SOUP["id"]) == SOUP
+    assert service.cache.get(RESTAURANT_ID) is None
+
+
+def test_concurrent_misses_share_one_build(monkeypatch, service):
+    database = install(monkeypatch, snapshot_module, {"menu_items.snapshot": [SOUP]})
+
+    async def fetch():
+        return await asyncio.gather(*(service.get_snapshot(RESTAURANT_ID) for _ in range(5)))
+
+    snapshots = asyncio.run(fetch())
+
+    assert len(database.calls) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
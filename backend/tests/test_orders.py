@@ -0,0 +1,141 @@
+"""
+POST /orders/ through the real app, with the database and menu stubbed out.
+"""
+import asyncio
+import uuid
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.core.jwt import create_access_token
+from app.main import app
+from app.services import order_service as order_module
+from app.services.menu_snapshot import MenuSnapshot
+from app.utils.helpers import from_cents, to_cents
+from tests.fakes import install
+
+RESTAURANT_ID = str(uuid.uuid4())
+TAB_ID = str(uuid.uuid4())
+SOUP_ID = str(uuid.uuid4())
+BREAD_ID = str(uuid.uuid4())
+# Prices as PostgREST returns a DECIMAL(10,2) column
+MENU = MenuSnapshot(RESTAURANT_ID, [
+    {"id": SOUP_ID, "name": "Soup", "price": 6.5, "category": "starters"},
+    {"id": BREAD_ID, "name": "Bread", "price": 2.35, "category": "starters"},
+])
+
+ORDER = {"tab_id": TAB_ID, "items": [{"menu_item_id": SOUP_ID, "quantity": 2}]}
+
+
+def owned_tab(query):
+    """The tab, if the lookup was scoped to its restaurant"""
+    if query.filters() == {"id": TAB_ID, "restaurant_id": RESTAURANT_ID}:
+        return [{"id": TAB_ID, "restaurant_id": RESTAURANT_ID, "status": "active"}]
+    return []
+
+
+@pytest.fixture
+def database(monkeypatch):
+    async def get_snapshot(restaurant_id):
+        return MENU
+
+    async def notify(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(order_module.menu_snapshot_service, "get_snapshot", get_snapshot)
+    monkeypatch.setattr(order_module.notification_service, "create", notify)
+    return install(monkeypatch, order_module, {"tabs.get_for_order": owned_tab})
+
+
+def placed(database):
+    return [query.params for query in database.queries("orders.place")]
+
+
+def place(order, token=None):
+    async def send():
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://orders.test") as client:
+            return await client.post("/orders/", json=order, headers=headers)
+
+    return asyncio.run(send())
+
+
+def token_for(role, restaurant_id=RESTAURANT_ID, user_id=None):
+    return create_access_token(user_id or str(uuid.uuid4()), role=role, restaurant_id=restaurant_id)
+
+
+def test_requires_authentication(database):
+    assert place(ORDER).status_code == 401
+    assert placed(database) == []
+
+
+def test_customers_cannot_place_orders(database):
+    assert place(ORDER, token_for("customer")).status_code == 403
+    assert placed(database) == []
+
+
+def test_tab_of_another_restaurant_is_not_found(database):
+    response = place(ORDER, token_for("waiter", restaurant_id=str(uuid.uuid4())))
+
+    assert response.status_code == 404
+    assert placed(database) == []
+
+
+def test_waiter_id_comes_from_the_token(database):
+    waiter_id = str(uuid.uuid4())
+
+    response = place({**ORDER, "waiter_id": str(uuid.uuid4())}, token_for("waiter", user_id=waiter_id))
+
+    assert response.status_code == 201
+    assert response.json()["waiter_id"] == waiter_id
+    assert placed(database)[0]["p_order"]["waiter_id"] == waiter_id
+
+
+def test_rows_use_the_table_columns_and_exact_prices(database):
+    order = {
+        "tab_id": TAB_ID,
+        "special_instructions": "No onions",
+        "items": [
+            {"menu_item_id": SOUP_ID, "quantity": 2, "notes": "Hot"},
+            {"menu_item_id": BREAD_ID, "quantity": 3}
+        ]
+    }
+
+    response = place(order, token_for("waiter"))
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["status"] == "placed"
+    assert body["total"] == 2 * 650 + 3 * 235
+    assert [item["price"] for item in body["items"]] == [650, 235]
+
+    [call] = placed(database)
+    row = call["p_order"]
+    assert set(row) == {
+        "id", "tab_id", "waiter_id", "status", "special_instructions", "total_amount", "created_at", "updated_at"
+    }
+    assert row["status"] == "pending"
+    assert row["total_amount"] == "20.05"
+    assert row["special_instructions"] == "No onions"
+
+    items = call["p_items"]
+    assert all(set(item) == {
+        "id", "menu_item_id", "name", "unit_price", "quantity", "special_requests", "status", "created_at"
+    } for item in items)
+    assert [(item["name"], item["unit_price"], item["special_requests"]) for item in items] == [
+        ("Soup", "6.50", "Hot"), ("Bread", "2.35", None)
+    ]
+    assert {item["status"] for item in items} == {"pending"}
+
+
+@pytest.mark.parametrize("amount, cents", [(6.5, 650), (2.35, 235), ("0.1", 10), (Decimal("19.99"), 1999), (7, 700)])
+def test_money_converts_exactly(amount, cents):
+    assert to_cents(amount) == cents
+    assert to_cents(from_cents(cents)) == cents
+
+
+@pytest.mark.parametrize("amount", [0.005, "abc", None, float("nan")])
+def test_fractional_cents_are_rejected(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
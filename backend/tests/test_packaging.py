@@ -0,0 +1,28 @@
+"""
+The backend is packaged as `app` alone, so it must import without the
+repository root (and its shared package) on the path.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def test_app_imports_without_the_repository_root():
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    script = (
+        "import sys, app.main; "
+        "sys.exit(1 if any(name == 'shared' or name.startswith('shared.') for name in sys.modules) else 0)"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
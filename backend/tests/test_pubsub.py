@@ -0,0 +1,226 @@
+"""
+Backplanes delivering across ConnectionManagers, i.e. across workers.
+
+The Redis backplane runs against a tiny in-process server that speaks just
+enough RESP (AUTH, SELECT, PUBLISH, PSUBSCRIBE) for it.
+"""
+import asyncio
+import fnmatch
+import json
+
+import pytest
+
+from app.core.connections import ConnectionManager, tab_channel
+from app.core.pubsub import Backplane, InMemoryBackplane, RedisBackplane, _encode_command, _read_reply
+
+TAB = tab_channel("c0ffee00-0000-4000-8000-000000000001")
+
+
+class FakeWebSocket:
+    """Just enough of starlette's WebSocket for ConnectionManager"""
+
+    def __init__(self):
+        self.scope = {"subprotocols": []}
+        self.sent = asyncio.Queue()
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send_text(self, message):
+        await self.sent.put(message)
+
+    async def send_bytes(self, message):
+        await self.sent.put(message)
+
+    async def close(self):
+        pass
+
+
+async def next_message(websocket: FakeWebSocket):
+    return json.loads(await asyncio.wait_for(websocket.sent.get(), timeout=2))
+
+
+async def eventually(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+def bulk(data: bytes) -> bytes:
+    return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+class FakeRespServer:
+    """Pub/sub subset of a Redis server, listening on localhost"""
+
+    def __init__(self):
+        self.subscribers = []  # (pattern, writer)
+        self.connections = set()
+        self.subscribe_count = 0
+        # PUBLISH commands to swallow without a reply, as a stalled server would
+        self.unanswered_publishes = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def close(self):
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self):
+        """Close every client connection, as a restarting server would"""
+        for writer in list(self.connections):
+            writer.close()
+        self.connections.clear()
+        self.subscribers.clear()
+
+    async def _handle(self, reader, writer):
+        self.connections.add(writer)
+        try:
+            while True:
+                command = await _read_reply(reader)
+                name = command[0].decode().upper()
+                if name in ("AUTH", "SELECT"):
+                    writer.write(b"+OK\r\n")
+                elif name == "PSUBSCRIBE":
+                    pattern = command[1]
+                    self.subscribers.append((pattern, writer))
+                    self.subscribe_count += 1
+                    writer.write(b"*3\r\n" + bulk(b"psubscribe") + bulk(pattern) + b":1\r\n")
+                elif name == "PUBLISH" and self.unanswered_publishes:
+                    self.unanswered_publishes -= 1
+                elif name == "PUBLISH":
+                    channel, message = command[1], command[2]
+                    receivers = [
+                        (pattern, subscriber) for pattern, subscriber in self.subscribers
+                        if fnmatch.fnmatchcase(channel.decode(), pattern.decode())
+                    ]
+                    for pattern, subscriber in receivers:
+                        subscriber.write(_encode_command("pmessage", pattern, channel, message))
+                    writer.write(b":%d\r\n" % len(receivers))
+                else:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+
+async def two_workers(make_backplane):
+    """Two managers, each with one socket subscribed to TAB"""
+    workers = []
+    for _ in range(2):
+        manager = ConnectionManager(make_backplane(), ping_interval=3600)
+        await manager.start()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, [TAB])
+        workers.append((manager, websocket))
+    return workers
+
+
+async def stop(workers):
+    for manager, _ in workers:
+        await manager.stop()
+
+
+def test_backplane_requires_publish():
+    with pytest.raises(TypeError):
+        Backplane()
+
+
+def test_in_memory_backplane_reaches_every_manager():
+    async def scenario():
+        backplane = InMemoryBackplane()
+        workers = await two_workers(lambda: backplane)
+        (first, first_socket), (_, second_socket) = workers
+        try:
+            await first.publish(TAB, json.dumps({"type": "tab_updated"}))
+            assert await next_message(first_socket) == {"type": "tab_updated"}
+            assert await next_message(second_socket) == {"type": "tab_updated"}
+        finally:
+            await stop(workers)
+
+    asyncio.run(scenario())
+
+
+def test_redis_backplane_delivers_across_workers():
+    async def scenario():
+        server = FakeRespServer()
+        await server.start()
+        workers = await two_workers(lambda: RedisBackplane(server.url, prefix="tabs-test:"))
+        (first, first_socket), (second, second_socket) = workers
+        try:
+            await second.publish(TAB, json.dumps({"type": "order_placed"}))
+            assert await next_message(first_socket) == {"type": "order_placed"}
+            assert await next_message(second_socket) == {"type": "order_placed"}
+
+            # Other channels are not delivered to the TAB subscribers
+            await first.publish(tab_channel("other"), json.dumps({"type": "ignored"}))
+            await first.publish(TAB, json.dumps({"type": "next"}))
+            assert await next_message(second_socket) == {"type": "next"}
+        finally:
+            await stop(workers)
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_redis_backplane_resubscribes_after_reconnect():
+    async def scenario():
+        server = FakeRespServer()
+        await server.start()
+        workers = await two_workers(lambda: RedisBackplane(server.url, reconnect_delay=0.01))
+        (first, _), (_, second_socket) = workers
+        try:
+            await first.publish(TAB, json.dumps({"type": "before"}))
+            assert await next_message(second_socket) == {"type": "before"}
+            assert server.subscribe_count == 2
+
+            server.drop_connections()
+            await eventually(lambda: server.subscribe_count == 4)
+
+            # The publisher connection was dropped too and is re-opened
+            await first.publish(TAB, json.dumps({"type": "after_reconnect"}))
+            assert await next_message(second_socket) == {"type": "after_reconnect"}
+        finally:
+            await stop(workers)
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_redis_publish_times_out_and_reconnects():
+    async def scenario():
+        server = FakeRespServer()
+        await server.start()
+        workers = await two_workers(lambda: RedisBackplane(server.url, publish_timeout=0.2))
+        (first, _), (_, second_socket) = workers
+        try:
+            await first.publish(TAB, json.dumps({"type": "before"}))
+            assert await next_message(second_socket) == {"type": "before"}
+            connections = len(server.connections)
+
+            # The stalled reply is abandoned and the publish goes out on a new connection
+            server.unanswered_publishes = 1
+            await first.publish(TAB, json.dumps({"type": "after_stall"}))
+            assert await next_message(second_socket) == {"type": "after_stall"}
+            await eventually(lambda: len(server.connections) == connections)
+
+            server.unanswered_publishes = 2
+            with pytest.raises(asyncio.TimeoutError):
+                await first.publish(TAB, json.dumps({"type": "lost"}))
+        finally:
+            await stop(workers)
+            await server.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+"""
+Keyset cursors on the restaurant tab list.
+"""
+import asyncio
+import base64
+import json
+import uuid
+
+import httpx
+import pytest
+
+from app.endpoints import tabs as tabs_module
+from app.main import app
+from app.utils.helpers import encode_cursor
+from tests.fakes import install
+
+RESTAURANT_ID = str(uuid.uuid4())
+TAB_ID = str(uuid.uuid4())
+
+
+@pytest.fixture
+def database(monkeypatch):
+    return install(monkeypatch, tabs_module, {"tabs.list": []})
+
+
+def list_tabs(cursor):
+    async def send():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://tabs.test") as client:
+            return await client.get(f"/tabs/restaurant/{RESTAURANT_ID}", params={"cursor": cursor})
+
+    return asyncio.run(send())
+
+
+def raw_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    raw_cursor({"created_at": "2026-10-16T12:00:00+00:00"}),
+    raw_cursor(["2026-10-16T12:00:00+00:00"]),
+    raw_cursor(["2026-10-16T12:00:00+00:00", TAB_ID, "extra"]),
+    raw_cursor(["yesterday", TAB_ID]),
+    raw_cursor(['2026-10-16",id.gt.0)', TAB_ID]),
+    raw_cursor(["2026-10-16T12:00:00+00:00", f"{TAB_ID}),or(id.neq.0"]),
+    raw_cursor([1760616000, TAB_ID]),
+])
+def test_malformed_cursor_is_rejected_before_querying(database, cursor):
+    response = list_tabs(cursor)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+    assert database.calls == []
+
+
+def test_cursor_values_are_normalized_into_the_filter(database):
+    response = list_tabs(encode_cursor("2026-10-16T12:00:00.50000Z", TAB_ID.upper()))
+
+    assert response.status_code == 200
+    [query] = database.queries("tabs.list")
+    assert query.table == "tabs"
+    assert query.filters() == {"restaurant_id": RESTAURANT_ID}
+    assert query.args("or_") == [(
+        f'created_at.lt."2026-10-16T12:00:00.500000+00:00",'
+        f'and(created_at.eq."2026-10-16T12:00:00.500000+00:00",id.lt.{TAB_ID})',
+    )]
@@ -4,13 +4,20 @@ from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin
 import logging
 
+from shared.utils.codecs import MSGPACK_ACCEPT, is_msgpack, msgpack_available, unpack
+from shared.utils.transport import get_transport, release_transport
+
 class APIService:
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.token: Optional[str] = None
-        self.client = httpx.AsyncClient()
+        # Shared pool with timeouts, idempotent retries and a circuit breaker,
+        # so requests on flaky Wi-Fi fail fast instead of piling up
+        self.transport = get_transport(base_url)
         self.ws_client = None
         self.logger = logging.getLogger(__name__)
+        # restaurant_id -> (etag, menu payload) for conditional menu requests
+        self._menu_cache: Dict[str, tuple] = {}
         
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make an HTTP request to the API"""
@@ -19,16 +26,24 @@ class APIService:
         
         if self.token:
             headers['Authorization'] = f"Bearer {self.token}"
+        if msgpack_available():
+            # Smaller and cheaper to parse on the phone; JSON if the server declines
+            headers.setdefault('Accept', MSGPACK_ACCEPT)
             
         try:
-            response = await self.client.request(
+            response = await self.transport.request(
                 method,
                 url,
+                route=endpoint,
                 headers=headers,
                 **kwargs
             )
             response.raise_for_status()
-            return response.json() if response.content else {}
+            if not response.content:
+                return {}
+            if is_msgpack(response.headers.get("content-type")):
+                return unpack(response.content)
+            return response.json()
             
         except httpx.HTTPStatusError as e:
             self.logger.error(f"HTTP error: {e}")
@@ -60,8 +75,31 @@ class APIService:
     
     # Menu
     async def get_menu(self, restaurant_id: str) -> List[Dict[str, Any]]:
-        """Get menu for a restaurant"""
-        return await self._request("GET", f"restaurants/{restaurant_id}/menu")
+        """Get menu for a restaurant, revalidating the cached copy with its ETag"""
+        url = urljoin(self.base_url, f"restaurants/{restaurant_id}/menu")
+        headers = {}
+        cached = self._menu_cache.get(restaurant_id)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        
+        try:
+            response = await self.transport.request(
+                "GET", url, route=f"restaurants/{restaurant_id}/menu", headers=headers
+            )
+            if response.status_code == 304 and cached:
+                return cached[1]["items"]
+            response.raise_for_status()
+            menu = response.json()
+        except Exception as e:
+            self.logger.error(f"Menu request failed: {e}")
+            raise
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._menu_cache[restaurant_id] = (etag, menu)
+        return menu["items"]
     
     # Orders
     async def create_order(self, restaurant_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -96,7 +134,7 @@ class APIService:
         """Clean up resources"""
         if self.ws_client:
             await self.ws_client.close()
-        await self.client.aclose()
+        await release_transport(self.base_url)
 
 # Singleton instance
 api_service: Optional[APIService] = None
@@ -3,6 +3,8 @@ import json
 import logging
 from typing import Callable, Optional, Dict, Any
 
+from shared.utils.codecs import JSON_SUBPROTOCOL, MSGPACK_SUBPROTOCOL, decode_message, msgpack_available, pack
+
 class WebSocketService:
     def __init__(self):
         self.connection = None
@@ -14,15 +16,23 @@ class WebSocketService:
         self._reconnect_delay = 1  # Start with 1 second delay
         self._reconnect_task = None
         self._message_handlers = {}
+        self.binary = False
     
     async def connect(self, url: str):
-        """Connect to the WebSocket server"""
+        """
+        Connect to the WebSocket server
+        
+        MessagePack frames are requested when msgpack is installed; the
+        server picks JSON if it does not support them.
+        """
         if self.connected:
             return True
             
         try:
             import websockets
-            self.connection = await websockets.connect(url)
+            subprotocols = [MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL] if msgpack_available() else [JSON_SUBPROTOCOL]
+            self.connection = await websockets.connect(url, subprotocols=subprotocols)
+            self.binary = self.connection.subprotocol == MSGPACK_SUBPROTOCOL
             self.connected = True
             self._reconnect_attempts = 0
             self._start_message_loop()
@@ -38,11 +48,19 @@ class WebSocketService:
         asyncio.create_task(self._message_loop())
     
     async def _message_loop(self):
-        """Continuously receive and process messages"""
+        """
+        Continuously receive and process messages
+
+        Server pings are answered with {"type": "pong"}; the server drops
+        sockets that stay silent past its pong timeout.
+        """
         while self.connected and self.connection:
             try:
                 message = await self.connection.recv()
-                data = json.loads(message)
+                data = decode_message(message)
+                if data.get('type') == 'ping':
+                    await self.send({'type': 'pong'})
+                    continue
                 self._handle_message(data)
             except Exception as e:
                 self.logger.error(f"Error in message loop: {e}")
@@ -90,7 +108,7 @@ class WebSocketService:
             return False
             
         try:
-            await self.connection.send(json.dumps(message))
+            await self.connection.send(pack(message) if self.binary else json.dumps(message))
             return True
         except Exception as e:
             self.logger.error(f"Failed to send WebSocket message: {e}")
@@ -0,0 +1,59 @@
+"""
+The client answers the backend heartbeat, so a socket that only listens is
+not reaped by the server's pong timeout.
+"""
+import asyncio
+import json
+
+import pytest
+
+from billo.services.websocket import WebSocketService
+from shared.utils.codecs import msgpack_available, pack, unpack
+
+
+class FakeConnection:
+    """Yields the queued frames, then fails like a dropped socket"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.sent = []
+
+    async def recv(self):
+        if not self.frames:
+            raise ConnectionError("closed")
+        return self.frames.pop(0)
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+def run(service, frames):
+    service.connection = FakeConnection(frames)
+    service.connected = True
+    asyncio.run(service._message_loop())
+    return service.connection.sent
+
+
+def test_pings_are_answered_with_pong():
+    service = WebSocketService()
+    seen = []
+    service.subscribe("order_ready", seen.append)
+
+    sent = run(service, [
+        json.dumps({"type": "ping", "ts": 1.0}),
+        json.dumps({"type": "order_ready", "order_id": "o1"}),
+        json.dumps({"type": "ping", "ts": 2.0}),
+    ])
+
+    assert [json.loads(message) for message in sent] == [{"type": "pong"}, {"type": "pong"}]
+    assert seen == [{"type": "order_ready", "order_id": "o1"}]
+
+
+@pytest.mark.skipif(not msgpack_available(), reason="msgpack not installed")
+def test_pong_uses_the_negotiated_encoding():
+    service = WebSocketService()
+    service.binary = True
+
+    sent = run(service, [pack({"type": "ping", "ts": 1.0})])
+
+    assert [unpack(message) for message in sent] == [{"type": "pong"}]
@@ -8,6 +8,8 @@ from typing import Optional
 import os
 from dotenv import load_dotenv
 
+from .config.settings import settings
+
 # Load environment variables
 load_dotenv()
 
@@ -23,6 +25,7 @@ fake_users_db = {
         "email": "admin@billo.app",
         "hashed_password": "$2b$12$EixZaYVK1fsbw1ZfbX3OXePaWxn96p36WQoeG6Lruj3vjPGga31lW",  # "secret"
         "disabled": False,
+        "restaurant_id": settings.DEFAULT_RESTAURANT_ID,
     }
 }
 
@@ -31,11 +34,19 @@ class TokenData:
         self.email = email
 
 class User:
-    def __init__(self, username: str, email: str, hashed_password: str, disabled: bool = False):
+    def __init__(
+        self,
+        username: str,
+        email: str,
+        hashed_password: str,
+        disabled: bool = False,
+        restaurant_id: Optional[str] = None
+    ):
         self.username = username
         self.email = email
         self.hashed_password = hashed_password
         self.disabled = disabled
+        self.restaurant_id = restaurant_id  # Restaurant the staff member works for
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -65,7 +76,8 @@ def get_user(email: str) -> Optional[User]:
             username=user_data["username"],
             email=email,
             hashed_password=user_data["hashed_password"],
-            disabled=user_data.get("disabled", False)
+            disabled=user_data.get("disabled", False),
+            restaurant_id=user_data.get("restaurant_id")
         )
     return None
 
@@ -1,7 +1,13 @@
 from datetime import time, datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 from pydantic import BaseModel
 
+from shared.utils.business_hours import WEEKDAYS, WeeklySchedule
+
+# Compiled schedule, rebuilt lazily after invalidate()
+_schedule: Optional[WeeklySchedule] = None
+_hours_loader: Optional[Callable[[], Dict[str, List[Optional[str]]]]] = None
+
 class BusinessHours(BaseModel):
     """Business hours configuration for the restaurant."""
     monday: tuple[time, time] = (time(9, 0), time(22, 0))  # (open, close)
@@ -12,42 +18,39 @@ class BusinessHours(BaseModel):
     saturday: tuple[time, time] = (time(10, 0), time(23, 0))
     sunday: tuple[time, time] = (time(10, 0), time(21, 0))
 
+    @classmethod
+    def set_loader(cls, loader: Callable[[], Dict[str, List[Optional[str]]]]) -> None:
+        """Register where saved business hours are read from."""
+        global _hours_loader
+        _hours_loader = loader
+        cls.invalidate()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the compiled schedule so the next check recompiles it."""
+        global _schedule
+        _schedule = None
+
+    @classmethod
+    def schedule(cls) -> WeeklySchedule:
+        """Get the compiled weekly schedule, compiling it on first use."""
+        global _schedule
+        if _schedule is None:
+            if _hours_loader is not None:
+                hours = _hours_loader()
+            else:
+                defaults = cls()
+                hours = {day: getattr(defaults, day) for day in WEEKDAYS}
+            _schedule = WeeklySchedule.from_day_hours(hours)
+        return _schedule
+
     @classmethod
     def is_open_now(cls) -> bool:
         """Check if the restaurant is currently open based on business hours."""
-        now = datetime.now().time()
-        today = datetime.today().strftime('%A').lower()
-        
-        # Get today's hours (default to closed if not found)
-        hours = getattr(cls(), today, (None, None))
-        if not all(isinstance(t, time) for t in hours):
-            return False
-            
-        open_time, close_time = hours
-        return open_time <= now <= close_time
+        return cls.schedule().is_open(datetime.now())
 
     @classmethod
     def get_next_opening_time(cls) -> Optional[time]:
         """Get the next time the restaurant will be open."""
-        today = datetime.today()
-        current_time = today.time()
-        current_weekday = today.strftime('%A').lower()
-        
-        # Check remaining time today
-        hours = getattr(cls(), current_weekday, (None, None))
-        if all(isinstance(t, time) for t in hours):
-            open_time, close_time = hours
-            if current_time < close_time:
-                return close_time
-        
-        # Find next open day
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        current_idx = weekdays.index(current_weekday)
-        
-        for i in range(1, 8):  # Check next 7 days
-            next_day = weekdays[(current_idx + i) % 7]
-            hours = getattr(cls(), next_day, (None, None))
-            if all(isinstance(t, time) for t in hours):
-                return hours[0]  # Return opening time of next open day
-                
-        return None
+        next_open = cls.schedule().next_opening(datetime.now())
+        return next_open.time() if next_open else None
@@ -27,6 +27,21 @@ class Settings(BaseSettings):
         db_port = "5432"
         DATABASE_URL = f"postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
     
+    # Connection pool (per worker); SQLite ignores everything but pre-ping
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    
+    # Waiter and tab storage: "database" keeps state across restarts,
+    # "memory" is for local development and starts from sample data
+    REPOSITORY_BACKEND: str = os.getenv("REPOSITORY_BACKEND", "database" if DATABASE_URL else "memory")
+    DEFAULT_RESTAURANT_ID: str = os.getenv("DEFAULT_RESTAURANT_ID", "default")
+    
+    # How often the dashboard's in-memory counters are checked against the database
+    DASHBOARD_STATS_RECONCILE_SECONDS: float = float(os.getenv("DASHBOARD_STATS_RECONCILE_SECONDS", "60"))
+    
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", SUPABASE_JWT_SECRET or "your-secret-key-here")
     ALGORITHM: str = "HS256"
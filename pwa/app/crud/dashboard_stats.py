@@ -0,0 +1,260 @@
+"""
+Rolling per-restaurant counters for the owner dashboard.
+
+The crud functions that write orders, payments and tabs call the hooks
+below after they commit, so the dashboard reads its numbers from memory
+instead of scanning the day's orders and payments on every refresh.
+A background task periodically recomputes every counter from the database
+(four grouped queries) and replaces the in-memory values, which repairs any
+drift from writes made by other processes or that raced a reconciliation.
+
+"Today" is the current UTC date, matching the UTC timestamps on orders
+and payments.
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime, time, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from ..database.models import (
+    Tab as DBTab,
+    TabStatus,
+    Order as DBOrder,
+    OrderStatus,
+    Payment as DBPayment,
+    PaymentStatus,
+    OPEN_TAB_CONDITION
+)
+
+logger = logging.getLogger(__name__)
+
+# Orders the kitchen or floor still has to act on
+PENDING_ORDER_STATUSES = (OrderStatus.PLACED, OrderStatus.PREPARING, OrderStatus.READY)
+
+# Tabs that occupy a table (same statuses as OPEN_TAB_CONDITION)
+OPEN_TAB_STATUSES = (TabStatus.ACTIVE, TabStatus.PAYMENT_PENDING)
+
+# Tab -> restaurant lookups are cached; tabs never move between restaurants
+MAX_CACHED_TABS = 10000
+
+def utc_today():
+    return datetime.now(timezone.utc).date()
+
+def is_today(timestamp: Optional[datetime]) -> bool:
+    """Whether a (naive UTC or aware) timestamp falls on the current UTC date"""
+    if timestamp is None:
+        return False
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.date() == utc_today()
+
+
+class RestaurantCounters:
+    """Live dashboard numbers for one restaurant"""
+
+    __slots__ = (
+        "business_date", "orders_today", "sales_cents_today", "revenue_cents_today",
+        "pending_orders", "tables_occupied", "reconciled_at"
+    )
+
+    def __init__(self):
+        self.business_date = utc_today()
+        self.orders_today = 0
+        self.sales_cents_today = 0  # Non-cancelled orders placed today
+        self.revenue_cents_today = 0  # Payments confirmed today
+        self.pending_orders = 0
+        self.tables_occupied = 0
+        self.reconciled_at: Optional[datetime] = None
+
+    def roll(self):
+        """Start a new day: daily counters reset, live ones carry over"""
+        today = utc_today()
+        if self.business_date != today:
+            self.business_date = today
+            self.orders_today = 0
+            self.sales_cents_today = 0
+            self.revenue_cents_today = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "business_date": self.business_date.isoformat(),
+            "orders_today": self.orders_today,
+            "revenue_today": self.revenue_cents_today / 100,
+            "pending_orders": self.pending_orders,
+            "average_ticket": round(self.sales_cents_today / self.orders_today / 100, 2) if self.orders_today else 0.0,
+            "tables_occupied": self.tables_occupied,
+            "reconciled_at": self.reconciled_at.isoformat() if self.reconciled_at else None,
+        }
+
+
+class DashboardStats:
+    """
+    Counters for every restaurant, updated by write hooks and replaced
+    wholesale by `reconcile`. All access goes through one lock because the
+    hooks run inside crud functions, which may be called from any thread.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, RestaurantCounters] = {}
+        self._tab_restaurants: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, restaurant_id: str) -> RestaurantCounters:
+        # Caller holds the lock
+        counters = self._counters.get(restaurant_id)
+        if counters is None:
+            counters = self._counters[restaurant_id] = RestaurantCounters()
+        counters.roll()
+        return counters
+
+    def restaurant_for_tab(self, db: Session, tab_id: str) -> Optional[str]:
+        with self._lock:
+            restaurant_id = self._tab_restaurants.get(tab_id)
+        if restaurant_id is None:
+            restaurant_id = db.query(DBTab.restaurant_id).filter(DBTab.id == tab_id).scalar()
+            if restaurant_id is not None:
+                with self._lock:
+                    if len(self._tab_restaurants) >= MAX_CACHED_TABS:
+                        self._tab_restaurants.clear()
+                    self._tab_restaurants[tab_id] = restaurant_id
+        return restaurant_id
+
+    def snapshot(self, restaurant_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._get(restaurant_id).snapshot()
+
+    # Write hooks, called after the change is committed
+
+    def order_placed(self, db: Session, tab_id: str, total_cents: int, status: OrderStatus = OrderStatus.PLACED):
+        restaurant_id = self.restaurant_for_tab(db, tab_id)
+        if restaurant_id is None or status == OrderStatus.CANCELLED:
+            return
+        with self._lock:
+            counters = self._get(restaurant_id)
+            counters.orders_today += 1
+            counters.sales_cents_today += total_cents
+            if status in PENDING_ORDER_STATUSES:
+                counters.pending_orders += 1
+
+    def order_status_changed(
+        self,
+        db: Session,
+        tab_id: str,
+        old_status: OrderStatus,
+        new_status: OrderStatus,
+        total_cents: int,
+        placed_at: Optional[datetime]
+    ):
+        if old_status == new_status:
+            return
+        restaurant_id = self.restaurant_for_tab(db, tab_id)
+        if restaurant_id is None:
+            return
+        with self._lock:
+            counters = self._get(restaurant_id)
+            counters.pending_orders += (new_status in PENDING_ORDER_STATUSES) - (old_status in PENDING_ORDER_STATUSES)
+            was_cancelled = old_status == OrderStatus.CANCELLED
+            is_cancelled = new_status == OrderStatus.CANCELLED
+            if was_cancelled != is_cancelled and is_today(placed_at):
+                sign = -1 if is_cancelled else 1
+                counters.orders_today += sign
+                counters.sales_cents_today += sign * total_cents
+
+    def payment_changed(self, db: Session, tab_id: str, old_status: Optional[PaymentStatus], new_status: PaymentStatus, amount_cents: int):
+        was_confirmed = old_status == PaymentStatus.CONFIRMED
+        is_confirmed = new_status == PaymentStatus.CONFIRMED
+        if was_confirmed == is_confirmed:
+            return
+        restaurant_id = self.restaurant_for_tab(db, tab_id)
+        if restaurant_id is None:
+            return
+        with self._lock:
+            counters = self._get(restaurant_id)
+            counters.revenue_cents_today += amount_cents if is_confirmed else -amount_cents
+
+    def tab_status_changed(self, restaurant_id: str, old_status: Optional[TabStatus], new_status: TabStatus):
+        delta = (new_status in OPEN_TAB_STATUSES) - (old_status in OPEN_TAB_STATUSES)
+        if not delta or restaurant_id is None:
+            return
+        with self._lock:
+            self._get(restaurant_id).tables_occupied += delta
+
+    # Reconciliation
+
+    def reconcile(self, db: Session) -> int:
+        """
+        Recompute every restaurant's counters from the database and replace
+        the in-memory ones. Returns the number of restaurants tracked.
+        """
+        day_start = datetime.combine(utc_today(), time.min)
+        fresh: Dict[str, RestaurantCounters] = {}
+
+        def counters_for(restaurant_id: str) -> RestaurantCounters:
+            if restaurant_id not in fresh:
+                fresh[restaurant_id] = RestaurantCounters()
+            return fresh[restaurant_id]
+
+        # create_order always sets total_cents; orders without it are
+        # legacy rows from before today
+        orders = db.query(
+            DBTab.restaurant_id, func.count(DBOrder.id), func.sum(func.coalesce(DBOrder.total_cents, 0))
+        ).join(DBTab, DBTab.id == DBOrder.tab_id).filter(
+            DBOrder.placed_at >= day_start,
+            DBOrder.status != OrderStatus.CANCELLED
+        ).group_by(DBTab.restaurant_id)
+        for restaurant_id, count, cents in orders:
+            counters = counters_for(restaurant_id)
+            counters.orders_today = count
+            counters.sales_cents_today = int(cents or 0)
+
+        pending = db.query(DBTab.restaurant_id, func.count(DBOrder.id)).join(
+            DBTab, DBTab.id == DBOrder.tab_id
+        ).filter(DBOrder.status.in_(PENDING_ORDER_STATUSES)).group_by(DBTab.restaurant_id)
+        for restaurant_id, count in pending:
+            counters_for(restaurant_id).pending_orders = count
+
+        revenue = db.query(
+            DBTab.restaurant_id, func.sum(func.round(DBPayment.amount * 100))
+        ).join(DBTab, DBTab.id == DBPayment.tab_id).filter(
+            DBPayment.status == PaymentStatus.CONFIRMED,
+            DBPayment.completed_at >= day_start
+        ).group_by(DBTab.restaurant_id)
+        for restaurant_id, cents in revenue:
+            counters_for(restaurant_id).revenue_cents_today = int(cents or 0)
+
+        occupied = db.query(DBTab.restaurant_id, func.count(DBTab.id)).filter(
+            text(OPEN_TAB_CONDITION)
+        ).group_by(DBTab.restaurant_id)
+        for restaurant_id, count in occupied:
+            counters_for(restaurant_id).tables_occupied = count
+
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            # Restaurants with no activity today go back to zero
+            for restaurant_id in self._counters:
+                counters_for(restaurant_id)
+            for counters in fresh.values():
+                counters.reconciled_at = now
+            self._counters = fresh
+        return len(fresh)
+
+    async def run_reconciler(self, interval: float):
+        """Reconcile now and then every `interval` seconds until cancelled"""
+        from ..database.base import AsyncSessionLocal, run_sync
+
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await run_sync(db, self.reconcile)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Dashboard stats reconciliation failed: {e}")
+            await asyncio.sleep(interval)
+
+# Create a single instance of the dashboard stats
+dashboard_stats = DashboardStats()
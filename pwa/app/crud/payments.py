@@ -0,0 +1,78 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+from ..database.models import Payment as DBPayment, PaymentMethod, PaymentStatus
+from .dashboard_stats import dashboard_stats
+from .tabs import apply_tab_delta, to_cents
+
+def get_payment(db: Session, payment_id: str) -> Optional[DBPayment]:
+    """Get a payment by ID"""
+    return db.query(DBPayment).filter(DBPayment.id == payment_id).first()
+
+def get_tab_payments(db: Session, tab_id: str) -> List[DBPayment]:
+    """Get all payments for a tab, newest first"""
+    return db.query(DBPayment).filter(
+        DBPayment.tab_id == tab_id
+    ).order_by(DBPayment.processed_at.desc()).all()
+
+def create_payment(
+    db: Session,
+    tab_id: str,
+    amount: float,
+    payment_method: PaymentMethod,
+    reference: Optional[str] = None,
+    processed_by: Optional[str] = None,
+    status: PaymentStatus = PaymentStatus.PENDING
+) -> DBPayment:
+    """Record a payment against a tab, crediting the tab if it is already confirmed"""
+    now = datetime.utcnow()
+    db_payment = DBPayment(
+        id=str(uuid.uuid4()),
+        tab_id=tab_id,
+        amount=amount,
+        payment_method=payment_method,
+        status=status,
+        reference=reference,
+        processed_by=processed_by,
+        processed_at=now,
+        completed_at=now if status == PaymentStatus.CONFIRMED else None
+    )
+    db.add(db_payment)
+    if status == PaymentStatus.CONFIRMED:
+        apply_tab_delta(db, tab_id, paid_cents=to_cents(amount))
+    db.commit()
+    dashboard_stats.payment_changed(db, tab_id, None, status, to_cents(amount))
+    return db_payment
+
+def update_payment_status(
+    db: Session,
+    payment_id: str,
+    status: PaymentStatus,
+    failure_reason: Optional[str] = None
+) -> Optional[DBPayment]:
+    """
+    Update a payment's status, crediting or debiting the tab when the
+    payment moves into or out of CONFIRMED
+    """
+    db_payment = get_payment(db, payment_id)
+    if not db_payment:
+        return None
+    
+    previous_status = db_payment.status
+    was_confirmed = previous_status == PaymentStatus.CONFIRMED
+    is_confirmed = status == PaymentStatus.CONFIRMED
+    if was_confirmed != is_confirmed:
+        amount_cents = to_cents(db_payment.amount)
+        apply_tab_delta(db, db_payment.tab_id, paid_cents=amount_cents if is_confirmed else -amount_cents)
+    
+    db_payment.status = status
+    if is_confirmed:
+        db_payment.completed_at = datetime.utcnow()
+    if failure_reason is not None:
+        db_payment.failure_reason = failure_reason
+    
+    db.commit()
+    dashboard_stats.payment_changed(db, db_payment.tab_id, previous_status, status, to_cents(db_payment.amount))
+    return db_payment
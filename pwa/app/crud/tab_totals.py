@@ -0,0 +1,107 @@
+"""
+Consistency check for the running totals stored on tabs.
+
+subtotal_cents, paid_cents and balance_cents are maintained by deltas as
+orders and payments are written. This job recomputes them from the orders,
+order items and payments tables with three aggregate queries and reports
+(or, with --fix, repairs) any tab whose stored totals have drifted.
+
+    python -m app.crud.tab_totals [--fix]
+"""
+import argparse
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from ..database.models import (
+    Tab as DBTab,
+    Order as DBOrder,
+    OrderItem as DBOrderItem,
+    OrderStatus,
+    Payment as DBPayment,
+    PaymentStatus
+)
+
+logger = logging.getLogger(__name__)
+
+def expected_tab_totals(db: Session) -> Dict[str, Dict[str, int]]:
+    """Recompute subtotal and paid cents for every tab with orders or payments"""
+    item_totals = db.query(
+        DBOrderItem.order_id.label("order_id"),
+        func.sum(func.round(DBOrderItem.price * 100) * DBOrderItem.quantity).label("items_cents")
+    ).group_by(DBOrderItem.order_id).subquery()
+    
+    order_cents = case(
+        (DBOrder.total_cents.isnot(None), DBOrder.total_cents),
+        else_=func.coalesce(item_totals.c.items_cents, 0)
+    )
+    subtotals = db.query(DBOrder.tab_id, func.sum(order_cents)).outerjoin(
+        item_totals, item_totals.c.order_id == DBOrder.id
+    ).filter(
+        DBOrder.status != OrderStatus.CANCELLED
+    ).group_by(DBOrder.tab_id)
+    
+    paid = db.query(
+        DBPayment.tab_id, func.sum(func.round(DBPayment.amount * 100))
+    ).filter(
+        DBPayment.status == PaymentStatus.CONFIRMED
+    ).group_by(DBPayment.tab_id)
+    
+    totals: Dict[str, Dict[str, int]] = {}
+    for tab_id, cents in subtotals:
+        totals.setdefault(tab_id, {"subtotal_cents": 0, "paid_cents": 0})["subtotal_cents"] = int(cents or 0)
+    for tab_id, cents in paid:
+        totals.setdefault(tab_id, {"subtotal_cents": 0, "paid_cents": 0})["paid_cents"] = int(cents or 0)
+    return totals
+
+def check_tab_totals(db: Session, fix: bool = False) -> List[Dict[str, object]]:
+    """
+    Compare stored tab totals against recomputed ones.
+    
+    Returns one entry per drifted tab with the stored and expected values.
+    With fix=True the drifted tabs are corrected in a single bulk update.
+    """
+    expected = expected_tab_totals(db)
+    stored = db.query(
+        DBTab.id, DBTab.subtotal_cents, DBTab.paid_cents, DBTab.balance_cents
+    )
+    
+    drifted = []
+    for tab_id, subtotal_cents, paid_cents, balance_cents in stored:
+        want = expected.get(tab_id, {"subtotal_cents": 0, "paid_cents": 0})
+        want_balance = want["subtotal_cents"] - want["paid_cents"]
+        if (subtotal_cents, paid_cents, balance_cents) != (want["subtotal_cents"], want["paid_cents"], want_balance):
+            drifted.append({
+                "id": tab_id,
+                "stored": {"subtotal_cents": subtotal_cents, "paid_cents": paid_cents, "balance_cents": balance_cents},
+                "expected": {**want, "balance_cents": want_balance}
+            })
+    
+    if fix and drifted:
+        db.execute(update(DBTab), [{"id": d["id"], **d["expected"]} for d in drifted])
+        db.commit()
+    return drifted
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check denormalized tab totals")
+    parser.add_argument("--fix", action="store_true", help="Correct drifted tabs")
+    args = parser.parse_args(argv)
+    
+    from ..database.base import SessionLocal
+    
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        drifted = check_tab_totals(db, fix=args.fix)
+    finally:
+        db.close()
+    
+    for entry in drifted:
+        logger.warning(f"Tab {entry['id']}: stored {entry['stored']}, expected {entry['expected']}")
+    logger.info(f"{len(drifted)} tab(s) drifted{' and fixed' if args.fix and drifted else ''}")
+    return 1 if drifted and not args.fix else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,29 +1,112 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func, insert, text, update
+from sqlalchemy.orm import Session, load_only, raiseload, selectinload
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+import uuid
 
 from ..models.tables import TabCreate, Tab, TabStatus, OrderCreate, Order, OrderStatus
-from ..database.models import Tab as DBTab, Order as DBOrder, OrderItem as DBOrderItem
+from ..database.models import (
+    Tab as DBTab,
+    Order as DBOrder,
+    OrderItem as DBOrderItem,
+    OrderStatus as DBOrderStatus,
+    OPEN_TAB_CONDITION
+)
+from .dashboard_stats import dashboard_stats
 
-def get_tab(db: Session, tab_id: int) -> Optional[DBTab]:
+def to_cents(amount: float) -> int:
+    """Convert a currency amount to integer cents, rounding half up"""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+def apply_tab_delta(db: Session, tab_id, subtotal_cents: int = 0, paid_cents: int = 0) -> None:
+    """
+    Adjust a tab's running totals by the given deltas.
+    
+    The update is done in SQL (column = column + delta) so concurrent writers
+    never overwrite each other. It runs in the caller's transaction; the
+    caller commits together with the row that caused the change.
+    """
+    if not subtotal_cents and not paid_cents:
+        return
+    db.execute(
+        update(DBTab)
+        .where(DBTab.id == tab_id)
+        .values(
+            subtotal_cents=DBTab.subtotal_cents + subtotal_cents,
+            paid_cents=DBTab.paid_cents + paid_cents,
+            balance_cents=DBTab.balance_cents + subtotal_cents - paid_cents
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+def order_total_cents(db: Session, db_order: DBOrder) -> int:
+    """Total of an order in cents, from total_cents or its items"""
+    if db_order.total_cents is not None:
+        return db_order.total_cents
+    total = db.query(
+        func.sum(func.round(DBOrderItem.price * 100) * DBOrderItem.quantity)
+    ).filter(DBOrderItem.order_id == db_order.id).scalar()
+    return int(total or 0)
+
+# Named loading profiles for tab reads. Each endpoint picks the profile that
+# matches what it renders, so relationships are loaded in a fixed number of
+# queries instead of lazily per row.
+#   list:   tab columns and running totals only; touching a relationship raises
+#   detail: orders with their items, and payments, each loaded in one extra query
+TAB_LOAD_PROFILES: Dict[str, Tuple] = {
+    "list": (
+        load_only(
+            DBTab.id, DBTab.restaurant_id, DBTab.number, DBTab.business_date, DBTab.status, DBTab.customer_name,
+            DBTab.subtotal_cents, DBTab.paid_cents, DBTab.balance_cents,
+            DBTab.created_at, DBTab.updated_at
+        ),
+        raiseload("*"),
+    ),
+    "detail": (
+        selectinload(DBTab.orders).selectinload(DBOrder.items),
+        selectinload(DBTab.payments),
+    ),
+}
+
+def tab_query(db: Session, profile: str = "list"):
+    """Query tabs with the given loading profile applied"""
+    try:
+        options = TAB_LOAD_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown tab load profile: {profile}")
+    return db.query(DBTab).options(*options)
+
+def get_tab(db: Session, tab_id: int, profile: str = "detail") -> Optional[DBTab]:
     """Get a tab by ID"""
-    return db.query(DBTab).filter(DBTab.id == tab_id).first()
+    return tab_query(db, profile).filter(DBTab.id == tab_id).first()
 
-def get_tab_by_number(db: Session, number: str) -> Optional[DBTab]:
+def get_tab_by_number(db: Session, number: str, profile: str = "detail") -> Optional[DBTab]:
     """Get a tab by tab number"""
-    return db.query(DBTab).filter(DBTab.number == number).first()
+    return tab_query(db, profile).filter(DBTab.number == number).first()
 
 def get_tabs(
     db: Session, 
     skip: int = 0, 
     limit: int = 100,
-    status: Optional[TabStatus] = None
+    status: Optional[TabStatus] = None,
+    profile: str = "list",
+    restaurant_id: Optional[str] = None
 ) -> List[DBTab]:
-    """Get a list of tabs with optional filtering by status"""
-    query = db.query(DBTab)
+    """Get a list of tabs, newest first, with optional filtering by restaurant and status"""
+    query = tab_query(db, profile)
+    if restaurant_id:
+        query = query.filter(DBTab.restaurant_id == restaurant_id)
     if status:
         query = query.filter(DBTab.status == status)
-    return query.offset(skip).limit(limit).all()
+    return query.order_by(DBTab.created_at.desc()).offset(skip).limit(limit).all()
+
+def get_open_tabs(db: Session, restaurant_id: str, profile: str = "list") -> List[DBTab]:
+    """Get a restaurant's active and payment-pending tabs, newest first"""
+    return tab_query(db, profile).filter(
+        DBTab.restaurant_id == restaurant_id,
+        text(OPEN_TAB_CONDITION)
+    ).order_by(DBTab.created_at.desc()).all()
 
 def create_tab(db: Session, tab: TabCreate) -> DBTab:
     """Create a new tab"""
@@ -36,6 +119,7 @@ def create_tab(db: Session, tab: TabCreate) -> DBTab:
     db.add(db_tab)
     db.commit()
     db.refresh(db_tab)
+    dashboard_stats.tab_status_changed(db_tab.restaurant_id, None, db_tab.status)
     return db_tab
 
 def update_tab_status(
@@ -45,10 +129,11 @@ def update_tab_status(
     customer_name: Optional[str] = None
 ) -> Optional[DBTab]:
     """Update a tab's status and optionally customer name"""
-    db_tab = get_tab(db, tab_id)
+    db_tab = get_tab(db, tab_id, profile="list")
     if not db_tab:
         return None
     
+    previous_status = db_tab.status
     db_tab.status = status
     if customer_name is not None:
         db_tab.customer_name = customer_name
@@ -56,34 +141,59 @@ def update_tab_status(
     
     db.commit()
     db.refresh(db_tab)
+    dashboard_stats.tab_status_changed(db_tab.restaurant_id, previous_status, db_tab.status)
     return db_tab
 
 def create_order(db: Session, order: OrderCreate, tab_id: int) -> DBOrder:
-    """Create a new order for a tab"""
-    db_order = DBOrder(
-        tab_id=tab_id,
-        status=order.status,
-        customer_name=order.customer_name,
-        special_instructions=order.special_instructions
-    )
+    """
+    Create a new order for a tab in a single transaction.
     
-    db.add(db_order)
-    db.flush()  # Flush to get the order ID for the items
+    IDs are generated up front, so the order and all of its items go out as
+    two INSERT statements (the items as one executemany) no matter how many
+    items there are. The total is computed in integer cents, and the returned
+    order is built from the inserted values instead of being read back.
+    """
+    now = datetime.utcnow()
+    order_id = str(uuid.uuid4())
     
-    # Add order items
+    item_rows = []
+    total_cents = 0
     for item in order.items:
-        db_item = DBOrderItem(
-            order_id=db_order.id,
-            menu_item_id=item.menu_item_id,
-            name=item.name,
-            quantity=item.quantity,
-            price=item.price,
-            notes=item.notes
-        )
-        db.add(db_item)
+        price_cents = to_cents(item.price)
+        total_cents += price_cents * item.quantity
+        item_rows.append({
+            "id": str(uuid.uuid4()),
+            "order_id": order_id,
+            "menu_item_id": str(item.menu_item_id),
+            "name": item.name,
+            "quantity": item.quantity,
+            "price": price_cents / 100,
+            "notes": item.notes,
+            "created_at": now
+        })
     
-    db.commit()
-    db.refresh(db_order)
+    order_row = {
+        "id": order_id,
+        "tab_id": tab_id,
+        "status": DBOrderStatus(order.status.value),
+        "special_instructions": order.special_instructions,
+        "total_cents": total_cents,
+        "placed_at": now
+    }
+    
+    try:
+        db.execute(insert(DBOrder), [order_row])
+        if item_rows:
+            db.execute(insert(DBOrderItem), item_rows)
+        apply_tab_delta(db, tab_id, subtotal_cents=total_cents)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    dashboard_stats.order_placed(db, tab_id, total_cents, order_row["status"])
+    
+    db_order = DBOrder(**order_row)
+    db_order.items = [DBOrderItem(**row) for row in item_rows]
     return db_order
 
 def get_order(db: Session, order_id: int) -> Optional[DBOrder]:
@@ -95,16 +205,27 @@ def update_order_status(
     order_id: int, 
     status: OrderStatus
 ) -> Optional[DBOrder]:
-    """Update an order's status"""
+    """Update an order's status, taking cancelled orders off the tab total"""
     db_order = get_order(db, order_id)
     if not db_order:
         return None
     
+    previous_status = db_order.status
+    was_cancelled = previous_status == DBOrderStatus.CANCELLED
+    is_cancelled = status == DBOrderStatus.CANCELLED
+    total = order_total_cents(db, db_order) if was_cancelled != is_cancelled else 0
+    if total:
+        apply_tab_delta(db, db_order.tab_id, subtotal_cents=-total if is_cancelled else total)
+    
     db_order.status = status
     db_order.updated_at = datetime.utcnow()
     
     db.commit()
     db.refresh(db_order)
+    dashboard_stats.order_status_changed(
+        db, db_order.tab_id, DBOrderStatus(previous_status), DBOrderStatus(db_order.status),
+        total, db_order.placed_at
+    )
     return db_order
 
 def get_tab_orders(
@@ -1,19 +1,170 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from ..config import settings
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Optional, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from ..config.settings import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Async drivers used for each sync database URL scheme
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+T = TypeVar("T")
+
+def async_database_url(url: str) -> str:
+    """Rewrite a sync database URL to use the matching async driver"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+def pool_options(url: str) -> Dict[str, Any]:
+    """Pool settings from the environment; SQLite uses its own pool classes"""
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+
+class PoolMetrics:
+    """
+    Connection pool gauges and counters, fed by pool events.
+
+    `saturation` is the share of the pool's capacity (size + overflow) that
+    is checked out right now; `peak_checked_out` shows how close the pool
+    has come to making callers wait for a connection.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine):
+        # Pool events registered on the engine survive pool recreation
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "saturation": round(self.checked_out / self.capacity, 4) if self.capacity else None,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+
+
+def _capacity(url: str) -> Optional[int]:
+    options = pool_options(url)
+    if "pool_size" not in options:
+        return None
+    return options["pool_size"] + max(options["max_overflow"], 0)
+
+# Sync engine and sessions, kept for scripts, migrations and tests
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **pool_options(SQLALCHEMY_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db():
-    """Dependency to get DB session"""
+# Async engine used by the FastAPI routes, created on first use so importing
+# this module does not require the async driver
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+async_pool_metrics = PoolMetrics(_capacity(SQLALCHEMY_DATABASE_URL))
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            async_database_url(SQLALCHEMY_DATABASE_URL),
+            **pool_options(SQLALCHEMY_DATABASE_URL)
+        )
+        async_pool_metrics.attach(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(
+            _async_engine, expire_on_commit=False, autoflush=False
+        )
+    return _async_engine
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Create a new AsyncSession bound to the shared async engine"""
+    get_async_engine()
+    return _async_session_factory()
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async DB session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_sync_db():
+    """Dependency to get a sync DB session (blocks the event loop; scripts only)"""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def run_sync(db: AsyncSession, func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call a sync crud function with an AsyncSession.
+
+    The function receives a regular Session running on the async
+    connection, so existing crud code works from async routes without
+    blocking the event loop.
+    """
+    return await db.run_sync(lambda session: func(session, *args, **kwargs))
+
+async def dispose_async_engine():
+    """Close the async pool, e.g. on application shutdown"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+def pool_stats() -> Dict[str, Any]:
+    """Pool gauges for the async engine (used by the health endpoint)"""
+    stats = async_pool_metrics.snapshot()
+    if _async_engine is not None:
+        stats["status"] = _async_engine.sync_engine.pool.status()
+    return stats
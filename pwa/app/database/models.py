@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Text, Boolean
+from sqlalchemy import Table, Column, Integer, String, Float, Date, DateTime, ForeignKey, Enum, Text, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime, date
@@ -39,15 +39,20 @@ class PaymentMethod(str, enum.Enum):
 order_waiter = Table(
     'order_waiter',
     Base.metadata,
-    Column('order_id', Integer, ForeignKey('orders.id'), primary_key=True),
-    Column('waiter_id', Integer, ForeignKey('users.id'), primary_key=True),
+    Column('order_id', String, ForeignKey('orders.id'), primary_key=True),
+    Column('waiter_id', String, ForeignKey('users.id'), primary_key=True),
     Column('assigned_at', DateTime(timezone=True), server_default=func.now())
 )
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        # A restaurant's staff by role, e.g. its active waiters
+        Index('ix_users_restaurant_role_active', 'restaurant_id', 'role', 'is_active'),
+    )
     
     id = Column(String, primary_key=True)  # Supabase auth ID
+    restaurant_id = Column(String, ForeignKey('restaurants.id'), nullable=True)  # Staff only
     email = Column(String, unique=True, index=True, nullable=False)
     full_name = Column(String)
     phone_number = Column(String)
@@ -76,16 +81,39 @@ class Restaurant(Base):
     tabs = relationship("Tab", back_populates="restaurant")
     menu_items = relationship("MenuItem", back_populates="restaurant")
 
+# Condition for open tabs, shared by the partial index and the queries that
+# use it (the planner only picks a partial index when the WHERE matches)
+OPEN_TAB_CONDITION = "status IN ('ACTIVE', 'PAYMENT_PENDING')"
+
 class Tab(Base):
     __tablename__ = 'tabs'
+    __table_args__ = (
+        # Dashboard listings: a restaurant's tabs by status, newest first
+        Index('ix_tabs_restaurant_status_created', 'restaurant_id', 'status', 'created_at'),
+        # Open tabs only, so the live dashboard does not touch closed history
+        Index(
+            'ix_tabs_restaurant_open_created', 'restaurant_id', 'created_at',
+            postgresql_where=text(OPEN_TAB_CONDITION),
+            sqlite_where=text(OPEN_TAB_CONDITION)
+        ),
+        # Tab numbers restart every day for each restaurant
+        Index('uq_tabs_restaurant_date_number', 'restaurant_id', 'business_date', 'number', unique=True),
+    )
     
     id = Column(String, primary_key=True)  # UUID
     restaurant_id = Column(String, ForeignKey('restaurants.id'), nullable=False)
     number = Column(String(10), index=True, nullable=False)  # e.g., "T-001"
+    business_date = Column(Date, default=date.today, nullable=False)  # Day the tab number belongs to
     status = Column(Enum(TabStatus), default=TabStatus.INACTIVE, nullable=False)
     customer_name = Column(String(100))
     customer_phone = Column(String(20))
     customer_email = Column(String(100))
+    # Running totals in cents, maintained by deltas in app.crud and checked by
+    # app.crud.tab_totals. subtotal excludes cancelled orders; paid counts
+    # confirmed payments only.
+    subtotal_cents = Column(Integer, nullable=False, default=0, server_default='0')
+    paid_cents = Column(Integer, nullable=False, default=0, server_default='0')
+    balance_cents = Column(Integer, nullable=False, default=0, server_default='0')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     closed_at = Column(DateTime(timezone=True), nullable=True)
@@ -99,26 +127,29 @@ class Tab(Base):
     @property
     def total_amount(self) -> float:
         """Total amount for all orders in this tab"""
-        return sum(order.total_amount for order in self.orders)
+        return (self.subtotal_cents or 0) / 100
     
     @property
     def amount_paid(self) -> float:
         """Total amount paid for this tab"""
-        return sum(payment.amount for payment in self.payments 
-                  if payment.status == PaymentStatus.CONFIRMED)
+        return (self.paid_cents or 0) / 100
     
     @property
     def balance(self) -> float:
         """Remaining balance for this tab"""
-        return self.total_amount - self.amount_paid
+        return (self.balance_cents or 0) / 100
 
 class Order(Base):
     __tablename__ = 'orders'
+    __table_args__ = (
+        Index('ix_orders_tab_status', 'tab_id', 'status'),
+    )
     
     id = Column(String, primary_key=True)  # UUID
     tab_id = Column(String, ForeignKey('tabs.id'), nullable=False, index=True)
     status = Column(Enum(OrderStatus), default=OrderStatus.PLACED, nullable=False)
     special_instructions = Column(Text)
+    total_cents = Column(Integer)  # Computed at placement from item prices
     placed_at = Column(DateTime(timezone=True), server_default=func.now())
     prepared_at = Column(DateTime(timezone=True), nullable=True)
     ready_at = Column(DateTime(timezone=True), nullable=True)
@@ -134,6 +165,8 @@ class Order(Base):
     @property
     def total_amount(self) -> float:
         """Total amount for this order (sum of all items)"""
+        if self.total_cents is not None:
+            return self.total_cents / 100
         return sum(item.price * item.quantity for item in self.items)
 
 class OrderItem(Base):
@@ -173,6 +206,9 @@ class Payment(Base):
 
 class Message(Base):
     __tablename__ = 'messages'
+    __table_args__ = (
+        Index('ix_messages_tab_is_read', 'tab_id', 'is_read'),
+    )
     
     id = Column(String, primary_key=True)  # UUID
     tab_id = Column(String, ForeignKey('tabs.id'), nullable=False, index=True)
@@ -189,6 +225,10 @@ class Message(Base):
 # Menu models (simplified - could be in a separate file)
 class MenuItem(Base):
     __tablename__ = 'menu_items'
+    __table_args__ = (
+        Index('ix_menu_items_restaurant_category', 'restaurant_id', 'category'),
+        Index('ix_menu_items_restaurant_available', 'restaurant_id', 'is_available'),
+    )
     
     id = Column(String, primary_key=True)  # UUID
     restaurant_id = Column(String, ForeignKey('restaurants.id'), nullable=False, index=True)
@@ -8,8 +8,10 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from datetime import timedelta, datetime
 from typing import Optional
+import asyncio
 import os
 import secrets
+import sys
 
 # Import routers and auth
 from .routers import dashboard, business_hours
@@ -147,6 +149,33 @@ def create_app():
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @app.get("/health/db")
+    async def database_health():
+        from .database.base import pool_stats
+        return pool_stats()
+    
+    @app.on_event("startup")
+    async def start_dashboard_stats():
+        from .config.settings import settings
+        if settings.REPOSITORY_BACKEND.lower() == "database":
+            from .crud.dashboard_stats import dashboard_stats
+            app.state.dashboard_stats_task = asyncio.create_task(
+                dashboard_stats.run_reconciler(settings.DASHBOARD_STATS_RECONCILE_SECONDS)
+            )
+    
+    @app.on_event("shutdown")
+    async def stop_dashboard_stats():
+        task = getattr(app.state, "dashboard_stats_task", None)
+        if task is not None:
+            task.cancel()
+    
+    @app.on_event("shutdown")
+    async def close_database():
+        # Only if something opened the database during this run
+        base = sys.modules.get(f"{__package__}.database.base")
+        if base is not None:
+            await base.dispose_async_engine()
+    
     # Logout
     @app.get("/logout")
     @app.post("/logout")
@@ -0,0 +1,45 @@
+"""
+Waiter and tab repositories.
+
+The backend is chosen by settings.REPOSITORY_BACKEND: "database" stores
+everything in the PWA database so it survives restarts, "memory" keeps
+indexed dicts seeded with sample data for local development.
+"""
+from typing import Optional
+
+from ..config.settings import settings
+from .base import Record, TabRepository, WaiterRepository
+from .memory import IndexedStore, InMemoryTabRepository, InMemoryWaiterRepository
+
+_waiter_repository: Optional[WaiterRepository] = None
+_tab_repository: Optional[TabRepository] = None
+
+def _use_database() -> bool:
+    backend = settings.REPOSITORY_BACKEND.lower()
+    if backend not in ("database", "memory"):
+        raise ValueError(f"Unknown REPOSITORY_BACKEND: {settings.REPOSITORY_BACKEND}")
+    return backend == "database"
+
+def get_waiter_repository() -> WaiterRepository:
+    """Get the shared waiter repository"""
+    global _waiter_repository
+    if _waiter_repository is None:
+        if _use_database():
+            from .database import DatabaseWaiterRepository
+            _waiter_repository = DatabaseWaiterRepository()
+        else:
+            from .samples import SAMPLE_WAITERS
+            _waiter_repository = InMemoryWaiterRepository(SAMPLE_WAITERS)
+    return _waiter_repository
+
+def get_tab_repository() -> TabRepository:
+    """Get the shared tab repository"""
+    global _tab_repository
+    if _tab_repository is None:
+        if _use_database():
+            from .database import DatabaseTabRepository
+            _tab_repository = DatabaseTabRepository()
+        else:
+            from .samples import SAMPLE_TABS
+            _tab_repository = InMemoryTabRepository(SAMPLE_TABS)
+    return _tab_repository
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+# Tab statuses that take a tab off the live dashboard
+CLOSED_TAB_STATUSES = ("paid", "cancelled")
+
+# Records are plain dicts shaped the way the templates render them
+Record = Dict[str, Any]
+
+
+class WaiterRepository(ABC):
+    """Waiters, looked up by id or listed per restaurant"""
+
+    @abstractmethod
+    async def get(self, waiter_id) -> Optional[Record]:
+        """Get a waiter by ID"""
+
+    @abstractmethod
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        is_active: Optional[bool] = None
+    ) -> List[Record]:
+        """List waiters, optionally for one restaurant and by active flag"""
+
+    @abstractmethod
+    async def add(self, restaurant_id: str, **fields) -> Record:
+        """Add a waiter, allocating its ID"""
+
+    @abstractmethod
+    async def set_active(self, waiter_id, is_active: bool) -> Optional[Record]:
+        """Activate or deactivate a waiter; None if it does not exist"""
+
+
+class TabRepository(ABC):
+    """Tabs, looked up by id or listed per restaurant and status"""
+
+    @abstractmethod
+    async def get(self, tab_id) -> Optional[Record]:
+        """Get a tab by ID"""
+
+    @abstractmethod
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Record]:
+        """List tabs, optionally for one restaurant and status"""
+
+    @abstractmethod
+    async def list_open(self, restaurant_id: str) -> List[Record]:
+        """List a restaurant's tabs that are not paid or cancelled"""
+
+    @abstractmethod
+    async def open(self, restaurant_id: str, **fields) -> Record:
+        """
+        Open a tab, allocating its ID and the restaurant's next tab number.
+
+        Numbers restart every business day and are never handed out twice
+        for the same restaurant and day, even under concurrent calls.
+        """
+
+    @abstractmethod
+    async def set_status(self, tab_id, status: str) -> Optional[Record]:
+        """Change a tab's status; None if it does not exist"""
@@ -0,0 +1,214 @@
+import asyncio
+import uuid
+from collections import defaultdict
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config.settings import settings
+from ..crud.dashboard_stats import dashboard_stats
+from ..crud.tabs import get_open_tabs, get_tabs, tab_query
+from ..database.base import AsyncSessionLocal, run_sync
+from ..database.models import Tab as DBTab, TabStatus, User as DBUser
+from .base import Record, TabRepository, WaiterRepository
+
+WAITER_ROLE = "waiter"
+
+# Opens are serialized per restaurant within a process; across processes
+# two opens can still pick the same number, the unique index on
+# (restaurant_id, business_date, number) rejects one, and it retries
+MAX_NUMBER_ATTEMPTS = 5
+TAB_NUMBER_INDEX = "uq_tabs_restaurant_date_number"
+# SQLite names the columns rather than the index in its error
+SQLITE_TAB_NUMBER_COLUMNS = "tabs.restaurant_id, tabs.business_date, tabs.number"
+
+
+def is_tab_number_conflict(error: IntegrityError) -> bool:
+    """True if an insert lost the race for a daily tab number"""
+    message = str(error.orig)
+    return TAB_NUMBER_INDEX in message or SQLITE_TAB_NUMBER_COLUMNS in message
+
+
+def waiter_record(user: DBUser) -> Record:
+    """Waiter dict for the templates, from a users row"""
+    return {
+        "id": user.id,
+        "restaurant_id": user.restaurant_id,
+        "name": user.full_name or user.email,
+        "email": user.email,
+        "phone": user.phone_number,
+        "role": user.role,
+        "is_active": bool(user.is_active),
+        "status": "available" if user.is_active else "off_duty",
+        "image": "",
+        "tables": [],
+        "last_active": "",
+    }
+
+
+def tab_record(tab: DBTab) -> Record:
+    """Tab dict for the templates, from a tabs row"""
+    return {
+        "id": tab.id,
+        "restaurant_id": tab.restaurant_id,
+        "business_date": tab.business_date,
+        "number": tab.number,
+        "tab_number": parse_tab_number(tab.number),
+        "status": tab.status.value,
+        "customer": tab.customer_name or "Walk-in",
+        "total": tab.total_amount,
+        "waiter": None,
+        "created_at": tab.created_at.strftime("%I:%M %p") if tab.created_at else "",
+    }
+
+
+def parse_tab_number(number: Optional[str]) -> int:
+    """Sequence part of a tab number such as "T-007" (0 for None)"""
+    if not number:
+        return 0
+    return int(number.rsplit("-", 1)[-1])
+
+
+class DatabaseWaiterRepository(WaiterRepository):
+    """Waiters stored as users with the waiter role"""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal):
+        self._session_factory = session_factory
+
+    async def _run(self, work, *args):
+        async with self._session_factory() as db:
+            return await run_sync(db, work, *args)
+
+    @staticmethod
+    def _waiters(db: Session):
+        return db.query(DBUser).filter(DBUser.role == WAITER_ROLE)
+
+    async def get(self, waiter_id) -> Optional[Record]:
+        def load(db: Session):
+            user = self._waiters(db).filter(DBUser.id == str(waiter_id)).first()
+            return waiter_record(user) if user else None
+        return await self._run(load)
+
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        is_active: Optional[bool] = None
+    ) -> List[Record]:
+        def load(db: Session):
+            query = self._waiters(db)
+            if restaurant_id is not None:
+                query = query.filter(DBUser.restaurant_id == restaurant_id)
+            if is_active is not None:
+                query = query.filter(DBUser.is_active == is_active)
+            return [waiter_record(user) for user in query.order_by(DBUser.full_name)]
+        return await self._run(load)
+
+    async def add(self, restaurant_id: str, **fields) -> Record:
+        def insert(db: Session):
+            user = DBUser(
+                id=fields.get("id") or str(uuid.uuid4()),
+                restaurant_id=restaurant_id,
+                email=fields["email"],
+                full_name=fields.get("name"),
+                phone_number=fields.get("phone"),
+                role=WAITER_ROLE,
+                is_active=fields.get("is_active", True)
+            )
+            db.add(user)
+            db.commit()
+            return waiter_record(user)
+        return await self._run(insert)
+
+    async def set_active(self, waiter_id, is_active: bool) -> Optional[Record]:
+        def change(db: Session):
+            user = self._waiters(db).filter(DBUser.id == str(waiter_id)).first()
+            if user is None:
+                return None
+            user.is_active = is_active
+            db.commit()
+            return waiter_record(user)
+        return await self._run(change)
+
+
+class DatabaseTabRepository(TabRepository):
+    """Tabs stored in the tabs table, read with the "list" loading profile"""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._open_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _run(self, work, *args):
+        async with self._session_factory() as db:
+            return await run_sync(db, work, *args)
+
+    async def get(self, tab_id) -> Optional[Record]:
+        def load(db: Session):
+            tab = tab_query(db, "list").filter(DBTab.id == str(tab_id)).first()
+            return tab_record(tab) if tab else None
+        return await self._run(load)
+
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Record]:
+        tab_status = TabStatus(status) if status is not None else None
+        def load(db: Session):
+            tabs = get_tabs(db, limit=None, status=tab_status, restaurant_id=restaurant_id)
+            return [tab_record(tab) for tab in tabs]
+        return await self._run(load)
+
+    async def list_open(self, restaurant_id: str) -> List[Record]:
+        def load(db: Session):
+            return [tab_record(tab) for tab in get_open_tabs(db, restaurant_id)]
+        return await self._run(load)
+
+    async def open(self, restaurant_id: str, **fields) -> Record:
+        tab_status = TabStatus(fields.get("status", TabStatus.INACTIVE.value))
+        def insert(db: Session):
+            business_date = date.today()
+            for _ in range(MAX_NUMBER_ATTEMPTS):
+                # Numbers are zero padded but may outgrow the padding, so
+                # order by length first to find the highest one
+                last = db.query(DBTab.number).filter(
+                    DBTab.restaurant_id == restaurant_id,
+                    DBTab.business_date == business_date
+                ).order_by(func.length(DBTab.number).desc(), DBTab.number.desc()).limit(1).scalar()
+                tab = DBTab(
+                    id=str(uuid.uuid4()),
+                    restaurant_id=restaurant_id,
+                    business_date=business_date,
+                    number=f"{settings.TAB_NUMBER_PREFIX}-{parse_tab_number(last) + 1:03d}",
+                    status=tab_status,
+                    customer_name=fields.get("customer")
+                )
+                db.add(tab)
+                try:
+                    db.commit()
+                except IntegrityError as e:
+                    db.rollback()
+                    if is_tab_number_conflict(e):
+                        continue
+                    raise
+                dashboard_stats.tab_status_changed(restaurant_id, None, tab_status)
+                return tab_record(tab)
+            raise RuntimeError(f"Could not allocate a tab number for restaurant {restaurant_id}")
+        async with self._open_locks[restaurant_id]:
+            return await self._run(insert)
+
+    async def set_status(self, tab_id, status: str) -> Optional[Record]:
+        tab_status = TabStatus(status)
+        def change(db: Session):
+            tab = tab_query(db, "list").filter(DBTab.id == str(tab_id)).first()
+            if tab is None:
+                return None
+            previous_status = tab.status
+            tab.status = tab_status
+            db.commit()
+            dashboard_stats.tab_status_changed(tab.restaurant_id, previous_status, tab_status)
+            return tab_record(tab)
+        return await self._run(change)
@@ -0,0 +1,191 @@
+import itertools
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config.settings import settings
+from .base import CLOSED_TAB_STATUSES, Record, TabRepository, WaiterRepository
+
+
+class IndexedStore:
+    """
+    Records keyed by ID with secondary indexes on a fixed set of fields.
+
+    Each index maps a field value to the IDs that have it (kept in insertion
+    order), so lookups by ID or by any indexed field are O(1) and filtering
+    on several fields only walks the smallest matching bucket. A lock guards
+    every read and write, and nothing inside it awaits, so the store is safe
+    to share between threads and between coroutines on the event loop.
+    Records are copied in and out; callers change them through `update`.
+    """
+
+    def __init__(self, indexed_fields: Iterable[str]):
+        self._records: Dict[str, Record] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {field: {} for field in indexed_fields}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(record_id) -> str:
+        # Route parameters arrive as strings; sample data uses ints
+        return str(record_id)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, record_id) -> Optional[Record]:
+        with self._lock:
+            record = self._records.get(self.key(record_id))
+            return dict(record) if record is not None else None
+
+    def put(self, record: Record) -> Record:
+        with self._lock:
+            key = self.key(record["id"])
+            if key in self._records:
+                self._unindex(key, self._records[key])
+            self._records[key] = dict(record)
+            self._index(key, record)
+            return dict(record)
+
+    def update(self, record_id, **changes) -> Optional[Record]:
+        with self._lock:
+            key = self.key(record_id)
+            current = self._records.get(key)
+            if current is None:
+                return None
+            return self.put({**current, **changes})
+
+    def find(self, **criteria) -> List[Record]:
+        """Records whose indexed fields equal all the given values (None matches anything)"""
+        criteria = {field: value for field, value in criteria.items() if value is not None}
+        with self._lock:
+            if not criteria:
+                return [dict(record) for record in self._records.values()]
+            buckets = [self._indexes[field].get(value, {}) for field, value in criteria.items()]
+            smallest = min(buckets, key=len)
+            return [
+                dict(self._records[key]) for key in smallest
+                if all(key in bucket for bucket in buckets)
+            ]
+
+    def _index(self, key: str, record: Record):
+        for field, index in self._indexes.items():
+            index.setdefault(record.get(field), {})[key] = None
+
+    def _unindex(self, key: str, record: Record):
+        for field, index in self._indexes.items():
+            bucket = index.get(record.get(field))
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[record.get(field)]
+
+
+class IdAllocator:
+    """Thread-safe integer ID sequence that never reuses an ID"""
+
+    def __init__(self, start: int = 1):
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        with self._lock:
+            return next(self._counter)
+
+    def skip_past(self, used: int):
+        """Make sure IDs up to `used` (e.g. from seeded records) are never allocated"""
+        with self._lock:
+            upcoming = next(self._counter)
+            self._counter = itertools.count(max(upcoming, used + 1))
+
+
+class InMemoryWaiterRepository(WaiterRepository):
+    """Waiters held in process memory; lost on restart"""
+
+    def __init__(self, waiters: Iterable[Record] = ()):
+        self._store = IndexedStore(("restaurant_id", "is_active", "status"))
+        self._ids = IdAllocator()
+        for waiter in waiters:
+            self._store.put(waiter)
+            self._ids.skip_past(int(waiter["id"]))
+
+    async def get(self, waiter_id) -> Optional[Record]:
+        return self._store.get(waiter_id)
+
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        is_active: Optional[bool] = None
+    ) -> List[Record]:
+        return self._store.find(restaurant_id=restaurant_id, is_active=is_active)
+
+    async def add(self, restaurant_id: str, **fields) -> Record:
+        waiter = {"is_active": True, "status": "available", "tables": [], **fields}
+        return self._store.put({**waiter, "id": self._ids.next(), "restaurant_id": restaurant_id})
+
+    async def set_active(self, waiter_id, is_active: bool) -> Optional[Record]:
+        return self._store.update(waiter_id, is_active=is_active)
+
+
+class InMemoryTabRepository(TabRepository):
+    """Tabs held in process memory; lost on restart"""
+
+    def __init__(self, tabs: Iterable[Record] = ()):
+        self._store = IndexedStore(("restaurant_id", "status"))
+        self._ids = IdAllocator()
+        self._numbers: Dict[Tuple[str, date], int] = {}
+        self._numbers_lock = threading.Lock()
+        for tab in tabs:
+            self._store.put(tab)
+            self._ids.skip_past(int(tab["id"]))
+            self._skip_number(tab["restaurant_id"], tab["business_date"], tab["tab_number"])
+
+    def _next_number(self, restaurant_id: str, business_date: date) -> int:
+        with self._numbers_lock:
+            number = self._numbers.get((restaurant_id, business_date), 0) + 1
+            self._numbers[(restaurant_id, business_date)] = number
+            return number
+
+    def _skip_number(self, restaurant_id: str, business_date: date, used: int):
+        with self._numbers_lock:
+            current = self._numbers.get((restaurant_id, business_date), 0)
+            self._numbers[(restaurant_id, business_date)] = max(current, used)
+
+    async def get(self, tab_id) -> Optional[Record]:
+        return self._store.get(tab_id)
+
+    async def list(
+        self,
+        restaurant_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Record]:
+        return self._store.find(restaurant_id=restaurant_id, status=status)
+
+    async def list_open(self, restaurant_id: str) -> List[Record]:
+        return [
+            tab for tab in self._store.find(restaurant_id=restaurant_id)
+            if tab["status"] not in CLOSED_TAB_STATUSES
+        ]
+
+    async def open(self, restaurant_id: str, **fields) -> Record:
+        business_date = date.today()
+        tab_number = self._next_number(restaurant_id, business_date)
+        tab = {
+            "status": "inactive",
+            "customer": "Walk-in",
+            "total": 0.00,
+            "waiter": None,
+            "items": [],
+            "created_at": datetime.now().strftime("%I:%M %p"),
+            **fields,
+        }
+        return self._store.put({
+            **tab,
+            "id": self._ids.next(),
+            "restaurant_id": restaurant_id,
+            "business_date": business_date,
+            "tab_number": tab_number,
+            "number": f"{settings.TAB_NUMBER_PREFIX}-{tab_number:03d}",
+        })
+
+    async def set_status(self, tab_id, status: str) -> Optional[Record]:
+        return self._store.update(tab_id, status=status)
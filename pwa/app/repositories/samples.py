@@ -0,0 +1,87 @@
+"""Sample waiters and tabs the in-memory repositories start with"""
+from datetime import date
+from typing import List
+
+from ..config.settings import settings
+from .base import Record
+
+SAMPLE_TABS: List[Record] = [
+    {"id": 1, "restaurant_id": settings.DEFAULT_RESTAURANT_ID, "business_date": date.today(), "tab_number": 1, "number": "T-001", "status": "ordering", "customer": "Walk-in", "total": 45.50, "waiter": "John", "created_at": "10:30 AM"},
+    {"id": 2, "restaurant_id": settings.DEFAULT_RESTAURANT_ID, "business_date": date.today(), "tab_number": 2, "number": "T-002", "status": "dining", "customer": "Reservation #1234", "total": 78.25, "waiter": "Jane", "created_at": "12:15 PM"},
+    {"id": 3, "restaurant_id": settings.DEFAULT_RESTAURANT_ID, "business_date": date.today(), "tab_number": 3, "number": "T-003", "status": "payment_pending", "customer": "Walk-in", "total": 32.00, "waiter": "John", "created_at": "1:45 PM"}
+]
+
+SAMPLE_WAITERS: List[Record] = [
+    {
+        "id": 1,
+        "restaurant_id": settings.DEFAULT_RESTAURANT_ID,
+        "name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1234567890",
+        "role": "Head Waiter",
+        "pin": "1234",
+        "image": "https://randomuser.me/api/portraits/men/32.jpg",
+        "status": "available",
+        "is_active": True,
+        "tables": ["T1", "T2", "T3"],
+        "current_orders": 3,
+        "total_served": 45,
+        "rating": 4.7,
+        "last_active": "5 min ago",
+        "lastLogin": "2 hours ago"
+    },
+    {
+        "id": 2,
+        "restaurant_id": settings.DEFAULT_RESTAURANT_ID,
+        "name": "Jane Smith",
+        "email": "jane@example.com",
+        "phone": "+1987654321",
+        "role": "Senior Waiter",
+        "pin": "2345",
+        "image": "https://randomuser.me/api/portraits/women/44.jpg",
+        "status": "busy",
+        "is_active": True,
+        "tables": ["T4", "T5"],
+        "current_orders": 2,
+        "total_served": 32,
+        "rating": 4.9,
+        "last_active": "2 min ago",
+        "lastLogin": "30 min ago"
+    },
+    {
+        "id": 3,
+        "restaurant_id": settings.DEFAULT_RESTAURANT_ID,
+        "name": "Mike Johnson",
+        "email": "mike@example.com",
+        "phone": "+1122334455",
+        "role": "Waiter",
+        "pin": "3456",
+        "image": "https://randomuser.me/api/portraits/men/67.jpg",
+        "status": "on_break",
+        "is_active": False,
+        "tables": ["T6"],
+        "current_orders": 0,
+        "total_served": 12,
+        "rating": 4.5,
+        "last_active": "2 hours ago",
+        "lastLogin": "1 hour ago"
+    },
+    {
+        "id": 4,
+        "restaurant_id": settings.DEFAULT_RESTAURANT_ID,
+        "name": "Sarah Williams",
+        "email": "sarah@example.com",
+        "phone": "+1555666777",
+        "role": "Trainee",
+        "pin": "4567",
+        "image": "https://randomuser.me/api/portraits/women/22.jpg",
+        "status": "available",
+        "is_active": True,
+        "tables": ["T7", "T8"],
+        "current_orders": 1,
+        "total_served": 28,
+        "rating": 4.8,
+        "last_active": "15 min ago",
+        "lastLogin": "15 min ago"
+    }
+]
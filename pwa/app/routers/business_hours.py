@@ -4,9 +4,11 @@ from datetime import time
 from typing import Dict, List, Optional
 import json
 import os
+import re
 from pathlib import Path
 
 from ..auth import get_current_user
+from ..config.business_hours import BusinessHours
 
 router = APIRouter()
 
@@ -27,12 +29,40 @@ DEFAULT_BUSINESS_HOURS = {
     "sunday": ["10:00", "21:00"]
 }
 
+VALID_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# 24-hour "HH:MM", the only time format the schedule compiler accepts
+TIME_FORMAT = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
+def validate_business_hours(hours: Dict[str, Optional[List[Optional[str]]]]) -> Dict[str, Optional[List[str]]]:
+    """
+    Check business hours before they are saved, raising ValueError with a message for the first problem.
+    
+    Each day is None (closed) or [open, close] as "HH:MM". A close time before
+    the open time runs past midnight; equal times are ambiguous and rejected.
+    """
+    if not isinstance(hours, dict):
+        raise ValueError("Business hours must be an object keyed by day")
+    for day, day_hours in hours.items():
+        if day not in VALID_DAYS:
+            raise ValueError(f"Invalid day: {day}. Must be one of {VALID_DAYS}")
+        if day_hours is None:
+            continue
+        if not isinstance(day_hours, list) or len(day_hours) != 2:
+            raise ValueError(f"Invalid hours format for {day}. Expected [open_time, close_time]")
+        for value in day_hours:
+            if not isinstance(value, str) or not TIME_FORMAT.match(value):
+                raise ValueError(f"Invalid time for {day}: {value!r}. Expected HH:MM (24-hour)")
+        if day_hours[0] == day_hours[1]:
+            raise ValueError(f"Open and close times for {day} must differ")
+    return hours
+
 def load_business_hours() -> Dict[str, List[Optional[str]]]:
-    """Load business hours from file or return default if file doesn't exist."""
+    """Load business hours from file or return default if file doesn't exist or is invalid."""
     try:
         if BUSINESS_HOURS_FILE.exists():
             with open(BUSINESS_HOURS_FILE, 'r') as f:
-                return json.load(f)
+                return validate_business_hours(json.load(f))
     except Exception as e:
         print(f"Error loading business hours: {e}")
     
@@ -51,32 +81,24 @@ def save_business_hours(hours: Dict[str, List[Optional[str]]]) -> None:
             detail="Failed to save business hours"
         )
 
+# Open/closed checks compile the saved hours once and reuse them until the next save
+BusinessHours.set_loader(load_business_hours)
+
 @router.get("/api/business-hours", response_model=Dict[str, List[Optional[str]]])
 async def get_business_hours():
     """Get current business hours."""
     return load_business_hours()
 
 @router.post("/api/business-hours")
-async def update_business_hours(hours: Dict[str, List[Optional[str]]], current_user = Depends(get_current_user)):
+async def update_business_hours(hours: Dict[str, Optional[List[Optional[str]]]], current_user = Depends(get_current_user)):
     """Update business hours."""
-    # Validate the input
-    valid_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    
-    for day in hours:
-        if day not in valid_days:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid day: {day}. Must be one of {valid_days}"
-            )
-            
-        day_hours = hours[day]
-        if day_hours is not None:
-            if not isinstance(day_hours, list) or len(day_hours) != 2:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid hours format for {day}. Expected [open_time, close_time]"
-                )
+    # Validate the input, so a bad value can never reach the schedule compiler
+    try:
+        validate_business_hours(hours)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     
     # Save the updated hours
     save_business_hours(hours)
+    BusinessHours.invalidate()
     return {"status": "success", "message": "Business hours updated successfully"}
@@ -10,91 +10,12 @@ from pydantic import BaseModel
 
 from ..auth import get_current_active_user, User, oauth2_scheme
 from ..config.business_hours import BusinessHours
+from ..crud.dashboard_stats import dashboard_stats
+from ..repositories import get_tab_repository, get_waiter_repository
 
 router = APIRouter()
 templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "../../templates"))
 
-# In-memory storage for active tabs (replace with database in production)
-active_tabs: List[Dict[str, Any]] = [
-    {"tab_number": 1, "status": "ordering", "customer": "Walk-in", "total": 45.50, "waiter": "John", "created_at": "10:30 AM"},
-    {"tab_number": 2, "status": "dining", "customer": "Reservation #1234", "total": 78.25, "waiter": "Jane", "created_at": "12:15 PM"},
-    {"tab_number": 3, "status": "payment_pending", "customer": "Walk-in", "total": 32.00, "waiter": "John", "created_at": "1:45 PM"}
-]
-
-# In-memory storage for waiters (replace with database in production)
-WAITERS = [
-    {
-        "id": 1,
-        "name": "John Doe",
-        "email": "john@example.com",
-        "phone": "+1234567890",
-        "role": "Head Waiter",
-        "pin": "1234",
-        "image": "https://randomuser.me/api/portraits/men/32.jpg",
-        "status": "available",
-        "is_active": True,
-        "tables": ["T1", "T2", "T3"],
-        "current_orders": 3,
-        "total_served": 45,
-        "rating": 4.7,
-        "last_active": "5 min ago",
-        "lastLogin": "2 hours ago"
-    },
-    {
-        "id": 2,
-        "name": "Jane Smith",
-        "email": "jane@example.com",
-        "phone": "+1987654321",
-        "role": "Senior Waiter",
-        "pin": "2345",
-        "image": "https://randomuser.me/api/portraits/women/44.jpg",
-        "status": "busy",
-        "is_active": True,
-        "tables": ["T4", "T5"],
-        "current_orders": 2,
-        "total_served": 32,
-        "rating": 4.9,
-        "last_active": "2 min ago",
-        "lastLogin": "30 min ago"
-    },
-    {
-        "id": 3,
-        "name": "Mike Johnson",
-        "email": "mike@example.com",
-        "phone": "+1122334455",
-        "role": "Waiter",
-        "pin": "3456",
-        "image": "https://randomuser.me/api/portraits/men/67.jpg",
-        "status": "on_break",
-        "is_active": False,
-        "tables": ["T6"],
-        "current_orders": 0,
-        "total_served": 12,
-        "rating": 4.5,
-        "last_active": "2 hours ago",
-        "lastLogin": "1 hour ago"
-    },
-    {
-        "id": 4,
-        "name": "Sarah Williams",
-        "email": "sarah@example.com",
-        "phone": "+1555666777",
-        "role": "Trainee",
-        "pin": "4567",
-        "image": "https://randomuser.me/api/portraits/women/22.jpg",
-        "status": "available",
-        "is_active": True,
-        "tables": ["T7", "T8"],
-        "current_orders": 1,
-        "total_served": 28,
-        "rating": 4.8,
-        "last_active": "15 min ago",
-        "lastLogin": "15 min ago"
-    }
-]
-
-next_tab_number: int = 4
-
 # Sample menu items
 MENU_ITEMS = [
     {"name": "Margherita Pizza", "category": "Mains", "price": 12.99, "status": "available"},
@@ -102,7 +23,20 @@ MENU_ITEMS = [
     {"name": "Chocolate Brownie", "category": "Desserts", "price": 6.50, "status": "available"}
 ]
 
-def get_dashboard_data(request, current_user, is_open, next_open):
+def user_restaurant_id(current_user: User) -> str:
+    """The restaurant a signed-in staff member may see"""
+    restaurant_id = getattr(current_user, "restaurant_id", None)
+    if not restaurant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not assigned to a restaurant"
+        )
+    return restaurant_id
+
+async def get_dashboard_data(request, current_user, is_open, next_open):
+    restaurant_id = user_restaurant_id(current_user)
+    all_waiters = await get_waiter_repository().list(restaurant_id=restaurant_id)
+    active_tabs = await get_tab_repository().list_open(restaurant_id)
     next_open_str = next_open.strftime("%I:%M %p") if next_open else "TBD"
     return {
         "request": request,
@@ -110,16 +44,14 @@ def get_dashboard_data(request, current_user, is_open, next_open):
             "email": current_user.email,
             "username": getattr(current_user, 'username', current_user.email.split("@")[0])
         },
-        "all_waiters": WAITERS,
+        "all_waiters": all_waiters,
         "active_tabs": active_tabs,
         "menu_items": MENU_ITEMS,
         "is_open": is_open,
         "next_open": next_open_str,
         "stats": {
             "active_tabs": len(active_tabs),
-            "orders_today": 12,
-            "revenue_today": 245.00,
-            "pending_orders": 4
+            **dashboard_stats.snapshot(restaurant_id)
         },
         "business_hours": {
             "is_open": is_open,
@@ -127,6 +59,26 @@ def get_dashboard_data(request, current_user, is_open, next_open):
         }
     }
 
+@router.get("/api/dashboard/stats")
+async def get_dashboard_stats(
+    restaurant_id: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Live dashboard numbers for the user's restaurant.
+    
+    Served from in-memory counters that are updated as orders and payments
+    are written and reconciled against the database in the background, so
+    the dashboard can poll this every few seconds. `restaurant_id` is
+    optional and must be the user's own restaurant if given.
+    """
+    own_restaurant_id = user_restaurant_id(current_user)
+    if restaurant_id is not None and restaurant_id != own_restaurant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to view this restaurant"
+        )
+    return dashboard_stats.snapshot(own_restaurant_id)
+
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(
     request: Request,
@@ -147,7 +99,7 @@ async def dashboard(
         next_open = BusinessHours.get_next_opening_time()
         
         # Prepare dashboard data
-        dashboard_data = get_dashboard_data(request, current_user, is_open, next_open)
+        dashboard_data = await get_dashboard_data(request, current_user, is_open, next_open)
         
         # Add flash messages if any
         if request.session.get("flash_message"):
@@ -202,7 +154,7 @@ async def new_dashboard(
         next_open = BusinessHours.get_next_opening_time()
         
         # Prepare dashboard data
-        dashboard_data = get_dashboard_data(request, current_user, is_open, next_open)
+        dashboard_data = await get_dashboard_data(request, current_user, is_open, next_open)
         
         # Add flash messages if any
         if request.session.get("flash_message"):
@@ -235,8 +187,6 @@ async def new_dashboard(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-# Use WAITERS list instead of MOCK_WAITERS
-
 @router.get("/waiters", response_class=HTMLResponse)
 async def waiters_home(
     request: Request,
@@ -255,7 +205,9 @@ async def waiters_home(
     """
     try:
         # Get active waiters
-        active_waiters = [waiter for waiter in WAITERS if waiter.get('is_active', False)]
+        waiters = get_waiter_repository()
+        restaurant_id = user_restaurant_id(current_user)
+        active_waiters = await waiters.list(restaurant_id=restaurant_id, is_active=True)
         
         # Prepare template context
         context = {
@@ -266,7 +218,7 @@ async def waiters_home(
                 "is_admin": getattr(current_user, 'is_admin', False)
             },
             "waiters": active_waiters,
-            "all_waiters": WAITERS
+            "all_waiters": await waiters.list(restaurant_id=restaurant_id)
         }
         
         # Add flash messages if any
@@ -308,7 +260,7 @@ class WaiterStatusUpdate(BaseModel):
 @router.patch("/api/waiters/{waiter_id}/status")
 async def update_waiter_status(
     request: Request,
-    waiter_id: int,
+    waiter_id: str,
     status_update: WaiterStatusUpdate,
     current_user: User = Depends(get_current_active_user)
 ):
@@ -335,7 +287,8 @@ async def update_waiter_status(
             )
         
         # Find the waiter by ID
-        waiter = next((w for w in WAITERS if w["id"] == waiter_id), None)
+        waiters = get_waiter_repository()
+        waiter = await waiters.get(waiter_id)
         if not waiter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -344,10 +297,7 @@ async def update_waiter_status(
         
         # Update the status
         previous_status = waiter.get("is_active", False)
-        waiter["is_active"] = status_update.is_active
-        
-        # In a real app, you would update this in the database here
-        # db.update_waiter_status(waiter_id, status_update.is_active)
+        await waiters.set_active(waiter_id, status_update.is_active)
         
         # Log the status change
         print(f"Waiter {waiter_id} status changed from {previous_status} to {status_update.is_active} by {current_user.email}")
@@ -383,7 +333,7 @@ async def update_waiter_status(
 @router.get("/waiter-dashboard/{waiter_id}", response_class=HTMLResponse)
 async def waiter_dashboard(
     request: Request, 
-    waiter_id: int, 
+    waiter_id: str, 
     current_user: User = Depends(get_current_active_user)
 ):
     """Render the waiter's personal dashboard.
@@ -391,8 +341,8 @@ async def waiter_dashboard(
     This page shows the waiter's active orders, status, and other relevant information.
     """
     try:
-        # Find the requested waiter from the WAITERS list
-        waiter = next((w for w in WAITERS if w["id"] == waiter_id), None)
+        # Find the requested waiter
+        waiter = await get_waiter_repository().get(waiter_id)
         if not waiter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -5,42 +5,20 @@ from typing import Optional, Dict, Any
 
 from ..auth import get_current_user, User
 from ..config.business_hours import BusinessHours
+from ..config.settings import settings
+from ..repositories import get_tab_repository
 
 router = APIRouter()
 
-# In-memory storage (replace with database in production)
-active_tabs: Dict[int, Dict[str, Any]] = {}
-next_tab_number: int = 1
-
 @router.get("/tab/new")
-async def create_new_tab():
-    """Create a new tab with the next available number."""
-    global next_tab_number
-    
-    tab_id = next_tab_number
-    tab = {
-        "id": tab_id,
-        "tab_number": tab_id,
-        "status": "new",
-        "created_at": datetime.now().strftime("%I:%M %p"),
-        "items": [],
-        "total": 0.00
-    }
-    
-    active_tabs[tab_id] = tab
-    next_tab_number += 1
-    
-    return {"tab_id": tab_id, "tab_number": tab_id}
-
-@router.get("/tab/{tab_id}")
-async def get_tab(tab_id: int):
-    """Get tab details by ID."""
-    if tab_id not in active_tabs:
-        raise HTTPException(status_code=404, detail="Tab not found")
-    return active_tabs[tab_id]
+async def create_new_tab(restaurant_id: str = settings.DEFAULT_RESTAURANT_ID):
+    """Create a new tab with the restaurant's next tab number for today."""
+    tab = await get_tab_repository().open(restaurant_id)
+    return {"tab_id": tab["id"], "tab_number": tab["tab_number"]}
 
+# Registered before /tab/{tab_id} so "scan" is not taken for a tab ID
 @router.get("/tab/scan")
-async def scan_qr_code():
+async def scan_qr_code(restaurant_id: str = settings.DEFAULT_RESTAURANT_ID):
     """Endpoint for QR code scanning."""
     if not BusinessHours.is_open_now():
         next_open = BusinessHours.get_next_opening_time()
@@ -54,10 +32,18 @@ async def scan_qr_code():
         )
     
     # Create new tab since we're open
-    tab = await create_new_tab()
+    tab = await create_new_tab(restaurant_id)
     return {
         "status": "success",
         "tab_id": tab["tab_id"],
         "tab_number": tab["tab_number"],
         "redirect_url": f"/tab/{tab['tab_id']}"
     }
+
+@router.get("/tab/{tab_id}")
+async def get_tab(tab_id: str):
+    """Get tab details by ID."""
+    tab = await get_tab_repository().get(tab_id)
+    if tab is None:
+        raise HTTPException(status_code=404, detail="Tab not found")
+    return tab
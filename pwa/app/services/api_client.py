@@ -24,8 +24,8 @@ class PWAApiClient(BaseAPIClient):
             return
         try:
             self._token = self._local_storage.get(settings.TOKEN_KEY)
-            if self._token:
-                self.client.headers.update({"Authorization": f"Bearer {self._token}"})
+            # Sent per request; the pooled client is shared with other callers
+            self.token = self._token
         except Exception as e:
             logger.error(f"Error loading token: {e}")
     
@@ -37,13 +37,11 @@ class PWAApiClient(BaseAPIClient):
     def set_token(self, token: Optional[str]):
         """Set the authentication token"""
         self._token = token
-        if token:
-            self.client.headers.update({"Authorization": f"Bearer {token}"})
-            if hasattr(self, '_local_storage'):
+        self.token = token
+        if hasattr(self, '_local_storage'):
+            if token:
                 self._local_storage.set(settings.TOKEN_KEY, token)
-        else:
-            self.client.headers.pop("Authorization", None)
-            if hasattr(self, '_local_storage'):
+            else:
                 self._local_storage.remove(settings.TOKEN_KEY)
     
     async def request(self, method: str, endpoint: str, **kwargs) -> ResponseModel:
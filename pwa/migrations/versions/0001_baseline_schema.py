@@ -0,0 +1,156 @@
+"""Baseline schema
+
+Creates the tables as they were defined before migrations were introduced.
+Databases that were already created with Base.metadata.create_all() from
+those models should be stamped instead of upgraded:
+
+    alembic stamp 0001
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+tab_status = sa.Enum('INACTIVE', 'ACTIVE', 'PAYMENT_PENDING', 'PAID', 'CANCELLED', name='tabstatus')
+order_status = sa.Enum('PLACED', 'PREPARING', 'READY', 'DELIVERED', 'COMPLETED', 'CANCELLED', name='orderstatus')
+payment_status = sa.Enum('PENDING', 'PROCESSING', 'CONFIRMED', 'FAILED', name='paymentstatus')
+payment_method = sa.Enum('CASH', 'MOBILE_MONEY', 'CARD', 'OTHER', name='paymentmethod')
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('full_name', sa.String()),
+        sa.Column('phone_number', sa.String()),
+        sa.Column('role', sa.String()),
+        sa.Column('pin_hash', sa.String()),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    
+    op.create_table(
+        'restaurants',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('address', sa.Text()),
+        sa.Column('phone_number', sa.String()),
+        sa.Column('logo_url', sa.String()),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+    )
+    
+    op.create_table(
+        'tabs',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('restaurant_id', sa.String(), sa.ForeignKey('restaurants.id'), nullable=False),
+        sa.Column('number', sa.String(10), nullable=False),
+        sa.Column('status', tab_status, nullable=False),
+        sa.Column('customer_name', sa.String(100)),
+        sa.Column('customer_phone', sa.String(20)),
+        sa.Column('customer_email', sa.String(100)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_tabs_number', 'tabs', ['number'])
+    
+    op.create_table(
+        'orders',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('tab_id', sa.String(), sa.ForeignKey('tabs.id'), nullable=False),
+        sa.Column('status', order_status, nullable=False),
+        sa.Column('special_instructions', sa.Text()),
+        sa.Column('placed_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('prepared_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('ready_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('cancelled_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_orders_tab_id', 'orders', ['tab_id'])
+    
+    op.create_table(
+        'order_waiter',
+        sa.Column('order_id', sa.String(), sa.ForeignKey('orders.id'), primary_key=True),
+        sa.Column('waiter_id', sa.String(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('assigned_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    
+    op.create_table(
+        'order_items',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('order_id', sa.String(), sa.ForeignKey('orders.id'), nullable=False),
+        sa.Column('menu_item_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('description', sa.Text()),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('notes', sa.Text()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_order_items_order_id', 'order_items', ['order_id'])
+    op.create_index('ix_order_items_menu_item_id', 'order_items', ['menu_item_id'])
+    
+    op.create_table(
+        'payments',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('tab_id', sa.String(), sa.ForeignKey('tabs.id'), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('currency', sa.String(3), nullable=False),
+        sa.Column('payment_method', payment_method, nullable=False),
+        sa.Column('status', payment_status, nullable=False),
+        sa.Column('reference', sa.String()),
+        sa.Column('processed_by', sa.String(), sa.ForeignKey('users.id')),
+        sa.Column('processed_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('failure_reason', sa.Text()),
+    )
+    op.create_index('ix_payments_tab_id', 'payments', ['tab_id'])
+    
+    op.create_table(
+        'messages',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('tab_id', sa.String(), sa.ForeignKey('tabs.id'), nullable=False),
+        sa.Column('sender_id', sa.String(), sa.ForeignKey('users.id')),
+        sa.Column('sender_type', sa.String()),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('is_read', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_messages_tab_id', 'messages', ['tab_id'])
+    
+    op.create_table(
+        'menu_items',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('restaurant_id', sa.String(), sa.ForeignKey('restaurants.id'), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('description', sa.Text()),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('category', sa.String(50), nullable=False),
+        sa.Column('is_available', sa.Boolean()),
+        sa.Column('image_url', sa.String()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+    )
+    op.create_index('ix_menu_items_restaurant_id', 'menu_items', ['restaurant_id'])
+
+def downgrade():
+    for table in (
+        'menu_items', 'messages', 'payments', 'order_items', 'order_waiter',
+        'orders', 'tabs', 'restaurants', 'users'
+    ):
+        op.drop_table(table)
+    bind = op.get_bind()
+    for enum in (payment_method, payment_status, order_status, tab_status):
+        enum.drop(bind, checkfirst=True)
@@ -0,0 +1,55 @@
+"""Order totals, tab running totals and menu indexes
+
+Adds orders.total_cents and the tabs running totals maintained by
+app.crud, backfills them from existing orders and payments, and adds the
+menu_items category/availability indexes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table('orders') as batch:
+        batch.add_column(sa.Column('total_cents', sa.Integer()))
+    
+    with op.batch_alter_table('tabs') as batch:
+        batch.add_column(sa.Column('subtotal_cents', sa.Integer(), nullable=False, server_default='0'))
+        batch.add_column(sa.Column('paid_cents', sa.Integer(), nullable=False, server_default='0'))
+        batch.add_column(sa.Column('balance_cents', sa.Integer(), nullable=False, server_default='0'))
+    
+    op.execute("""
+        UPDATE tabs SET subtotal_cents = COALESCE((
+            SELECT SUM(ROUND(order_items.price * 100) * order_items.quantity)
+            FROM orders JOIN order_items ON order_items.order_id = orders.id
+            WHERE orders.tab_id = tabs.id AND orders.status != 'CANCELLED'
+        ), 0)
+    """)
+    op.execute("""
+        UPDATE tabs SET paid_cents = COALESCE((
+            SELECT SUM(ROUND(payments.amount * 100))
+            FROM payments
+            WHERE payments.tab_id = tabs.id AND payments.status = 'CONFIRMED'
+        ), 0)
+    """)
+    op.execute("UPDATE tabs SET balance_cents = subtotal_cents - paid_cents")
+    
+    op.create_index('ix_menu_items_restaurant_category', 'menu_items', ['restaurant_id', 'category'])
+    op.create_index('ix_menu_items_restaurant_available', 'menu_items', ['restaurant_id', 'is_available'])
+
+def downgrade():
+    op.drop_index('ix_menu_items_restaurant_available', table_name='menu_items')
+    op.drop_index('ix_menu_items_restaurant_category', table_name='menu_items')
+    with op.batch_alter_table('tabs') as batch:
+        batch.drop_column('balance_cents')
+        batch.drop_column('paid_cents')
+        batch.drop_column('subtotal_cents')
+    with op.batch_alter_table('orders') as batch:
+        batch.drop_column('total_cents')
@@ -0,0 +1,75 @@
+"""Composite and partial indexes for dashboard queries
+
+- tabs (restaurant_id, status, created_at) for status listings
+- tabs (restaurant_id, created_at) WHERE open, for the live dashboard
+- tabs (restaurant_id, business_date, number) UNIQUE, since tab numbers
+  restart daily; business_date is added, backfilled from created_at and
+  made NOT NULL so the index also covers old rows. The upgrade stops if
+  existing tabs already repeat a number on the same day.
+- orders (tab_id, status)
+- messages (tab_id, is_read)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# Must match OPEN_TAB_CONDITION in app/database/models.py
+OPEN_TAB_CONDITION = "status IN ('ACTIVE', 'PAYMENT_PENDING')"
+
+def check_duplicate_tab_numbers():
+    """Refuse to build the unique index over tabs that would violate it"""
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT restaurant_id, business_date, number, COUNT(*) FROM tabs "
+        "GROUP BY restaurant_id, business_date, number HAVING COUNT(*) > 1 "
+        "ORDER BY business_date, restaurant_id, number LIMIT 10"
+    )).fetchall()
+    if duplicates:
+        listed = ", ".join(f"{r} {d} {n} (x{count})" for r, d, n, count in duplicates)
+        raise RuntimeError(
+            "Tabs repeat a number on the same day, so uq_tabs_restaurant_date_number "
+            f"cannot be created. Renumber these first: {listed}"
+        )
+
+def upgrade():
+    with op.batch_alter_table('tabs') as batch:
+        batch.add_column(sa.Column('business_date', sa.Date()))
+    op.execute(
+        "UPDATE tabs SET business_date = COALESCE(DATE(created_at), CURRENT_DATE) "
+        "WHERE business_date IS NULL"
+    )
+    with op.batch_alter_table('tabs') as batch:
+        batch.alter_column('business_date', existing_type=sa.Date(), nullable=False)
+    check_duplicate_tab_numbers()
+    
+    op.create_index(
+        'ix_tabs_restaurant_status_created', 'tabs',
+        ['restaurant_id', 'status', 'created_at']
+    )
+    op.create_index(
+        'ix_tabs_restaurant_open_created', 'tabs', ['restaurant_id', 'created_at'],
+        postgresql_where=sa.text(OPEN_TAB_CONDITION),
+        sqlite_where=sa.text(OPEN_TAB_CONDITION)
+    )
+    op.create_index(
+        'uq_tabs_restaurant_date_number', 'tabs',
+        ['restaurant_id', 'business_date', 'number'], unique=True
+    )
+    op.create_index('ix_orders_tab_status', 'orders', ['tab_id', 'status'])
+    op.create_index('ix_messages_tab_is_read', 'messages', ['tab_id', 'is_read'])
+
+def downgrade():
+    op.drop_index('ix_messages_tab_is_read', table_name='messages')
+    op.drop_index('ix_orders_tab_status', table_name='orders')
+    op.drop_index('uq_tabs_restaurant_date_number', table_name='tabs')
+    op.drop_index('ix_tabs_restaurant_open_created', table_name='tabs')
+    op.drop_index('ix_tabs_restaurant_status_created', table_name='tabs')
+    with op.batch_alter_table('tabs') as batch:
+        batch.drop_column('business_date')
@@ -0,0 +1,31 @@
+"""Staff belong to a restaurant
+
+- users.restaurant_id, so waiters can be listed per restaurant
+- users (restaurant_id, role, is_active) for the waiter repository
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table('users') as batch:
+        batch.add_column(sa.Column('restaurant_id', sa.String(), nullable=True))
+        batch.create_foreign_key('fk_users_restaurant_id', 'restaurants', ['restaurant_id'], ['id'])
+    op.create_index(
+        'ix_users_restaurant_role_active', 'users',
+        ['restaurant_id', 'role', 'is_active']
+    )
+
+def downgrade():
+    op.drop_index('ix_users_restaurant_role_active', table_name='users')
+    with op.batch_alter_table('users') as batch:
+        batch.drop_constraint('fk_users_restaurant_id', type_='foreignkey')
+        batch.drop_column('restaurant_id')
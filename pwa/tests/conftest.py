@@ -0,0 +1,71 @@
+import os
+from contextlib import contextmanager
+
+import pytest
+
+# Settings are read at import time; point the app at an in-memory database
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.base import Base
+from app.database import models  # noqa: F401  (registers tables on Base)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def max_queries(engine):
+    """
+    Assert that a block runs at most `limit` SQL statements:
+
+        with max_queries(2):
+            render_tab_list(db)
+    """
+    @contextmanager
+    def check(limit: int):
+        counter = QueryCounter()
+        event.listen(engine, "before_cursor_execute", counter)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", counter)
+        assert counter.count <= limit, (
+            f"Expected at most {limit} queries, got {counter.count}:\n"
+            + "\n".join(counter.statements)
+        )
+
+    return check
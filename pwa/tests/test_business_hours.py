@@ -0,0 +1,60 @@
+"""
+Saved business hours are validated, so a bad value can never break the
+open/closed checks that every dashboard and tab scan runs.
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.config.business_hours import BusinessHours
+from app.routers import business_hours as router_module
+
+
+@pytest.fixture
+def hours_file(tmp_path, monkeypatch):
+    path = tmp_path / "business_hours.json"
+    monkeypatch.setattr(router_module, "BUSINESS_HOURS_FILE", path)
+    BusinessHours.invalidate()
+    yield path
+    BusinessHours.invalidate()
+
+
+def update(hours):
+    return asyncio.run(router_module.update_business_hours(hours, current_user=None))
+
+
+@pytest.mark.parametrize("hours", [
+    {"monday": ["9am", "22:00"]},
+    {"monday": ["09:00", "24:00"]},
+    {"monday": ["9:00", "22:00"]},
+    {"monday": ["09:00", None]},
+    {"monday": ["09:00"]},
+    {"monday": ["09:00", "09:00"]},
+    {"funday": ["09:00", "22:00"]},
+])
+def test_invalid_hours_are_rejected_and_not_saved(hours_file, hours):
+    with pytest.raises(HTTPException) as error:
+        update(hours)
+
+    assert error.value.status_code == 422
+    assert not hours_file.exists()
+
+
+def test_valid_hours_are_saved_and_used(hours_file):
+    update({"monday": ["09:00", "17:00"], "friday": ["18:00", "02:00"], "sunday": None})
+
+    assert json.loads(hours_file.read_text())["friday"] == ["18:00", "02:00"]
+    schedule = BusinessHours.schedule()
+    # Friday 18:00 until Saturday 02:00 crosses midnight
+    assert schedule.is_open_at(4 * 24 * 60 + 23 * 60)
+    assert schedule.is_open_at(5 * 24 * 60 + 60)
+    assert not schedule.is_open_at(6 * 24 * 60 + 12 * 60)
+
+
+def test_a_corrupt_saved_file_falls_back_to_defaults(hours_file):
+    hours_file.write_text(json.dumps({"monday": ["9am", "5pm"]}))
+
+    assert router_module.load_business_hours() == router_module.DEFAULT_BUSINESS_HOURS
+    BusinessHours.schedule()
@@ -0,0 +1,36 @@
+"""
+Dashboard numbers are only served for the signed-in user's own restaurant.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import User
+from app.crud.dashboard_stats import dashboard_stats
+from app.routers.dashboard import get_dashboard_stats
+
+
+def staff(restaurant_id):
+    return User(username="amy", email="amy@example.com", hashed_password="", restaurant_id=restaurant_id)
+
+
+def stats(current_user, restaurant_id=None):
+    return asyncio.run(get_dashboard_stats(restaurant_id=restaurant_id, current_user=current_user))
+
+
+def test_stats_default_to_the_users_restaurant():
+    assert stats(staff("r1")) == dashboard_stats.snapshot("r1")
+    assert stats(staff("r1"), restaurant_id="r1") == dashboard_stats.snapshot("r1")
+
+
+@pytest.mark.parametrize("current_user, restaurant_id", [
+    (staff("r1"), "r2"),
+    (staff(None), None),
+    (staff(None), "r1"),
+])
+def test_other_restaurants_are_forbidden(current_user, restaurant_id):
+    with pytest.raises(HTTPException) as error:
+        stats(current_user, restaurant_id)
+
+    assert error.value.status_code == 403
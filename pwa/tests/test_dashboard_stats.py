@@ -0,0 +1,61 @@
+"""
+The dashboard's rolling counters must agree with a full recomputation from
+the database after any sequence of writes through the crud layer.
+"""
+from app.crud import payments as payment_crud
+from app.crud import tabs as crud
+from app.crud.dashboard_stats import dashboard_stats
+from app.database.models import (
+    OrderStatus, PaymentMethod, PaymentStatus, Restaurant, Tab, TabStatus
+)
+from app.models.tables import OrderCreate, OrderItemCreate
+
+
+def live_numbers(restaurant_id):
+    snapshot = dashboard_stats.snapshot(restaurant_id)
+    snapshot.pop("reconciled_at")
+    return snapshot
+
+
+def test_counters_follow_writes_and_match_reconciliation(db):
+    db.add(Restaurant(id="r1", name="One"))
+    db.add(Tab(id="tab-1", restaurant_id="r1", number="T-001"))
+    db.commit()
+    dashboard_stats.reconcile(db)
+
+    crud.update_tab_status(db, "tab-1", TabStatus.ACTIVE)
+    orders = [
+        crud.create_order(db, OrderCreate(tab_id=0, items=[
+            OrderItemCreate(menu_item_id=1, name="Chips", quantity=quantity, price=2.5)
+        ]), "tab-1")
+        for quantity in (1, 2, 4)
+    ]
+    crud.update_order_status(db, orders[0].id, OrderStatus.DELIVERED)
+    crud.update_order_status(db, orders[1].id, OrderStatus.CANCELLED)
+    payment = payment_crud.create_payment(db, "tab-1", 12.5, PaymentMethod.CASH)
+    payment_crud.update_payment_status(db, payment.id, PaymentStatus.CONFIRMED)
+
+    live = live_numbers("r1")
+    assert live["orders_today"] == 2
+    assert live["pending_orders"] == 1
+    assert live["revenue_today"] == 12.5
+    assert live["average_ticket"] == 6.25
+    assert live["tables_occupied"] == 1
+
+    dashboard_stats.reconcile(db)
+    assert live_numbers("r1") == live
+    assert dashboard_stats.snapshot("r1")["reconciled_at"] is not None
+
+
+def test_reconciliation_repairs_drift(db):
+    db.add(Restaurant(id="r1", name="One"))
+    db.add(Tab(id="tab-1", restaurant_id="r1", number="T-001", status=TabStatus.ACTIVE))
+    db.commit()
+    dashboard_stats.reconcile(db)
+
+    # A write made by another process never reaches this one's hooks
+    dashboard_stats.tab_status_changed("r1", TabStatus.ACTIVE, TabStatus.PAID)
+    assert dashboard_stats.snapshot("r1")["tables_occupied"] == 0
+
+    dashboard_stats.reconcile(db)
+    assert dashboard_stats.snapshot("r1")["tables_occupied"] == 1
@@ -0,0 +1,150 @@
+"""
+EXPLAIN-based regression tests for the dashboard's hot queries.
+
+The schema is built both from the models and by running the Alembic
+migrations, so the two cannot drift apart, and each query must be answered
+by a SEARCH on the expected index rather than a table scan or a temporary
+sort.
+"""
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.pool import StaticPool
+
+from app.database.base import Base
+from app.database.models import Message, OPEN_TAB_CONDITION, Order, OrderStatus, Tab, TabStatus
+
+PWA_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HOT_QUERIES = {
+    "tabs by restaurant and status": (
+        select(Tab.id).where(Tab.restaurant_id == "r1", Tab.status == TabStatus.ACTIVE)
+        .order_by(Tab.created_at.desc()),
+        "ix_tabs_restaurant_status_created",
+    ),
+    "open tabs for the live dashboard": (
+        select(Tab.id).where(Tab.restaurant_id == "r1", text(OPEN_TAB_CONDITION))
+        .order_by(Tab.created_at.desc()),
+        "ix_tabs_restaurant_open_created",
+    ),
+    "tab by daily number": (
+        select(Tab.id).where(
+            Tab.restaurant_id == "r1", Tab.business_date == date(2026, 1, 1), Tab.number == "T-001"
+        ),
+        "uq_tabs_restaurant_date_number",
+    ),
+    "orders on a tab by status": (
+        select(Order.id).where(Order.tab_id == "t1", Order.status == OrderStatus.PLACED),
+        "ix_orders_tab_status",
+    ),
+    "unread messages on a tab": (
+        select(Message.id).where(Message.tab_id == "t1", Message.is_read == False),  # noqa: E712
+        "ix_messages_tab_is_read",
+    ),
+}
+
+
+def migrate(engine, revision="head"):
+    alembic_config = pytest.importorskip("alembic.config")
+    alembic_command = pytest.importorskip("alembic.command")
+    
+    config = alembic_config.Config(os.path.join(PWA_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PWA_ROOT, "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        alembic_command.upgrade(config, revision)
+
+
+def migrated_engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    migrate(engine)
+    return engine
+
+
+def model_engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(params=["models", "migrations"])
+def schema_engine(request):
+    engine = model_engine() if request.param == "models" else migrated_engine()
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement):
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        return [row[-1] for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql)]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(schema_engine, name):
+    statement, index = HOT_QUERIES[name]
+    plan = query_plan(schema_engine, statement)
+    
+    assert any(f"USING INDEX {index}" in step or f"USING COVERING INDEX {index}" in step for step in plan), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+def test_migrations_match_models():
+    migrated = inspect(migrated_engine())
+    modelled = inspect(model_engine())
+    
+    assert set(migrated.get_table_names()) - {"alembic_version"} == set(modelled.get_table_names())
+    for table in modelled.get_table_names():
+        assert (
+            {(column["name"], column["nullable"]) for column in migrated.get_columns(table)}
+            == {(column["name"], column["nullable"]) for column in modelled.get_columns(table)}
+        ), table
+        assert (
+            {(index["name"], tuple(index["column_names"]), bool(index["unique"])) for index in migrated.get_indexes(table)}
+            == {(index["name"], tuple(index["column_names"]), bool(index["unique"])) for index in modelled.get_indexes(table)}
+        ), table
+
+
+def tabs_before_business_date(*tabs):
+    """An engine at revision 0002 holding the given (id, number, created_at) tabs"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    migrate(engine, "0002")
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO restaurants (id, name) VALUES ('r1', 'Bistro')"))
+        for tab_id, number, created_at in tabs:
+            connection.execute(
+                text(
+                    "INSERT INTO tabs (id, restaurant_id, number, status, created_at) "
+                    "VALUES (:id, 'r1', :number, 'ACTIVE', :created_at)"
+                ),
+                {"id": tab_id, "number": number, "created_at": created_at}
+            )
+    return engine
+
+
+def test_business_date_is_backfilled_before_it_becomes_required():
+    engine = tabs_before_business_date(
+        ("t1", "T-001", "2026-01-01 10:00:00"),
+        ("t2", "T-001", "2026-01-02 10:00:00"),
+        ("t3", "T-002", None),
+    )
+    migrate(engine)
+    
+    with engine.connect() as connection:
+        dates = dict(connection.execute(text("SELECT id, business_date FROM tabs")).fetchall())
+    assert dates["t1"] == "2026-01-01" and dates["t2"] == "2026-01-02"
+    assert dates["t3"] is not None
+    assert not {c["name"]: c for c in inspect(engine).get_columns("tabs")}["business_date"]["nullable"]
+
+
+def test_duplicate_daily_numbers_stop_the_migration():
+    engine = tabs_before_business_date(
+        ("t1", "T-001", "2026-01-01 10:00:00"),
+        ("t2", "T-001", "2026-01-01 18:00:00"),
+    )
+    
+    with pytest.raises(RuntimeError, match="r1 2026-01-01 T-001"):
+        migrate(engine)
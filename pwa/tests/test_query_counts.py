@@ -0,0 +1,88 @@
+"""
+Query-count budgets for tab reads.
+
+Each test renders what an endpoint shows for a tab list or a tab detail view
+and fails if doing so takes more statements than its loading profile allows,
+so N+1 regressions are caught regardless of how many rows are involved.
+"""
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.crud import tabs as crud
+from app.database.models import (
+    Order, OrderItem, Payment, PaymentMethod, PaymentStatus, Restaurant, Tab
+)
+
+
+def seed(db, tab_count=20, orders_per_tab=3, items_per_order=4):
+    db.add(Restaurant(id="r1", name="Test Restaurant"))
+    for t in range(tab_count):
+        tab_id = f"tab-{t}"
+        db.add(Tab(id=tab_id, restaurant_id="r1", number=f"T-{t:03d}"))
+        for o in range(orders_per_tab):
+            order_id = f"{tab_id}-order-{o}"
+            db.add(Order(id=order_id, tab_id=tab_id))
+            for i in range(items_per_order):
+                db.add(OrderItem(
+                    id=f"{order_id}-item-{i}", order_id=order_id,
+                    menu_item_id=f"m{i}", name=f"Item {i}", quantity=1, price=2.5
+                ))
+        db.add(Payment(
+            id=f"{tab_id}-payment", tab_id=tab_id, amount=5.0,
+            payment_method=PaymentMethod.CASH, status=PaymentStatus.CONFIRMED
+        ))
+    db.commit()
+    db.expunge_all()
+
+
+def render_list(tabs):
+    return [
+        {"number": tab.number, "status": tab.status, "total": tab.total_amount,
+         "paid": tab.amount_paid, "balance": tab.balance}
+        for tab in tabs
+    ]
+
+
+def render_detail(tab):
+    return {
+        "number": tab.number,
+        "orders": [
+            {"id": order.id, "items": [(item.name, item.quantity, item.price) for item in order.items]}
+            for order in tab.orders
+        ],
+        "payments": [(payment.amount, payment.status) for payment in tab.payments],
+    }
+
+
+def test_tab_list_uses_one_query(db, max_queries):
+    seed(db)
+    with max_queries(1):
+        rows = render_list(crud.get_tabs(db, limit=100))
+    assert len(rows) == 20
+
+
+def test_tab_detail_loads_relationships_in_fixed_queries(db, max_queries):
+    seed(db)
+    with max_queries(4):  # tab, orders, order items, payments
+        detail = render_detail(crud.get_tab(db, "tab-3"))
+    assert len(detail["orders"]) == 3
+    assert all(len(order["items"]) == 4 for order in detail["orders"])
+    assert len(detail["payments"]) == 1
+
+
+def test_detail_query_count_does_not_grow_with_orders(db, max_queries):
+    seed(db, tab_count=1, orders_per_tab=25, items_per_order=6)
+    with max_queries(4):
+        render_detail(crud.get_tab(db, "tab-0"))
+
+
+def test_list_profile_refuses_lazy_loads(db):
+    seed(db, tab_count=1)
+    tab = crud.get_tabs(db)[0]
+    with pytest.raises(InvalidRequestError):
+        tab.orders
+
+
+def test_unknown_profile(db):
+    with pytest.raises(ValueError):
+        crud.get_tabs(db, profile="everything")
@@ -0,0 +1,110 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.database.base import Base
+from app.database.models import Restaurant
+from app.repositories import InMemoryTabRepository, InMemoryWaiterRepository
+from app.repositories.samples import SAMPLE_TABS, SAMPLE_WAITERS
+
+
+def test_memory_waiters_are_indexed_by_restaurant_and_active_flag():
+    waiters = InMemoryWaiterRepository(SAMPLE_WAITERS)
+    restaurant_id = SAMPLE_WAITERS[0]["restaurant_id"]
+
+    active = asyncio.run(waiters.list(restaurant_id=restaurant_id, is_active=True))
+    assert [w["id"] for w in active] == [w["id"] for w in SAMPLE_WAITERS if w["is_active"]]
+
+    asyncio.run(waiters.set_active("1", False))
+    assert asyncio.run(waiters.get(1))["is_active"] is False
+    assert 1 not in [w["id"] for w in asyncio.run(waiters.list(is_active=True))]
+    assert asyncio.run(waiters.list(restaurant_id="elsewhere")) == []
+
+
+def test_memory_tab_numbers_are_unique_per_restaurant_under_threads():
+    tabs = InMemoryTabRepository(SAMPLE_TABS)
+
+    def open_tab(i):
+        return asyncio.run(tabs.open("r1" if i % 2 else "r2"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        opened = list(pool.map(open_tab, range(200)))
+
+    assert len({tab["id"] for tab in opened}) == 200
+    for restaurant_id in ("r1", "r2"):
+        numbers = sorted(tab["tab_number"] for tab in opened if tab["restaurant_id"] == restaurant_id)
+        assert numbers == list(range(1, 101))
+    # Seeded IDs are never reused
+    assert not {tab["id"] for tab in opened} & {tab["id"] for tab in SAMPLE_TABS}
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    url = f"sqlite:///{tmp_path / 'repositories.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Restaurant.__table__.insert(), [{"id": "r1", "name": "One"}])
+    engine.dispose()
+
+    async_engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"))
+    yield async_sessionmaker(async_engine, expire_on_commit=False)
+    asyncio.run(async_engine.dispose())
+
+
+def test_database_tabs_allocate_numbers_concurrently_and_survive_restart(session_factory):
+    from app.repositories.database import DatabaseTabRepository
+
+    async def scenario():
+        tabs = DatabaseTabRepository(session_factory)
+        opened = await asyncio.gather(*(tabs.open("r1") for _ in range(10)))
+        assert sorted(tab["tab_number"] for tab in opened) == list(range(1, 11))
+
+        # A new repository (e.g. after a restart) sees the same state and
+        # continues the day's numbering
+        restarted = DatabaseTabRepository(session_factory)
+        assert await restarted.get(opened[0]["id"]) == opened[0]
+        assert len(await restarted.list_open("r1")) == 0
+        await restarted.set_status(opened[0]["id"], "active")
+        assert [tab["id"] for tab in await restarted.list_open("r1")] == [opened[0]["id"]]
+        assert (await restarted.open("r1"))["tab_number"] == 11
+
+    asyncio.run(scenario())
+
+
+def test_database_tabs_only_retry_tab_number_conflicts(session_factory):
+    from sqlalchemy import event
+    from sqlalchemy.exc import IntegrityError
+    from app.repositories.database import DatabaseTabRepository
+
+    async def scenario():
+        engine = session_factory.kw["bind"]
+        event.listen(engine.sync_engine, "connect", lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"))
+        await engine.dispose()
+        tabs = DatabaseTabRepository(session_factory)
+
+        # An unknown restaurant fails its foreign key, which no new number fixes
+        with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+            await tabs.open("no-such-restaurant")
+        assert (await tabs.open("r1"))["tab_number"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_database_waiters(session_factory):
+    from app.repositories.database import DatabaseWaiterRepository
+
+    async def scenario():
+        waiters = DatabaseWaiterRepository(session_factory)
+        added = await waiters.add("r1", email="amy@example.com", name="Amy")
+        assert (await waiters.get(added["id"]))["name"] == "Amy"
+        await waiters.set_active(added["id"], False)
+        assert await waiters.list(restaurant_id="r1", is_active=True) == []
+        assert [w["id"] for w in await waiters.list(restaurant_id="r1")] == [added["id"]]
+
+    asyncio.run(scenario())
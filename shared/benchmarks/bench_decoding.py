@@ -0,0 +1,98 @@
+"""
+Micro-benchmark for APIClient response decoding.
+
+Decodes a 500-order list response the way APIClient.request used to
+(json.loads, one model per item, then the whole envelope validated again)
+and with the ResponseDecoder, validated and trusted, both as an envelope
+and as a bare JSON array, plus MessagePack when msgpack is installed.
+Trusted decoding skips validation and builds models with model_construct
+(construct under pydantic v1).
+
+    python -m shared.benchmarks.bench_decoding [--orders 500] [--repeat 30]
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from ..models.base import ResponseModel
+from ..models.commerce import OrderBase
+from ..utils.codecs import msgpack_available, pack
+from ..utils.decoding import PYDANTIC_V2, response_decoder
+
+
+def sample_orders(count: int) -> List[dict]:
+    start = datetime(2026, 1, 1, 12, 0)
+    return [
+        {
+            "id": f"order_{i}",
+            "created_at": (start + timedelta(minutes=i)).isoformat(),
+            "updated_at": (start + timedelta(minutes=i + 5)).isoformat(),
+            "restaurant_id": "rest_1",
+            "table_number": f"T{i % 20}",
+            "status": "preparing",
+            "items": [
+                {
+                    "menu_item_id": f"item_{j}",
+                    "name": f"Dish {j}",
+                    "quantity": j + 1,
+                    "unit_price": 4.5,
+                    "total_price": 4.5 * (j + 1),
+                }
+                for j in range(3)
+            ],
+            "subtotal": 27.0,
+            "tax": 4.32,
+            "discount": 0.0,
+            "total": 31.32,
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_decode(raw: bytes):
+    response_data = json.loads(raw)
+    response_data["data"] = [OrderBase(**order) for order in response_data["data"]]
+    return ResponseModel(**response_data)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark response decoding")
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    orders = sample_orders(args.orders)
+    envelope = json.dumps({"success": True, "message": "", "data": orders}).encode()
+    bare = json.dumps(orders).encode()
+    model = List[OrderBase]
+
+    # Same result either way; trusted models keep the raw JSON values
+    assert response_decoder.decode(envelope, model).data == legacy_decode(envelope).data
+    trusted = response_decoder.decode(envelope, model, trusted=True).data
+    assert [order.id for order in trusted] == [order["id"] for order in orders]
+
+    cases = {
+        "legacy (loads + per-item + envelope)": lambda: legacy_decode(envelope),
+        "decoder, envelope": lambda: response_decoder.decode(envelope, model),
+        "decoder, bare array": lambda: response_decoder.decode(bare, model),
+        "decoder, trusted": lambda: response_decoder.decode(envelope, model, trusted=True),
+    }
+    if msgpack_available():
+        packed = pack({"success": True, "message": "", "data": orders})
+        print(f"body size: JSON {len(envelope)} bytes, MessagePack {len(packed)} bytes")
+        cases["decoder, msgpack envelope"] = lambda: response_decoder.decode(
+            packed, model, content_type="application/msgpack"
+        )
+    print(f"pydantic {'v2' if PYDANTIC_V2 else 'v1'}, {args.orders} orders, best of {args.repeat}")
+    baseline = None
+    for name, run in cases.items():
+        best = min(timeit.repeat(run, number=5, repeat=args.repeat)) / 5
+        baseline = baseline or best
+        print(f"  {name:40s} {best * 1000:8.2f} ms  {baseline / best:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,15 @@
 from typing import List, Optional, Dict, Any
 from ..models.commerce import OrderCreate, OrderUpdate, OrderResponse, OrderStatus
-from ..utils.api_client import get_api_client
+from ..utils.api_client import BatchCall, get_api_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched order or order list may be reused. Order writes also
+# change the tab they belong to, so they invalidate cached tabs as well.
+ORDER_CACHE_TTL = 5.0
+ORDER_ENDPOINTS = ("orders/", "tabs/")
+
 class OrderService:
     def __init__(self):
         self.api = get_api_client()
@@ -15,7 +20,8 @@ class OrderService:
             response = await self.api.post(
                 "orders/",
                 json=order_data.dict(),
-                response_model=OrderResponse
+                response_model=OrderResponse,
+                invalidates=ORDER_ENDPOINTS
             )
             if not response.success:
                 logger.error(f"Failed to create order: {response.error}")
@@ -29,7 +35,8 @@ class OrderService:
         try:
             response = await self.api.get(
                 f"orders/{order_id}",
-                response_model=OrderResponse
+                response_model=OrderResponse,
+                cache_ttl=ORDER_CACHE_TTL
             )
             if not response.success:
                 logger.warning(f"Order not found: {order_id}")
@@ -54,7 +61,8 @@ class OrderService:
             response = await self.api.patch(
                 f"orders/{order_id}",
                 json=update_data,
-                response_model=OrderResponse
+                response_model=OrderResponse,
+                invalidates=ORDER_ENDPOINTS
             )
             
             if not response.success:
@@ -66,6 +74,21 @@ class OrderService:
             logger.error(f"Error updating order: {str(e)}")
             raise
     
+    def list_orders_call(
+        self,
+        restaurant_id: Optional[str] = None,
+        status: Optional[OrderStatus] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> BatchCall:
+        """The list_orders request, for sending in an APIClient.batch"""
+        params = {"limit": limit, "offset": offset}
+        if restaurant_id:
+            params["restaurant_id"] = restaurant_id
+        if status:
+            params["status"] = status
+        return BatchCall("GET", "orders/", response_model=List[OrderResponse], params=params)
+    
     async def list_orders(
         self,
         restaurant_id: Optional[str] = None,
@@ -75,16 +98,12 @@ class OrderService:
     ) -> List[OrderResponse]:
         """List orders with optional filters"""
         try:
-            params = {"limit": limit, "offset": offset}
-            if restaurant_id:
-                params["restaurant_id"] = restaurant_id
-            if status:
-                params["status"] = status
-                
+            call = self.list_orders_call(restaurant_id, status, limit, offset)
             response = await self.api.get(
-                "orders/",
-                params=params,
-                response_model=List[OrderResponse]
+                call.endpoint,
+                params=call.params,
+                response_model=call.response_model,
+                cache_ttl=ORDER_CACHE_TTL
             )
             
             if not response.success:
@@ -105,7 +124,8 @@ class OrderService:
         try:
             response = await self.api.delete(
                 f"orders/{order_id}",
-                json={"reason": reason} if reason else None
+                json={"reason": reason} if reason else None,
+                invalidates=ORDER_ENDPOINTS
             )
             
             if not response.success:
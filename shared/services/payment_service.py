@@ -1,10 +1,13 @@
 from typing import List, Optional, Dict, Any
 from ..models.commerce import PaymentCreate, PaymentBase, PaymentStatus, PaymentMethod
-from ..utils.api_client import get_api_client
+from ..utils.api_client import BatchCall, get_api_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Payments change their tab's balance, so payment writes invalidate cached tabs
+PAYMENT_ENDPOINTS = ("payments/", "tabs/")
+
 class PaymentService:
     def __init__(self):
         self.api = get_api_client()
@@ -15,7 +18,8 @@ class PaymentService:
             response = await self.api.post(
                 "payments/",
                 json=payment_data.dict(),
-                response_model=PaymentBase
+                response_model=PaymentBase,
+                invalidates=PAYMENT_ENDPOINTS
             )
             
             if not response.success:
@@ -59,7 +63,8 @@ class PaymentService:
             response = await self.api.patch(
                 f"payments/{payment_id}",
                 json=update_data,
-                response_model=PaymentBase
+                response_model=PaymentBase,
+                invalidates=PAYMENT_ENDPOINTS
             )
             
             if not response.success:
@@ -71,6 +76,24 @@ class PaymentService:
             logger.error(f"Error updating payment: {str(e)}")
             raise
     
+    def list_payments_call(
+        self,
+        order_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        method: Optional[PaymentMethod] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> BatchCall:
+        """The list_payments request, for sending in an APIClient.batch"""
+        params = {"limit": limit, "offset": offset}
+        if order_id:
+            params["order_id"] = order_id
+        if status:
+            params["status"] = status
+        if method:
+            params["method"] = method
+        return BatchCall("GET", "payments/", response_model=List[PaymentBase], params=params)
+    
     async def list_payments(
         self,
         order_id: Optional[str] = None,
@@ -81,18 +104,11 @@ class PaymentService:
     ) -> List[PaymentBase]:
         """List payments with optional filters"""
         try:
-            params = {"limit": limit, "offset": offset}
-            if order_id:
-                params["order_id"] = order_id
-            if status:
-                params["status"] = status
-            if method:
-                params["method"] = method
-                
+            call = self.list_payments_call(order_id, status, method, limit, offset)
             response = await self.api.get(
-                "payments/",
-                params=params,
-                response_model=List[PaymentBase]
+                call.endpoint,
+                params=call.params,
+                response_model=call.response_model
             )
             
             if not response.success:
@@ -120,7 +136,8 @@ class PaymentService:
                 
             response = await self.api.post(
                 f"payments/{payment_id}/refund",
-                json=refund_data if refund_data else None
+                json=refund_data if refund_data else None,
+                invalidates=PAYMENT_ENDPOINTS
             )
             
             if not response.success:
@@ -1,10 +1,15 @@
 from typing import List, Optional, Dict, Any
 from ..models.commerce import TabCreate, TabUpdate, TabResponse, TabStatus, OrderBase
-from ..utils.api_client import get_api_client
+from ..utils.api_client import BatchCall, get_api_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched tab or tab list may be reused; every tab write below
+# invalidates the cached copies
+TAB_CACHE_TTL = 5.0
+TAB_ENDPOINTS = ("tabs/",)
+
 class TabService:
     def __init__(self):
         self.api = get_api_client()
@@ -15,7 +20,8 @@ class TabService:
             response = await self.api.post(
                 "tabs/",
                 json=tab_data.dict(),
-                response_model=TabResponse
+                response_model=TabResponse,
+                invalidates=TAB_ENDPOINTS
             )
             
             if not response.success:
@@ -32,7 +38,8 @@ class TabService:
         try:
             response = await self.api.get(
                 f"tabs/{tab_id}",
-                response_model=TabResponse
+                response_model=TabResponse,
+                cache_ttl=TAB_CACHE_TTL
             )
             
             if not response.success:
@@ -64,7 +71,8 @@ class TabService:
             response = await self.api.patch(
                 f"tabs/{tab_id}",
                 json=update_data,
-                response_model=TabResponse
+                response_model=TabResponse,
+                invalidates=TAB_ENDPOINTS
             )
             
             if not response.success:
@@ -81,7 +89,8 @@ class TabService:
         try:
             response = await self.api.patch(
                 f"tabs/{tab_id}/close",
-                response_model=TabResponse
+                response_model=TabResponse,
+                invalidates=TAB_ENDPOINTS
             )
             
             if not response.success:
@@ -98,7 +107,8 @@ class TabService:
         try:
             response = await self.api.post(
                 f"tabs/{tab_id}/orders",
-                json={"order_id": order.id}
+                json={"order_id": order.id},
+                invalidates=TAB_ENDPOINTS
             )
             
             if not response.success:
@@ -110,6 +120,24 @@ class TabService:
             logger.error(f"Error adding order to tab: {str(e)}")
             raise
     
+    def list_tabs_call(
+        self,
+        restaurant_id: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        status: Optional[TabStatus] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> BatchCall:
+        """The list_tabs request, for sending in an APIClient.batch"""
+        params = {"limit": limit, "offset": offset}
+        if restaurant_id:
+            params["restaurant_id"] = restaurant_id
+        if customer_id:
+            params["customer_id"] = customer_id
+        if status:
+            params["status"] = status
+        return BatchCall("GET", "tabs/", response_model=List[TabResponse], params=params)
+    
     async def list_tabs(
         self,
         restaurant_id: Optional[str] = None,
@@ -120,18 +148,12 @@ class TabService:
     ) -> List[TabResponse]:
         """List tabs with optional filters"""
         try:
-            params = {"limit": limit, "offset": offset}
-            if restaurant_id:
-                params["restaurant_id"] = restaurant_id
-            if customer_id:
-                params["customer_id"] = customer_id
-            if status:
-                params["status"] = status
-                
+            call = self.list_tabs_call(restaurant_id, customer_id, status, limit, offset)
             response = await self.api.get(
-                "tabs/",
-                params=params,
-                response_model=List[TabResponse]
+                call.endpoint,
+                params=call.params,
+                response_model=call.response_model,
+                cache_ttl=TAB_CACHE_TTL
             )
             
             if not response.success:
@@ -0,0 +1,114 @@
+"""
+APIClient request coalescing and response cache, against an in-process httpx.MockTransport.
+"""
+import asyncio
+import itertools
+
+import httpx
+
+from shared.utils.api_client import APIClient
+
+_origins = itertools.count()
+
+
+def make_client(handler) -> APIClient:
+    # Transports are shared per origin, so every client gets its own
+    api = APIClient(f"http://backend-{next(_origins)}.test/api/v1", token="t", msgpack=False)
+    api.transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return api
+
+
+class Backend:
+    """Mock backend counting requests per method and path"""
+
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+        self.requests = []
+        self.release = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        n = len(self.requests)
+        if self.release is not None:
+            await self.release.wait()
+        etag = self.headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, json={"n": n}, headers=self.headers)
+
+    def count(self, method="GET"):
+        return sum(1 for request in self.requests if request.method == method)
+
+
+def test_concurrent_identical_gets_share_one_request():
+    backend = Backend()
+    backend.release = asyncio.Event()
+
+    async def scenario(api):
+        calls = [asyncio.ensure_future(api.get("tabs/", params={"page": 1})) for _ in range(3)]
+        other = asyncio.ensure_future(api.get("tabs/", params={"page": 2}))
+        await asyncio.sleep(0.01)
+        backend.release.set()
+        return await asyncio.gather(*calls), await other
+
+    same, other = asyncio.run(scenario(make_client(backend)))
+
+    assert same[0].success and [response.data for response in same] == [same[0].data] * 3
+    assert other.success and other.data != same[0].data
+    assert backend.count() == 2
+
+
+def test_cached_get_is_served_until_a_write_invalidates_it():
+    backend = Backend()
+    api = make_client(backend)
+
+    async def scenario():
+        first = await api.get("tabs/t1", cache_ttl=30)
+        cached = await api.get("tabs/t1", cache_ttl=30)
+        await api.post("tabs/t1/close", invalidates=["tabs/"])
+        refreshed = await api.get("tabs/t1", cache_ttl=30)
+        return first, cached, refreshed
+
+    first, cached, refreshed = asyncio.run(scenario())
+
+    assert cached.data == first.data
+    assert refreshed.data != first.data
+    assert backend.count("GET") == 2
+
+
+def test_gets_without_ttl_are_not_cached():
+    backend = Backend()
+    api = make_client(backend)
+
+    async def scenario():
+        await api.get("orders/")
+        await api.get("orders/")
+
+    asyncio.run(scenario())
+    assert backend.count() == 2
+
+
+def test_no_store_responses_are_not_cached():
+    backend = Backend(headers={"Cache-Control": "no-store"})
+    api = make_client(backend)
+
+    async def scenario():
+        await api.get("orders/", cache_ttl=30)
+        await api.get("orders/", cache_ttl=30)
+
+    asyncio.run(scenario())
+    assert backend.count() == 2
+
+
+def test_expired_entry_is_revalidated_with_its_etag():
+    backend = Backend(headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+    api = make_client(backend)
+
+    async def scenario():
+        return await api.get("tabs/", cache_ttl=30), await api.get("tabs/", cache_ttl=30)
+
+    first, revalidated = asyncio.run(scenario())
+
+    assert revalidated.data == first.data == {"n": 1}
+    assert backend.requests[1].headers["If-None-Match"] == '"v1"'
+    assert backend.count() == 2
@@ -0,0 +1,92 @@
+"""
+ResponseDecoder on JSON bodies, under whichever pydantic major version is installed.
+"""
+import json
+from typing import Dict, List
+
+import pydantic
+import pytest
+from pydantic import BaseModel
+
+from shared.utils.decoding import PYDANTIC_V2, ResponseDecodeError, ResponseDecoder
+
+
+class Item(BaseModel):
+    id: str
+    price: int
+
+
+ITEMS = [{"id": "a", "price": 100}, {"id": "b", "price": 250}]
+
+
+def body(value) -> bytes:
+    return json.dumps(value).encode()
+
+
+@pytest.fixture
+def decoder():
+    return ResponseDecoder()
+
+
+def test_bare_array_is_the_payload(decoder):
+    response = decoder.decode(body(ITEMS), List[Item])
+
+    assert response.success
+    assert [item.price for item in response.data] == [100, 250]
+    assert all(isinstance(item, Item) for item in response.data)
+
+
+def test_envelope_is_unwrapped_for_list_and_model_types(decoder):
+    envelope = {"success": True, "message": "ok", "data": ITEMS}
+
+    listed = decoder.decode(body(envelope), List[Item])
+    single = decoder.decode(body({**envelope, "data": ITEMS[0]}), Item)
+
+    assert listed.message == "ok" and [item.id for item in listed.data] == ["a", "b"]
+    assert isinstance(single.data, Item) and single.data.id == "a"
+
+
+def test_bare_object_is_the_payload(decoder):
+    response = decoder.decode(body({"x": ITEMS[0]}), Dict[str, Item])
+
+    assert response.data["x"] == Item(id="a", price=100)
+
+
+def test_error_envelope_keeps_its_error(decoder):
+    response = decoder.decode(body({"success": False, "error": {"code": 409}}), List[Item])
+
+    assert not response.success
+    assert response.error == {"code": 409}
+    assert response.data is None
+
+
+def test_without_a_model_the_parsed_body_is_returned(decoder):
+    assert decoder.decode(body(ITEMS)).data == ITEMS
+
+
+@pytest.mark.parametrize("raw", [b"[{", b"{\"data\": ", b"not json"])
+def test_invalid_json_raises_decode_error(decoder, raw):
+    with pytest.raises(ResponseDecodeError):
+        decoder.decode(raw, List[Item])
+
+
+def test_invalid_items_fail_validation(decoder):
+    with pytest.raises(pydantic.ValidationError):
+        decoder.decode(body([{"id": "a", "price": "free"}]), List[Item])
+
+
+def test_decode_parsed_matches_decode(decoder):
+    parsed = decoder.decode_parsed({"data": ITEMS}, List[Item])
+
+    assert parsed.data == decoder.decode(body(ITEMS), List[Item]).data
+
+
+@pytest.mark.parametrize("payload", [
+    [{"id": "a", "price": "free"}],
+    {"success": True, "message": "", "data": [{"id": "a", "price": "free"}]},
+])
+def test_trusted_decoding_skips_validation(decoder, payload):
+    response = decoder.decode(body(payload), List[Item], trusted=True)
+
+    assert isinstance(response.data[0], Item)
+    assert response.data[0].price == "free"
@@ -0,0 +1,168 @@
+"""
+Transport retries and circuit breaker, against an in-process httpx.MockTransport.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from shared.utils.transport import CircuitBreaker, CircuitOpenError, Transport, TransportConfig
+
+URL = "http://backend.test/api/v1/tabs/"
+
+
+def make_transport(handler, **overrides) -> Transport:
+    settings = dict(max_retries=2, backoff_base=0, failure_threshold=2, reset_timeout=30.0)
+    settings.update(overrides)
+    transport = Transport(TransportConfig(**settings))
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return transport
+
+
+def expire_open_period(breaker: CircuitBreaker):
+    breaker.opened_at -= breaker.reset_timeout
+
+
+class Backend:
+    """Mock backend answering with a queue of outcomes, then with 200s"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.method)
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if callable(outcome):
+            return await outcome(request)
+        return httpx.Response(outcome, json={})
+
+
+def connect_error():
+    return httpx.ConnectError("connection refused")
+
+
+def test_get_is_retried_on_transport_errors_and_unavailable_statuses():
+    backend = Backend(connect_error(), 503)
+    transport = make_transport(backend, failure_threshold=10)
+
+    response = asyncio.run(transport.request("GET", URL))
+
+    assert response.status_code == 200
+    assert backend.calls == ["GET", "GET", "GET"]
+
+
+def test_post_is_never_retried():
+    backend = Backend(503)
+    transport = make_transport(backend, failure_threshold=10)
+    assert asyncio.run(transport.request("POST", URL)).status_code == 503
+
+    backend = Backend(connect_error())
+    transport = make_transport(backend, failure_threshold=10)
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(transport.request("POST", URL))
+    assert backend.calls == ["POST"]
+
+
+def test_retries_stop_after_max_retries():
+    backend = Backend(503, 503, 503, 503)
+    transport = make_transport(backend, failure_threshold=10)
+
+    assert asyncio.run(transport.request("PUT", URL)).status_code == 503
+    assert backend.calls == ["PUT"] * 3
+
+
+def test_breaker_opens_then_half_opens_then_closes():
+    backend = Backend(connect_error(), connect_error())
+    transport = make_transport(backend, max_retries=0)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(transport.request("GET", URL))
+    assert transport.breaker.state == CircuitBreaker.OPEN
+
+    # Open: rejected without reaching the backend
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(transport.request("GET", URL))
+    assert len(backend.calls) == 2
+
+    expire_open_period(transport.breaker)
+    assert transport.breaker.state == CircuitBreaker.HALF_OPEN
+    assert asyncio.run(transport.request("GET", URL)).status_code == 200
+    assert transport.breaker.state == CircuitBreaker.CLOSED
+    assert transport.breaker.failures == 0
+
+
+def test_failed_trial_reopens_the_circuit():
+    backend = Backend(connect_error(), connect_error(), 503)
+    transport = make_transport(backend, max_retries=0)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(transport.request("GET", URL))
+
+    expire_open_period(transport.breaker)
+    assert asyncio.run(transport.request("GET", URL)).status_code == 503
+    assert transport.breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_lets_a_single_trial_through():
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={})
+
+    async def scenario(transport):
+        trial = asyncio.ensure_future(transport.request("GET", URL))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await transport.request("GET", URL)
+        release.set()
+        return await trial
+
+    backend = Backend(connect_error(), connect_error(), slow)
+    transport = make_transport(backend, max_retries=0)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(transport.request("GET", URL))
+    expire_open_period(transport.breaker)
+
+    assert asyncio.run(scenario(transport)).status_code == 200
+    assert transport.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_trial_does_not_leave_the_circuit_stuck():
+    async def hang(request):
+        await asyncio.Event().wait()
+
+    async def cancel_trial(transport):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(transport.request("GET", URL), timeout=0.01)
+
+    backend = Backend(connect_error(), connect_error(), hang)
+    transport = make_transport(backend, max_retries=0)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(transport.request("GET", URL))
+    expire_open_period(transport.breaker)
+
+    asyncio.run(cancel_trial(transport))
+
+    # The next request is the new trial and closes the circuit
+    assert asyncio.run(transport.request("GET", URL)).status_code == 200
+    assert transport.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_trial_failing_with_a_non_transport_error_frees_the_slot():
+    backend = Backend(connect_error(), connect_error(), RuntimeError("bug in a hook"))
+    transport = make_transport(backend, max_retries=0)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(transport.request("GET", URL))
+    expire_open_period(transport.breaker)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(transport.request("GET", URL))
+    assert asyncio.run(transport.request("GET", URL)).status_code == 200
@@ -1,52 +1,108 @@
 import httpx
-import json
-from typing import Any, Dict, Optional, TypeVar, Type
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TypeVar, Type
+from urllib.parse import urlsplit
 from ..models.base import ResponseModel, T
-from ..config import settings
+from .codecs import MSGPACK_ACCEPT, msgpack_available
+from .decoding import ResponseDecodeError, response_decoder
+from .response_cache import ResponseCache, SingleFlight
+from .transport import CircuitOpenError, TransportConfig, get_transport, release_transport
 import logging
 
 logger = logging.getLogger(__name__)
 
+class BatchCall:
+    """One request to send with APIClient.batch"""
+    
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        response_model: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        invalidates: Iterable[str] = ()
+    ):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.response_model = response_model
+        self.params = params or {}
+        self.json = json
+        self.invalidates = tuple(invalidates)
+
 class APIClient:
-    def __init__(self, base_url: str, token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        transport_config: Optional[TransportConfig] = None,
+        trusted: bool = False,
+        msgpack: bool = True
+    ):
         self.base_url = base_url
         self.token = token
-        self.client = httpx.AsyncClient()
+        # Ask for MessagePack when it can be decoded; the backend answers
+        # with JSON if it cannot (or will not) send it
+        self.accept = MSGPACK_ACCEPT if msgpack and msgpack_available() else None
+        # Skip response validation; only for clients of our own backend
+        self.trusted = trusted
+        # Pooled connections, timeouts, retries and circuit breaker are shared
+        # with every other client of the same backend
+        self.transport = get_transport(base_url, transport_config)
+        self.cache = ResponseCache()
+        self._inflight = SingleFlight()
     
     async def request(
         self,
         method: str,
         endpoint: str,
         response_model: Type[T] = None,
+        cache_ttl: Optional[float] = None,
+        invalidates: Iterable[str] = (),
+        trusted: Optional[bool] = None,
         **kwargs
     ) -> ResponseModel[T]:
-        """Make an HTTP request to the API."""
+        """
+        Make an HTTP request to the API.
+        
+        Identical concurrent GETs share one HTTP request. With `cache_ttl` a GET
+        may also be answered from the response cache; `invalidates` lists the
+        endpoint prefixes that a write makes stale.
+        
+        The body is decoded and validated against `response_model` (a model,
+        List[...] or generic) in a single pass; `trusted` skips validation
+        and defaults to the client's setting.
+        """
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         headers = kwargs.pop('headers', {})
         
         if self.token:
             headers['Authorization'] = f"Bearer {self.token}"
+        if self.accept:
+            headers.setdefault('Accept', self.accept)
         
         try:
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                **kwargs
-            )
+            if method.upper() == "GET":
+                response = await self._get(url, endpoint, headers, cache_ttl, **kwargs)
+            else:
+                try:
+                    response = await self.transport.request(
+                        method,
+                        url,
+                        route=endpoint,
+                        headers=headers,
+                        **kwargs
+                    )
+                finally:
+                    # Even a failed write may have reached the server
+                    self.cache.invalidate(invalidates)
             response.raise_for_status()
             
-            # Parse response
-            response_data = response.json()
-            
-            # If a response model is provided, validate the data
-            if response_model:
-                if 'data' in response_data:
-                    response_data['data'] = response_model(**response_data['data'])
-                elif isinstance(response_data, dict):
-                    response_data = response_model(**response_data)
-            
-            return ResponseModel(**response_data)
+            return response_decoder.decode(
+                response.content,
+                response_model,
+                trusted=self.trusted if trusted is None else trusted,
+                content_type=response.headers.get("content-type")
+            )
             
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e}")
@@ -55,11 +111,18 @@ class APIClient:
                 message=str(e),
                 error={"code": e.response.status_code, "detail": str(e)}
             )
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
+        except CircuitOpenError as e:
+            logger.warning(f"Request skipped: {e}")
             return ResponseModel(
                 success=False,
-                message="Invalid JSON response",
+                message="Service temporarily unavailable",
+                error={"code": 503, "detail": str(e)}
+            )
+        except ResponseDecodeError as e:
+            logger.error(f"Response decode error: {e}")
+            return ResponseModel(
+                success=False,
+                message="Invalid response body",
                 error={"code": 500, "detail": str(e)}
             )
         except Exception as e:
@@ -70,12 +133,102 @@ class APIClient:
                 error={"code": 500, "detail": str(e)}
             )
     
+    async def _get(self, url: str, endpoint: str, headers: Dict[str, str], cache_ttl: Optional[float], **kwargs) -> httpx.Response:
+        key = self.cache.key(url, kwargs.get("params"), headers)
+        if cache_ttl:
+            entry = self.cache.get(key)
+            if entry is not None and entry.fresh:
+                return entry.response
+        # Callers arriving after an invalidation must not join an older fetch
+        return await self._inflight.run(
+            (key, self.cache.generation),
+            lambda: self._fetch(key, url, endpoint, headers, cache_ttl, **kwargs)
+        )
+    
+    async def _fetch(self, key, url: str, endpoint: str, headers: Dict[str, str], cache_ttl: Optional[float], **kwargs) -> httpx.Response:
+        generation = self.cache.generation
+        entry = self.cache.get(key) if cache_ttl else None
+        if entry is not None and entry.etag:
+            headers = {**headers, "If-None-Match": entry.etag}
+        response = await self.transport.request("GET", url, route=endpoint, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(key, entry, response, cache_ttl)
+            return entry.response
+        if cache_ttl:
+            self.cache.store(key, endpoint, response, cache_ttl, generation)
+        return response
+    
+    async def batch(self, calls: Sequence[BatchCall], trusted: Optional[bool] = None) -> List[ResponseModel]:
+        """
+        Send several requests in one HTTP call to the backend's /batch endpoint.
+        
+        The backend runs them concurrently, so a batch must not contain a call
+        that depends on another one. Results come back in the order of `calls`;
+        each one succeeds or fails on its own. If the batch itself fails, every
+        result carries that error. Batched GETs bypass the response cache.
+        """
+        if not calls:
+            return []
+        prefix = urlsplit(self.base_url).path.rstrip('/')
+        payload = {
+            "requests": [
+                {
+                    "id": str(index),
+                    "method": call.method,
+                    "path": f"{prefix}/{call.endpoint.lstrip('/')}",
+                    "params": call.params,
+                    "body": call.json
+                }
+                for index, call in enumerate(calls)
+            ]
+        }
+        invalidates = [prefix for call in calls for prefix in call.invalidates]
+        response = await self.request("POST", "batch", json=payload, invalidates=invalidates)
+        if not response.success:
+            return [response for _ in calls]
+        
+        results = {item["id"]: item for item in response.data.get("responses", [])}
+        trusted = self.trusted if trusted is None else trusted
+        return [
+            self._batch_result(results.get(str(index)), call, trusted)
+            for index, call in enumerate(calls)
+        ]
+    
+    @staticmethod
+    def _batch_result(item: Optional[Dict[str, Any]], call: BatchCall, trusted: bool) -> ResponseModel:
+        if item is None:
+            return ResponseModel(
+                success=False,
+                message="Missing from batch response",
+                error={"code": 500, "detail": f"No response for {call.method} {call.endpoint}"}
+            )
+        if item["status"] >= 400:
+            body = item.get("body")
+            detail = body.get("detail", body) if isinstance(body, dict) else body
+            return ResponseModel(
+                success=False,
+                message=str(detail),
+                error={"code": item["status"], "detail": detail}
+            )
+        try:
+            return response_decoder.decode_parsed(item.get("body"), call.response_model, trusted=trusted)
+        except Exception as e:
+            logger.error(f"Batched request failed: {e}")
+            return ResponseModel(
+                success=False,
+                message="An unexpected error occurred",
+                error={"code": 500, "detail": str(e)}
+            )
+    
     async def get(self, endpoint: str, **kwargs) -> ResponseModel[T]:
         return await self.request("GET", endpoint, **kwargs)
     
     async def post(self, endpoint: str, **kwargs) -> ResponseModel[T]:
         return await self.request("POST", endpoint, **kwargs)
     
+    async def patch(self, endpoint: str, **kwargs) -> ResponseModel[T]:
+        return await self.request("PATCH", endpoint, **kwargs)
+    
     async def put(self, endpoint: str, **kwargs) -> ResponseModel[T]:
         return await self.request("PUT", endpoint, **kwargs)
     
@@ -83,7 +236,7 @@ class APIClient:
         return await self.request("DELETE", endpoint, **kwargs)
     
     async def close(self):
-        await self.client.aclose()
+        await release_transport(self.base_url)
 
 # Singleton instance
 api_client: Optional[APIClient] = None
@@ -0,0 +1,111 @@
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+TimeLike = Union[time, str]
+DayHours = Optional[Sequence[Optional[TimeLike]]]
+
+
+def _to_minutes(value: TimeLike) -> int:
+    """Convert a time or 'HH:MM' string to minutes since midnight"""
+    if isinstance(value, str):
+        hours, minutes = value.split(":")[:2]
+        return int(hours) * 60 + int(minutes)
+    return value.hour * 60 + value.minute
+
+
+def minute_of_week(moment: datetime) -> int:
+    """Minutes elapsed since Monday 00:00 for the given moment"""
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+class WeeklySchedule:
+    """
+    A restaurant's opening hours compiled into sorted minute-of-week intervals.
+
+    Compile once per schedule change; `is_open` and `next_opening` are then a
+    binary search over two integer tuples.
+    """
+
+    __slots__ = ("_starts", "_ends", "_wraps")
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]]):
+        merged: List[List[int]] = []
+        for start, end in sorted(i for i in intervals if i[0] < i[1]):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = tuple(start for start, _ in merged)
+        self._ends = tuple(end for _, end in merged)
+        # An interval reaching Sunday midnight that continues from Monday 00:00
+        self._wraps = bool(merged) and merged[0][0] == 0 and merged[-1][1] == MINUTES_PER_WEEK
+
+    @classmethod
+    def from_day_hours(cls, hours: Dict[Union[int, str], DayHours]) -> "WeeklySchedule":
+        """
+        Build a schedule from per-day (open, close) pairs.
+
+        Days may be keyed by weekday index (Monday=0) or lowercase name. A day
+        set to None, or with a missing time, is closed. A close time at or
+        before the open time runs past midnight into the next day.
+        """
+        intervals = []
+        for day, day_hours in hours.items():
+            index = WEEKDAYS.index(day) if isinstance(day, str) else int(day)
+            if not day_hours or len(day_hours) != 2 or not all(day_hours):
+                continue
+
+            open_minutes = _to_minutes(day_hours[0])
+            close_minutes = _to_minutes(day_hours[1])
+            if close_minutes <= open_minutes:
+                close_minutes += MINUTES_PER_DAY
+
+            start = index * MINUTES_PER_DAY + open_minutes
+            end = index * MINUTES_PER_DAY + close_minutes
+            if end > MINUTES_PER_WEEK:
+                # Sunday night spills over into Monday morning
+                intervals.append((start, MINUTES_PER_WEEK))
+                intervals.append((0, end - MINUTES_PER_WEEK))
+            else:
+                intervals.append((start, end))
+        return cls(intervals)
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        """The compiled (start, end) minute-of-week intervals"""
+        return list(zip(self._starts, self._ends))
+
+    def is_open_at(self, minute: int) -> bool:
+        """Check whether the given minute of the week falls inside opening hours"""
+        index = bisect_right(self._starts, minute) - 1
+        return index >= 0 and minute < self._ends[index]
+
+    def next_opening_at(self, minute: int) -> Optional[int]:
+        """
+        Minutes from the given minute of the week until the next opening, or
+        None if the schedule never opens
+        """
+        if not self._starts:
+            return None
+        index = bisect_right(self._starts, minute)
+        if index < len(self._starts):
+            return self._starts[index] - minute
+        # Wrap into next week, skipping the Monday 00:00 continuation
+        first = 1 if self._wraps and len(self._starts) > 1 else 0
+        return self._starts[first] + MINUTES_PER_WEEK - minute
+
+    def is_open(self, moment: datetime) -> bool:
+        """Check whether the schedule is open at the given moment"""
+        return self.is_open_at(minute_of_week(moment))
+
+    def next_opening(self, moment: datetime) -> Optional[datetime]:
+        """The next moment after the given one when the schedule opens"""
+        delta = self.next_opening_at(minute_of_week(moment))
+        if delta is None:
+            return None
+        return moment.replace(second=0, microsecond=0) + timedelta(minutes=delta)
@@ -0,0 +1,74 @@
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from typing import Any, Optional
+
+try:
+    import msgpack
+except ImportError:  # optional: clients fall back to JSON
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+# Accept header for clients that can read MessagePack; JSON stays acceptable
+MSGPACK_ACCEPT = "application/msgpack, application/json;q=0.9"
+
+# WebSocket subprotocols, in order of preference
+MSGPACK_SUBPROTOCOL = "billo.msgpack.v1"
+JSON_SUBPROTOCOL = "billo.json.v1"
+
+# MessagePack extension type codes, matching the backend; datetimes use the
+# standard Timestamp type
+EXT_DECIMAL = 1
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """True if a Content-Type header names MessagePack"""
+    return bool(content_type) and content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def _default(value: Any) -> Any:
+    """Typed encoding for values MessagePack has no native type for"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return msgpack.Timestamp.from_datetime(value)
+    if isinstance(value, decimal.Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(value).encode())
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DECIMAL:
+        return decimal.Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def pack(value: Any) -> bytes:
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    """Decode MessagePack; datetimes come back as aware UTC datetimes"""
+    return msgpack.unpackb(data, ext_hook=_ext_hook, timestamp=3, raw=False)
+
+
+def decode_message(message: Any) -> Any:
+    """Decode a WebSocket message: bytes are MessagePack, text is JSON"""
+    if isinstance(message, (bytes, bytearray)):
+        return unpack(bytes(message))
+    return json.loads(message)
@@ -0,0 +1,143 @@
+import json
+from typing import Any, Dict, Optional, Union, get_args, get_origin
+
+import pydantic
+
+from ..models.base import ResponseModel
+from .codecs import is_msgpack, msgpack_available, unpack
+
+PYDANTIC_V2 = pydantic.VERSION.startswith("2")
+
+if PYDANTIC_V2:
+    from pydantic import TypeAdapter
+    from pydantic_core import from_json
+else:
+    from pydantic import parse_obj_as
+
+# Keys that mark a ResponseModel envelope rather than a bare payload
+ENVELOPE_KEYS = frozenset({"success", "data", "error"})
+
+# Response types whose JSON is an array, so a JSON object must be an envelope
+COLLECTION_ORIGINS = (list, tuple, set, frozenset)
+
+
+class ResponseDecodeError(ValueError):
+    """The response body is not valid JSON or MessagePack"""
+
+
+class ResponseDecoder:
+    """
+    Turns a raw response body into a ResponseModel in one validation pass.
+
+    `response_model` may be a model, `List[Model]`, `Dict[str, Model]` or a
+    parametrized generic model. With pydantic v2 a TypeAdapter is built once
+    per type and cached, and the bytes go straight to `validate_json`
+    whenever the shape is known up front: a JSON array is the payload
+    itself, and a JSON object answering a list type must be an envelope.
+    Other objects are parsed by pydantic-core, unwrapped if they are an
+    envelope, and validated once; the envelope is never validated again.
+
+    MessagePack bodies (by `content_type`) are unpacked and then validated
+    like parsed JSON.
+
+    `trusted=True` is for internal calls to our own backend. It skips
+    validation: the body is parsed and models are built with
+    `model_construct` (`construct` under pydantic v1), so nested fields
+    stay plain dicts and lists and values keep their JSON types. It pays
+    off under v1 (the mobile app); under v2, pydantic-core parses and
+    validates in one pass and is usually faster than parsing followed by
+    `model_construct` (see shared/benchmarks/bench_decoding.py).
+    """
+
+    def __init__(self):
+        self._adapters: Dict[Any, Any] = {}
+
+    def _adapter(self, response_type):
+        adapter = self._adapters.get(response_type)
+        if adapter is None:
+            adapter = self._adapters[response_type] = TypeAdapter(response_type)
+        return adapter
+
+    def decode(
+        self,
+        raw: bytes,
+        response_model: Any = None,
+        trusted: bool = False,
+        content_type: Optional[str] = None
+    ) -> ResponseModel:
+        if is_msgpack(content_type):
+            return self.decode_parsed(self._unpack(raw), response_model, trusted)
+
+        if response_model is not None and PYDANTIC_V2 and not trusted:
+            first = raw.lstrip()[:1]
+            try:
+                if first == b"[":
+                    return ResponseModel.model_construct(data=self._adapter(response_model).validate_json(raw))
+                if first == b"{" and get_origin(response_model) in COLLECTION_ORIGINS:
+                    return self._adapter(ResponseModel[response_model]).validate_json(raw)
+            except pydantic.ValidationError as e:
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise ResponseDecodeError(str(e)) from e
+                raise
+
+        return self.decode_parsed(self._parse(raw), response_model, trusted)
+
+    def decode_parsed(self, body: Any, response_model: Any = None, trusted: bool = False) -> ResponseModel:
+        """Same as decode, for a body that has already been parsed from JSON"""
+        if isinstance(body, dict) and ENVELOPE_KEYS.intersection(body):
+            envelope, payload = body, body.get("data")
+        else:
+            envelope, payload = {}, body
+
+        if response_model is not None and payload is not None:
+            if trusted:
+                payload = self._construct(response_model, payload)
+            else:
+                payload = self._validate(response_model, payload)
+
+        fields = {
+            "success": envelope.get("success", True),
+            "message": envelope.get("message", ""),
+            "data": payload,
+            "error": envelope.get("error"),
+        }
+        return ResponseModel.model_construct(**fields) if PYDANTIC_V2 else ResponseModel.construct(**fields)
+
+    @staticmethod
+    def _parse(raw: bytes) -> Any:
+        try:
+            return from_json(raw) if PYDANTIC_V2 else json.loads(raw)
+        except ValueError as e:
+            raise ResponseDecodeError(str(e)) from e
+
+    @staticmethod
+    def _unpack(raw: bytes) -> Any:
+        if not msgpack_available():
+            raise ResponseDecodeError("MessagePack response but msgpack is not installed")
+        try:
+            return unpack(raw)
+        except ValueError as e:
+            raise ResponseDecodeError(str(e)) from e
+
+    def _validate(self, response_model, payload):
+        if PYDANTIC_V2:
+            return self._adapter(response_model).validate_python(payload)
+        return parse_obj_as(response_model, payload)
+
+    def _construct(self, response_model, payload):
+        origin = get_origin(response_model)
+        if origin in COLLECTION_ORIGINS and isinstance(payload, list):
+            item_model = get_args(response_model)[0]
+            return [self._construct(item_model, item) for item in payload]
+        if origin is dict and isinstance(payload, dict):
+            value_model = get_args(response_model)[1]
+            return {key: self._construct(value_model, value) for key, value in payload.items()}
+        if origin is Union:
+            return payload
+        if isinstance(response_model, type) and issubclass(response_model, pydantic.BaseModel) and isinstance(payload, dict):
+            return response_model.model_construct(**payload) if PYDANTIC_V2 else response_model.construct(**payload)
+        return payload
+
+
+# Shared decoder, so adapters are built once per response type
+response_decoder = ResponseDecoder()
@@ -0,0 +1,124 @@
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import httpx
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its result"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        # A caller giving up must not cancel the call for everyone else
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled
+            future.exception()
+
+
+class CachedResponse:
+    __slots__ = ("endpoint", "response", "etag", "expires_at")
+
+    def __init__(self, endpoint: str, response: httpx.Response, etag: Optional[str], expires_at: float):
+        self.endpoint = endpoint
+        self.response = response
+        self.etag = etag
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    Small LRU cache of GET responses, keyed by URL, params and headers.
+
+    Entries live for the TTL the caller asked for, shortened by the
+    response's Cache-Control max-age. Responses marked no-store are never
+    kept; no-cache ones are kept only to be revalidated with their ETag.
+    Expired entries that have an ETag are revalidated with If-None-Match
+    rather than dropped, so an unchanged resource costs a 304.
+
+    Every invalidation bumps `generation`; a fetch that started before an
+    invalidation does not store its (possibly stale) response.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: Any = None, headers: Optional[Dict[str, str]] = None) -> Tuple:
+        # Headers matter: the same URL returns different data per Authorization
+        return (
+            url,
+            tuple(sorted(httpx.QueryParams(params or {}).multi_items())),
+            tuple(sorted((name.lower(), value) for name, value in (headers or {}).items()))
+        )
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: Hashable, endpoint: str, response: httpx.Response, ttl: float, generation: int):
+        """Cache a 200 response unless it forbids it or the cache was invalidated meanwhile"""
+        if generation != self.generation or response.status_code != 200:
+            return
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        etag = response.headers.get("ETag")
+        if "no-store" in cache_control:
+            return
+        max_age = _MAX_AGE.search(cache_control)
+        if max_age:
+            ttl = min(ttl, float(max_age.group(1)))
+        if "no-cache" in cache_control:
+            ttl = 0
+        if ttl <= 0 and not etag:
+            return
+        self._entries[key] = CachedResponse(endpoint, response, etag, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, entry: CachedResponse, response: httpx.Response, ttl: float):
+        """Extend an entry after a 304 revalidation"""
+        max_age = _MAX_AGE.search(response.headers.get("Cache-Control", "").lower())
+        if max_age:
+            ttl = min(ttl, float(max_age.group(1)))
+        entry.expires_at = time.monotonic() + ttl
+        self._entries[key] = entry
+
+    def invalidate(self, prefixes: Iterable[str]):
+        """Drop every entry whose endpoint starts with one of the prefixes"""
+        prefixes = tuple(prefix.lstrip("/") for prefix in prefixes)
+        if not prefixes:
+            return
+        self.generation += 1
+        for key in [key for key, entry in self._entries.items() if entry.endpoint.startswith(prefixes)]:
+            del self._entries[key]
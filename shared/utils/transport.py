@@ -0,0 +1,276 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+import re
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be sent twice without changing the result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses that mean the backend (or a proxy in front of it) is unavailable
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+# Per-route read timeouts in seconds, keyed "METHOD path-prefix" or just
+# "path-prefix" relative to the API root; "*" matches one path segment or
+# part of one, and the longest matching pattern wins
+DEFAULT_ROUTE_TIMEOUTS: Dict[str, float] = {
+    "POST auth/": 15.0,
+    "POST restaurant/menu/items/import": 120.0,
+    "POST restaurant/menu/items/bulk": 60.0,
+    "GET tabs/restaurant/*/export": 120.0,
+    "POST batch": 30.0,
+}
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+def _route_pattern(prefix: str) -> str:
+    return "".join("[^/]*" if part == "*" else re.escape(part) for part in re.split(r"(\*)", prefix))
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised without touching the network while the backend is marked down"""
+
+
+class TransportConfig:
+    """Pool, timeout, retry and circuit breaker settings for a Transport"""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        pool_timeout: float = 5.0,
+        route_timeouts: Optional[Dict[str, float]] = None,
+        max_retries: int = 2,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_timeout = pool_timeout
+        self.route_timeouts = dict(DEFAULT_ROUTE_TIMEOUTS if route_timeouts is None else route_timeouts)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        """Defaults overridden by BILLO_HTTP_* environment variables"""
+        return cls(
+            max_connections=int(os.getenv("BILLO_HTTP_MAX_CONNECTIONS", 20)),
+            max_keepalive_connections=int(os.getenv("BILLO_HTTP_MAX_KEEPALIVE", 10)),
+            keepalive_expiry=_env_float("BILLO_HTTP_KEEPALIVE_EXPIRY", 30.0),
+            http2=os.getenv("BILLO_HTTP2", "true").lower() == "true",
+            connect_timeout=_env_float("BILLO_HTTP_CONNECT_TIMEOUT", 5.0),
+            read_timeout=_env_float("BILLO_HTTP_READ_TIMEOUT", 10.0),
+            pool_timeout=_env_float("BILLO_HTTP_POOL_TIMEOUT", 5.0),
+            max_retries=int(os.getenv("BILLO_HTTP_MAX_RETRIES", 2)),
+            backoff_base=_env_float("BILLO_HTTP_BACKOFF_BASE", 0.25),
+            backoff_max=_env_float("BILLO_HTTP_BACKOFF_MAX", 4.0),
+            failure_threshold=int(os.getenv("BILLO_HTTP_BREAKER_THRESHOLD", 5)),
+            reset_timeout=_env_float("BILLO_HTTP_BREAKER_RESET", 30.0)
+        )
+
+    def timeout_for(self, method: str, path: str) -> httpx.Timeout:
+        """Timeout for a request, from the longest matching route prefix"""
+        path = path.lstrip("/")
+        read = self.read_timeout
+        best = -1
+        for route, seconds in self.route_timeouts.items():
+            route_method, _, prefix = route.rpartition(" ")
+            if route_method and route_method != method:
+                continue
+            prefix = prefix.lstrip("/")
+            if len(prefix) > best and re.match(_route_pattern(prefix), path):
+                read, best = seconds, len(prefix)
+        return httpx.Timeout(read, connect=self.connect_timeout, pool=self.pool_timeout)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number `attempt` (0-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the backend looks down.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are rejected immediately for `reset_timeout` seconds. Then a
+    single trial request is let through (half-open): success closes the
+    circuit, failure opens it again for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._trial_in_flight):
+            raise CircuitOpenError("Backend unavailable (circuit open)")
+        if state == self.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_in_flight or (self.opened_at is None and self.failures >= self.failure_threshold):
+            logger.warning(f"Circuit opened after {self.failures} consecutive failure(s)")
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def record_abandoned(self):
+        """A request ended without telling us anything about the backend (e.g. cancelled)"""
+        self._trial_in_flight = False
+
+
+class Transport:
+    """
+    Pooled HTTP client shared by every API client talking to one backend.
+
+    Adds per-route timeouts, retries with jittered backoff for idempotent
+    methods only, and a circuit breaker, so a backend outage turns into
+    fast failures instead of requests piling up on the connection pool.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig.from_env()
+        self.breaker = CircuitBreaker(self.config.failure_threshold, self.config.reset_timeout)
+        self.client = httpx.AsyncClient(
+            http2=self.config.http2 and _h2_available(),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(
+                self.config.read_timeout,
+                connect=self.config.connect_timeout,
+                pool=self.config.pool_timeout
+            )
+        )
+        self._users = 0
+
+    async def request(self, method: str, url: str, route: Optional[str] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request and return the response, whatever its status.
+
+        `route` is the path used to pick a timeout (defaults to the URL path).
+        Raises CircuitOpenError while the circuit is open, or the last
+        transport error once retries are used up.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.config.timeout_for(method, route if route is not None else urlsplit(url).path))
+        attempts = 1 + (self.config.max_retries if method in IDEMPOTENT_METHODS else 0)
+
+        attempt = 0
+        while True:
+            self.breaker.before_request()
+            attempt += 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if attempt >= attempts:
+                    raise
+                logger.info(f"{method} {url} failed ({e!r}), retrying")
+                await asyncio.sleep(self.config.backoff(attempt - 1))
+                continue
+            except BaseException:
+                # Cancelled, or failed before reaching the network: free the
+                # half-open trial slot, or the circuit would never close again
+                self.breaker.record_abandoned()
+                raise
+
+            if response.status_code not in RETRYABLE_STATUSES:
+                self.breaker.record_success()
+                return response
+            self.breaker.record_failure()
+            if attempt >= attempts:
+                return response
+            await response.aclose()
+            logger.info(f"{method} {url} returned {response.status_code}, retrying")
+            await asyncio.sleep(self._retry_delay(response, attempt - 1))
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self.config.backoff_max)
+        return self.config.backoff(attempt)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+# One transport per backend origin, shared by every client in the process
+_transports: Dict[Tuple[str, str], Transport] = {}
+
+def _origin(base_url: str) -> Tuple[str, str]:
+    parts = urlsplit(base_url)
+    return parts.scheme, parts.netloc
+
+def get_transport(base_url: str, config: Optional[TransportConfig] = None) -> Transport:
+    """Get the shared transport for a backend, creating it on first use"""
+    key = _origin(base_url)
+    transport = _transports.get(key)
+    if transport is None:
+        transport = _transports[key] = Transport(config)
+    transport._users += 1
+    return transport
+
+async def release_transport(base_url: str):
+    """Drop one client's claim on a transport, closing it when none are left"""
+    key = _origin(base_url)
+    transport = _transports.get(key)
+    if transport is None:
+        return
+    transport._users -= 1
+    if transport._users <= 0:
+        del _transports[key]
+        await transport.aclose()